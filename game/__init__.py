@@ -1 +1 @@
-__version__ = '0.8.5-beta'
\ No newline at end of file
+__version__ = '0.9.0-beta'
\ No newline at end of file
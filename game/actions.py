@@ -1,6 +1,6 @@
 from __future__ import annotations
-from pathlib import Path
 
+import random
 import sys
 from typing import TYPE_CHECKING, Optional
 
@@ -17,17 +17,21 @@ if TYPE_CHECKING:
 from .dungeon.dungeon import Dungeon, NormalDungeon
 from .dungeon.floor import FloorBuilder
 from .entities import Creature, Entity, Item, Weapon, Player, Furniture
+from .factions import is_hostile
 from .rng import RandomNumberGenerator
 from .modes import GameStatus, GameMode
-from .message_log import MessageType
+from .events import EventType
 from .tile import *
 from .save_handling import (
     Save,
     save_current_game,
     save_to_dir,
     delete_save_slot,
-    fetch_saves
+    delete_replay,
+    fetch_saves,
+    get_new_game
 )
+from .data.config import RECORD_REPLAYS
 
 
 class Action:
@@ -97,8 +101,8 @@ class HandleSpecialWeaponAction(Action):
         if self._weapon.get_component("projectable") is not None:
             if self._weapon.projectable.uses_left <= 0:
                 turnable = False
-                # TODO add out of charge message property to component.
-                engine.message_log.add("The staff fizzles with no charge left")
+                engine.events.emit(
+                    EventType.OUT_OF_CHARGE, self.entity, self._weapon)
                 return turnable
             if not isinstance(engine.gamestate, ProjectileTargetState):
                 engine.gamestate = ProjectileTargetState(
@@ -129,23 +133,22 @@ class PickUpItemAction(Action):
         
         # No item found underneath entity.
         if item_to_pick_up is None:
-            engine.message_log.add("Nothing to be picked up here", color="red")
+            engine.events.emit(EventType.NOTHING_TO_PICK_UP, self.entity)
             return turnable
 
         # Not enough space in carrier's inventory.
         if inventory.size >= inventory.max_slots:
             if self.entity == engine.player:
-                engine.message_log.add(
-                    "There is not enough space in your inventory", color="red")
+                engine.events.emit(
+                    EventType.INVENTORY_FULL, self.entity, item_to_pick_up)
             return turnable
         
         # Pick up the item.
-        floor.entities.remove(item)
+        floor.remove_entity(item)
         inventory.add_item(item)
         item.parent = self.entity
 
-        engine.message_log.add(
-            f"You picked up: {item.name.lower()}", color="blue")
+        engine.events.emit(EventType.PICKUP, self.entity, item)
 
         return turnable
         
@@ -167,8 +170,7 @@ class DropItemAction(ItemAction):
         inventory.remove_item(self.item)
         self.item.place(floor, self.entity.x, self.entity.y)
 
-        engine.message_log.add(
-            f"You dropped: {self.item.name.lower()}", color="blue")
+        engine.events.emit(EventType.DROP, self.entity, self.item)
         
         return turnable
 
@@ -179,7 +181,7 @@ class OnPlayerDeathAction(Action):
     def perform(self, engine: Engine) -> bool:
         turnable: bool = False
 
-        engine.message_log.add("You have been defeated!", color="red")
+        engine.events.emit(EventType.DEFEAT, self.entity)
         
         engine.save_meta["status"] = GameStatus.DEFEAT
         save_current_game(engine)
@@ -196,7 +198,7 @@ class OnPlayerWinAction(Action):
     def perform(self, engine: Engine) -> bool:
         turnable: bool = False
 
-        engine.message_log.add("You made it out of the dungeon!", color="gold")
+        engine.events.emit(EventType.VICTORY, self.entity)
 
         engine.save_meta["status"] = GameStatus.VICTORY
         save_current_game(engine)
@@ -252,6 +254,7 @@ class QuitGameAction(Action):
     """Exit program"""
 
     def perform(self, engine: Engine):
+        engine.shut_down_ai_workers()
         sys.exit(0)
 
 
@@ -267,18 +270,41 @@ class StartNewGameAction(FromSavedataAction):
     """Start the dungeon crawling on the selected gamemode"""
 
     def __init__(self,
-                 save: Save,
+                 gamemode: GameMode,
                  saves_dir: Path,
                  index: int,
                  player_name: str,
                  seed: str) -> bool:
-        super().__init__(save, saves_dir, index)
+        super().__init__(None, saves_dir, index)
+        self._gamemode = gamemode
         self._player_name = player_name.strip()
         self._seed = seed.strip()
 
     def perform(self, engine: Engine) -> bool:
+        # Prevent circular import.
+        from .replay import Replay
         turnable: bool = False
 
+        # Where the randomness starts from, so a replay can start there too.
+        random_state: tuple = random.getstate()
+
+        self.start_game(engine)
+        engine.replay = Replay(
+            gamemode=self._gamemode,
+            player_name=self._player_name,
+            seed=self._seed,
+            random_state=random_state
+        ) if RECORD_REPLAYS else None
+
+        save_to_dir(self.saves_dir, self.index, self.save)
+        save_current_game(engine)
+        
+        return turnable
+
+    def start_game(self, engine: Engine) -> None:
+        """Create the new game and load it into the engine, unsaved"""
+        self.save = get_new_game(self._gamemode, self.index)
+
         # Set player name.
         self.save.data["player"].name = self._player_name
         self.save.data["player"].og_name = self._player_name
@@ -291,15 +317,10 @@ class StartNewGameAction(FromSavedataAction):
             None if self._seed == "" else self._seed
         )
         
-        save_to_dir(self.saves_dir, self.index, self.save)
         self._load_data_to_engine(engine, self.save)
 
         engine.dungeon.start()
         engine.dungeon.spawn_player(engine.player)
-        
-        save_current_game(engine)
-        
-        return turnable
 
 
 class ContinueGameAction(FromSavedataAction):
@@ -309,6 +330,10 @@ class ContinueGameAction(FromSavedataAction):
         turnable: bool = False
         
         self._load_data_to_engine(engine, self.save)
+        # The game's randomness isn't saved, so it can't be replayed on from.
+        # Nor would what was recorded so far match the save from now on.
+        engine.replay = None
+        delete_replay(self.save)
 
         engine.message_log.add(
             f"Welcome back, {engine.player.name}!", color="blue")
@@ -330,9 +355,8 @@ class LevelUpAction(Action):
         leveler.level_up()
         leveler.increment_attribute(self.attribute)
 
-        engine.message_log.add(
-            message=f"Leveled up to {leveler.level}",
-            type=MessageType.INFO, color="green")
+        engine.events.emit(
+            EventType.LEVEL_UP, self.entity, amount=leveler.level)
 
         return turnable
 
@@ -350,7 +374,7 @@ class DoNothingAction(Action):
             return turnable
 
         if isinstance(engine.gamestate, ExploreState):
-            engine.message_log.add("You take no action")
+            engine.events.emit(EventType.WAIT, self.entity)
             engine.save_meta["turns"] += 1  # Record turn.
 
         return turnable
@@ -373,13 +397,13 @@ class DescendStairsAction(Action):
         
         # Ensure there exists a staircase to begin with.
         if floor.descending_staircase_location is None:
-            engine.message_log.add("Can't descend here", color="red")
+            engine.events.emit(EventType.CANT_DESCEND, self.entity)
             return turnable
         
         # Check if player is standing on the staircase tile.
         staircase_x, staircase_y = floor.descending_staircase_location 
         if not (player_x == staircase_x and player_y == staircase_y):
-            engine.message_log.add("Can't descend here", color="red")
+            engine.events.emit(EventType.CANT_DESCEND, self.entity)
             return turnable
         
         # Go down a level and generate new floor if needed.
@@ -394,11 +418,13 @@ class DescendStairsAction(Action):
             dungeon.current_floor.first_room
         )
         
-        engine.message_log.add(
-            "You descend a level...", color="blue")
+        engine.events.emit(EventType.DESCEND, self.entity)
         
         # DEBUG.
-        if isinstance(dungeon, NormalDungeon):
+        if (
+            isinstance(dungeon, NormalDungeon)
+            and engine.message_log is not None
+        ):
             engine.message_log.add(
                 f"[DEBUG] Glyph on this floor?: {dungeon.floor_has_glyph(dungeon.current_floor)}")
             engine.message_log.add(
@@ -433,13 +459,13 @@ class AscendStairsAction(Action):
         
         # Ensure there exists a staircase to begin with.
         if floor.ascending_staircase_location is None:
-            engine.message_log.add("Can't ascend here", color="red")
+            engine.events.emit(EventType.CANT_ASCEND, self.entity)
             return turnable
         
         # Check if player is standing on the staircase tile.
         staircase_x, staircase_y = floor.ascending_staircase_location 
         if not (player_x == staircase_x and player_y == staircase_y):
-            engine.message_log.add("Can't ascend here", color="red")
+            engine.events.emit(EventType.CANT_ASCEND, self.entity)
             return turnable
 
         # Check quest completion status.
@@ -450,7 +476,7 @@ class AscendStairsAction(Action):
                 return turnable
             # Quest not complete - block player.
             else:
-                engine.message_log.add("You must bring back the relic first!")
+                engine.events.emit(EventType.RELIC_MISSING, self.entity)
                 return turnable
         
         # Go up a level.
@@ -460,8 +486,7 @@ class AscendStairsAction(Action):
             dungeon.current_floor.last_room
         )
         
-        engine.message_log.add(
-            "You ascend a level...", color="blue")
+        engine.events.emit(EventType.ASCEND, self.entity)
         
         engine.save_meta["turns"] += 1  # Record turn.
         
@@ -487,8 +512,7 @@ class RevealTunnelAction(Action):
         FloorBuilder.dig_tunnel(floor, tunnel_set)
         floor.passage_revealed = True
 
-        engine.message_log.add(
-            "A hidden passageway has been revealed!", color="blue")
+        engine.events.emit(EventType.PASSAGE_REVEALED, self.entity)
         
         turnable = True
 
@@ -519,9 +543,6 @@ class BumpAction(ActionWithDirection):
         self._no_hit = no_hit
 
     def perform(self, engine: Engine) -> bool:
-        # Prevent circular import.
-        from .components.ai import AllyAI
-
         turnable: bool = False
         floor = engine.dungeon.current_floor
 
@@ -542,7 +563,9 @@ class BumpAction(ActionWithDirection):
             bumper_is_player: bool = self.entity == engine.player
             if (
                 bumper_is_player
-                and isinstance(blocking_entity.get_component("ai"), AllyAI)
+                and isinstance(blocking_entity, Creature)
+                and not is_hostile(
+                    self.entity.faction, blocking_entity.faction)
             ):
                 temp_x: int = self.entity.x
                 temp_y: int = self.entity.y
@@ -579,15 +602,14 @@ class BumpObstacleAction(ActionWithDirection):
             player_inventory: Inventory = engine.player.inventory
 
             if pedestal_inventory.size > 0:
-                engine.message_log.add("Pedestal already has glyph")
+                engine.events.emit(EventType.PEDESTAL_FULL, self.entity)
                 return turnable
 
             glyph: Optional[Item] = player_inventory.get_item_named(
                 "glyph")
             
             if glyph is None:
-                engine.message_log.add(
-                    "You do not have a glyph!")
+                engine.events.emit(EventType.NO_GLYPH, self.entity)
                 return turnable
             
             # Transfer item from player to pedestal.
@@ -595,11 +617,8 @@ class BumpObstacleAction(ActionWithDirection):
             pedestal_inventory.add_item(glyph)
             engine.dungeon.pedestals_activated += 1
 
-            engine.message_log.add(
-                f"You place the glyph on the pedestal"
-                f" ({engine.dungeon.pedestals_activated}/3)",
-                color="blue"
-            )
+            engine.events.emit(EventType.GLYPH_PLACED, self.entity, glyph,
+                               engine.dungeon.pedestals_activated)
 
             engine.save_meta["turns"] += 1  # Record turn.
 
@@ -629,13 +648,13 @@ class WalkAction(ActionWithDirection):
             (desired_x > floor.height - 1 or desired_x < 0)
             or (desired_y > floor.width - 1 or desired_y < 0)
         ):
-            engine.message_log.add("Out of bounds", color="red")
+            engine.events.emit(EventType.OUT_OF_BOUNDS, self.entity)
             return turnable
 
         # Get blocking tiles.
-        if not floor.tiles[desired_x][desired_y].walkable:
+        if not TILE_WALKABLE[floor.tiles[desired_x][desired_y]]:
             if self.entity == engine.player:
-                engine.message_log.add("That way is blocked", color="red")
+                engine.events.emit(EventType.PATH_BLOCKED, self.entity)
             return turnable
 
         # Get blocking entities.
@@ -671,42 +690,28 @@ class MeleeAction(ActionWithDirection):
         target: Creature = floor.blocking_entity_at(desired_x, desired_y)
         target_fighter: Fighter = target.fighter
         target_leveler: Leveler = target.leveler
-        
-        target_slain_message: str = f"{target.og_name} has perished!"
-        battle_message: str = ""
-        message_type: MessageType = MessageType.INFO
-        message_color: str = ""
+
+        # Fights between other creatures are cut short, see below.
+        involves_player: bool = engine.player in (initiator, target)
 
         if initiator == engine.player:  # Record player.
             engine.save_meta["turns"] += 1
 
+        # The clash of combat can be heard from afar.
+        floor.make_noise(desired_x, desired_y)
+
         # Chance to hit opponent fails.
         did_hit: bool = initiator_fighter.check_hit_success()
         if not did_hit:
-            if target == engine.player:
-                battle_message += f"{initiator.og_name} missed you"
-                message_color = "blue"
-                message_type = MessageType.ENEMY_ATTACK
-            elif initiator == engine.player:
-                battle_message += f"You missed {target.og_name}"
-                message_color = "red"
-                message_type = MessageType.PLAYER_ATTACK
-            else:
-                return turnable
-
-            engine.message_log.add(
-                message=battle_message, type=message_type, color=message_color)
-
+            engine.events.emit(EventType.MISS, initiator, target)
             return turnable
         
         # Modify damage given/received based on opponents' stats.
 
         # Do it again if succeeds double hit check.
         did_double_hit: bool = initiator_fighter.check_double_hit_success()
-        if did_double_hit and initiator == engine.player:
-            engine.message_log.add(
-                "Double hit!", color=(
-                    "green" if initiator == engine.player else "red"))
+        if did_double_hit:
+            engine.events.emit(EventType.DOUBLE_HIT, initiator, target)
         for i in range(2 if did_double_hit else 1):
             # Critical hit check.
             did_critical: bool = initiator_fighter.check_critical_hit_success()
@@ -718,39 +723,19 @@ class MeleeAction(ActionWithDirection):
             target_fighter.take_damage(damage_given)
             
             # Log hit success.
-            if target == engine.player:
-                battle_message = f"{initiator.og_name} hits you for " \
-                                 f"{damage_given} pts"
-                message_type = MessageType.ENEMY_ATTACK
-                message_color = "red"
-            elif initiator == engine.player:
-                battle_message = f"You hit {target.og_name} for " \
-                                 f"{damage_given} pts"
-                message_type = MessageType.PLAYER_ATTACK
-                message_color="blue"
-            else:
+            engine.events.emit(
+                EventType.CRITICAL if did_critical else EventType.ATTACK,
+                initiator, target, damage_given)
+            if not involves_player:
                 return turnable
-
-            battle_message += " !!!" if did_critical else ""
-            
-            engine.message_log.add(
-                message=battle_message, type=message_type, color=message_color)
         
         # TODO add check for player or enemy knockout.
 
         # Target opponent has been slain.
         if target_fighter.is_dead:
             experience_drop: int = target.leveler.experience_drop
-            floor.entities.remove(target)
-            floor.add_entity(target)
-            engine.message_log.add(target_slain_message)
-
-            if initiator == engine.player:
-                engine.save_meta["slayed"] += 1
-                engine.message_log.add(
-                    message=f"You slayed {target.og_name} " \
-                            f"and gained {experience_drop} EXP!",
-                    type=MessageType.INFO, color="green")
+            engine.events.emit(
+                EventType.DEATH, initiator, target, experience_drop)
 
             # Absorb experience.
             initiator_leveler.absorb(
@@ -34,10 +34,26 @@ class Color:
             "gold": 221,
             "pink": 14,
         }
+
+        # Attributes resolved ahead of rendering, keyed by the exact name
+        # asked for, so drawing a cell is a single lookup.
+        self._attributes: dict[str, int] = {
+            color: curses.color_pair(color_pair_id)
+            for color, color_pair_id in self.supported_colors.items()
+        }
     
 
     def get_color(self, color: str) -> curses.color_pair:
         """Return color if supported"""
+        attribute: Optional[int] = self._attributes.get(color)
+        if attribute is None:
+            attribute = self._resolve_color(color)
+            self._attributes[color] = attribute
+        return attribute
+
+
+    def _resolve_color(self, color: str) -> curses.color_pair:
+        """Get the attribute for a color name not looked up before"""
         color: str = color.strip().lower()
         color_pair_id: Optional[int] = self.supported_colors.get(color)
 
@@ -1,31 +1,54 @@
 from __future__ import annotations
 
 import math
-from typing import TYPE_CHECKING, Optional, Iterator
+from typing import TYPE_CHECKING, Optional, Iterable
 
 if TYPE_CHECKING:
     from ..engine import Engine
     from .leveler import Leveler
-    from ..dungeon.floor import Floor
+    from ..dungeon.floor import Floor, FloorSnapshot
     from ..dungeon.room import Room
 from .fighter import Fighter
 from ..entities import Entity, Creature
+from ..events import EventType
+from ..factions import Faction, is_hostile
 from .base_component import BaseComponent
 from ..actions import Action, BumpAction
-from ..pathfinding import bresenham_path_to, a_star_path_to
-from ..data.config import CHANCE_TO_SWITCH_ROOMS, CHANCE_TO_TAKE_STEP
+from ..pathfinding import a_star_path_to
+from ..tile import TILE_WALKABLE
+from ..data.config import (
+    CHANCE_TO_SWITCH_ROOMS, CHANCE_TO_TAKE_STEP, AI_DORMANT_DISTANCE,
+    NOISE_RADIUS, ALLY_SEEK_RADIUS
+)
 
 
 class BaseAI(Action, BaseComponent):
     """Basic AI that gets a path to a cell"""
     AGRO_RANGE: int = 8
 
+    # Path worked out ahead of this AI's turn by the engine, if any, with the
+    # snapshot it was found on and the area of it the search looked at.
+    _planned_path: Optional[
+        tuple[
+            tuple[int, int],
+            tuple[int, int],
+            list[tuple[int, int]],
+            FloorSnapshot,
+            tuple[int, int, int, int]
+        ]
+    ] = None
+
     def __init__(self, entity: Entity):
         super().__init__(entity)
         self.entity = entity
         self.agro = False
 
 
+    def spawn_clone(self, owner: Entity) -> BaseAI:
+        """Start another one of this kind of AI afresh for an entity"""
+        return type(self)(owner)
+
+
     def perform(self, engine: Engine) -> None:
         # Check for available level up.
         leveler: Leveler = self.entity.get_component("leveler")
@@ -40,8 +63,52 @@ class BaseAI(Action, BaseComponent):
             leveler.level_up()
 
 
+    def path_request(
+            self, engine: Engine) -> Optional[tuple[tuple[int, int], ...]]:
+        """
+        Start and end of the path this AI will want on its next turn, if any,
+        so the engine can work out many creatures' paths ahead of time
+        """
+        return None
+
+    def receive_path(
+            self,
+            start: tuple[int, int],
+            goal: tuple[int, int],
+            path: list[tuple[int, int]],
+            snapshot: FloorSnapshot,
+            area: tuple[int, int, int, int]) -> None:
+        """Hold onto a path worked out ahead of this AI's turn"""
+        self._planned_path = (start, goal, path, snapshot, area)
+
+    def forget_path(self) -> None:
+        """Let go of a path planned ahead of this turn, if it went unused"""
+        self._planned_path = None
+
+    def path_to(
+            self,
+            floor: Floor,
+            x1: int,
+            y1: int,
+            x2: int,
+            y2: int) -> list[tuple[int, int]]:
+        """
+        Get an A* path, reusing the path planned ahead of this turn unless
+        another creature has since come or gone from where it was searched,
+        so it's always the path that would have been found now
+        """
+        planned_path, self._planned_path = self._planned_path, None
+        if planned_path is not None:
+            start, goal, path, snapshot, area = planned_path
+            if (
+                start == (x1, y1) and goal == (x2, y2)
+                and snapshot.blocking_unchanged(floor, area)
+            ):
+                return path
+        return a_star_path_to(floor, x1, y1, x2, y2)
+
     def update_agro_status(
-            self, engine: Engine, paths: list[tuple[int, int]]) -> None:
+            self, engine: Engine, paths: Iterable[tuple[int, int]]) -> None:
         """
         Check each turn if enemy is in agro proximity to player and there is no
         boundary between them
@@ -51,15 +118,13 @@ class BaseAI(Action, BaseComponent):
             (player_x, player_y),
             (self.entity.x, self.entity.y)
         )
+        if distance_from_player > self.AGRO_RANGE:
+            self.agro = False
+            return
         
         # Checking for blocked tiles in enemy paths.
         tiles = engine.dungeon.current_floor.tiles
-        blocked: bool = any([not tiles[x][y].walkable for x,y in paths])
-
-        if distance_from_player <= self.AGRO_RANGE and not blocked:
-            self.agro = True
-        else:
-            self.agro = False
+        self.agro = not any(not TILE_WALKABLE[tiles[x][y]] for x, y in paths)
 
 
 ### ENEMY AI ###
@@ -82,12 +147,30 @@ class WanderingAI(BaseAI):
         """
         See if the entity senses where the player is given a straight line
         """
-        line_to_player: list[tuple[int, int]] = bresenham_path_to(
-            self.entity.x, self.entity.y, engine.player.x, engine.player.y)
-        self.update_agro_status(engine, line_to_player)
-        if self.agro:
+        self.agro = engine.in_player_sight(
+            self.entity.x, self.entity.y, self.AGRO_RANGE)
+        return self.agro
+    
+    def is_distant(self, engine: Engine) -> bool:
+        """
+        See if the entity is too far from the player to be worth simulating in
+        full, i.e. out of range and not sharing a room with them
+        """
+        return self.is_distant_cell(engine, self.entity.x, self.entity.y)
+    
+    def is_distant_cell(self, engine: Engine, x: int, y: int) -> bool:
+        """See if a cell is too far from the player for the entity to be
+        simulated in full if it stood there
+        """
+        player_x, player_y = engine.player.x, engine.player.y
+        if math.dist((player_x, player_y), (x, y)) <= AI_DORMANT_DISTANCE:
+            return False
+
+        player_room: Optional[Room] = \
+            engine.dungeon.current_floor.room_at(player_x, player_y)
+        if player_room is None:  # Player is out in a tunnel.
             return True
-        return False
+        return not player_room.contains_point((x, y))
 
 
 class WanderingToRoomAI(WanderingAI):
@@ -102,6 +185,10 @@ class WanderingToRoomAI(WanderingAI):
         super().perform(engine)
         floor: Floor = engine.dungeon.current_floor
 
+        if self.is_distant(engine):
+            self.entity.add_component("ai", DormantAI(self.entity))
+            return
+
         if self.player_in_sight(engine):
             self.entity.add_component("ai", HostileEnemyAI(self.entity))
             return
@@ -142,6 +229,10 @@ class WanderingAroundRoomAI(WanderingAI):
     def perform(self, engine: Engine) -> None:
         super().perform(engine)
 
+        if self.is_distant(engine):
+            self.entity.add_component("ai", DormantAI(self.entity))
+            return
+
         if self.player_in_sight(engine):
             self.entity.add_component("ai", HostileEnemyAI(self.entity))
             return
@@ -162,9 +253,67 @@ class WanderingAroundRoomAI(WanderingAI):
         BumpAction(self.owner, dx, dy, no_hit=True).perform(engine)
 
 
+class DormantAI(WanderingAI):
+    """AI for a creature far away from the player, simulated coarsely.
+
+    Skips line of sight and pathfinding entirely, only ever hopping from one
+    faraway room to another, until the player comes close or combat is heard
+    nearby.
+    """
+
+    def perform(self, engine: Engine) -> None:
+        super().perform(engine)
+
+        if not self.is_distant(engine) or self.hears_noise(engine):
+            self.entity.add_component("ai", WanderingAroundRoomAI(self.entity))
+            return
+
+        # Chance to have travelled over to a different room meanwhile.
+        if engine.rng.random() <= CHANCE_TO_SWITCH_ROOMS:
+            self._hop_to_distant_room(engine)
+
+    def hears_noise(self, engine: Engine) -> bool:
+        """Check if there was any combat within earshot this turn"""
+        for noise_location in engine.dungeon.current_floor.noise_locations:
+            if (
+                math.dist(noise_location, (self.entity.x, self.entity.y))
+                <= NOISE_RADIUS
+            ):
+                return True
+        return False
+
+    def _hop_to_distant_room(self, engine: Engine) -> None:
+        """Move straight into another room still out of the player's range"""
+        floor: Floor = engine.dungeon.current_floor
+        player_x, player_y = engine.player.x, engine.player.y
+
+        # Don't hop into the relic room before its passage is revealed.
+        rooms: list[Room] = [
+            room for room in floor.rooms
+            if math.dist((player_x, player_y), room.get_center_cell())
+            > AI_DORMANT_DISTANCE
+            and (room != floor.relic_room or floor.passage_revealed)
+        ]
+        if rooms == []:
+            return
+
+        room: Room = engine.rng.choice(rooms)
+        x, y = room.get_random_empty_cell()
+        # Big rooms can reach back into range, so stay put rather than wake.
+        if not self.is_distant_cell(engine, x, y):
+            return
+        self.entity.x, self.entity.y = x, y
+        engine.reindex_creature(self.entity)
+
+
 class HostileEnemyAI(BaseAI):
     """AI that chases and fights the player"""
 
+    def path_request(
+            self, engine: Engine) -> Optional[tuple[tuple[int, int], ...]]:
+        return (
+            (self.entity.x, self.entity.y), (engine.player.x, engine.player.y))
+
     def perform(self, engine: Engine) -> None:
         super().perform(engine)
 
@@ -172,7 +321,7 @@ class HostileEnemyAI(BaseAI):
         player_x = engine.player.x
         player_y = engine.player.y
 
-        paths: list[tuple[int, int]] = a_star_path_to(
+        paths: list[tuple[int, int]] = self.path_to(
             floor, self.entity.x, self.entity.y, player_x, player_y)
 
         self.update_agro_status(engine, paths)
@@ -213,6 +362,11 @@ class EffectPerTurnAI(BaseAI):
         self._previous_ai = previous_ai
         self._turns_remaining = turns_remaining
 
+    def spawn_clone(self, owner: Entity) -> EffectPerTurnAI:
+        """Carry on the effect for another entity, just as long"""
+        return type(self)(
+            owner, self._previous_ai.spawn_clone(owner), self._turns_remaining)
+
 
 class AllyAI(EffectPerTurnAI, WanderingAI):
     """AI that is friendly to the player.
@@ -225,57 +379,69 @@ class AllyAI(EffectPerTurnAI, WanderingAI):
         entity: Entity, 
         previous_ai: BaseAI, 
         turns_remaining: int, 
-        previous_color: str
+        previous_color: str,
+        previous_faction: Optional[Faction] = None
     ):
         super().__init__(entity, previous_ai, turns_remaining)
         self.previous_color = previous_color
+        self.previous_faction = previous_faction or entity.faction
         self.enemy_target: Optional[Creature] = None
 
         # Change color to signify friendliness.
         entity.color = "pink"
+        entity.faction = Faction.PLAYER
+    
+    def spawn_clone(self, owner: Entity) -> AllyAI:
+        return type(self)(
+            owner,
+            self._previous_ai.spawn_clone(owner),
+            self._turns_remaining,
+            self.previous_color,
+            self.previous_faction
+        )
     
     def _is_valid_enemy(self, creature: Creature) -> bool:
         """Determine if the entity is a valid creature for attack.
         
-        We want our ally to attack other creatures that's alive, hostile
-        towards the player, and is not itself.
+        We want our ally to attack other creatures that's alive and hostile
+        towards the player's side.
         """
-        if creature == self.entity:
-            return False
         if not creature.get_component("ai"):  # Exclude player, dead enemies.
             return False
-        if isinstance(creature.ai, AllyAI):  # Don't attack other allies.
-            return False
-        if (
-            isinstance(creature.ai, (HostileEnemyAI, EffectPerTurnAI))
-            and not isinstance(creature.ai, AllyAI)
-        ):
-            return True
-        return False
+        return is_hostile(self.entity.faction, creature.faction)
     
-    def _get_next_enemy(self, creatures: list[Creature]) -> Optional[Creature]:
-        """If previous target has died, get the next one if any left"""
-        enemies: Iterator[Creature] = filter(self._is_valid_enemy, creatures)
-        return next(enemies, None)
+    def _get_next_enemy(self, engine: Engine) -> Optional[Creature]:
+        """Get the closest enemy within reach, if any"""
+        return engine.creature_index.nearest(
+            self.entity.x,
+            self.entity.y,
+            ALLY_SEEK_RADIUS,
+            self._is_valid_enemy
+        )
 
 
 class AllyFollowingAI(AllyAI):
     """AI that follows around the player and tries not to get in its way"""
 
+    def path_request(
+            self, engine: Engine) -> Optional[tuple[tuple[int, int], ...]]:
+        return (
+            (self.entity.x, self.entity.y), (engine.player.x, engine.player.y))
+
     def perform(self, engine: Engine) -> None:
         super().perform(engine)
 
         # Rizzed effect has worn off.
         if self._turns_remaining <= 0:
-            engine.message_log.add(
-                f"{self.entity.name} is no longer under your rizz!")
+            engine.events.emit(EventType.RIZZ_ENDED, self.entity)
             self.entity.add_component("ai", self._previous_ai)
             self.entity.color = self.previous_color
+            self.entity.faction = self.previous_faction
             return
 
         # Check if enemy nearby.
         floor: Floor = engine.dungeon.current_floor
-        next_enemy: Optional[Creature] = self._get_next_enemy(floor.creatures)
+        next_enemy: Optional[Creature] = self._get_next_enemy(engine)
         if next_enemy is not None:
             self.entity.add_component(
                 "ai",
@@ -283,7 +449,8 @@ class AllyFollowingAI(AllyAI):
                     self.entity,
                     self._previous_ai,
                     self._turns_remaining,
-                    self.previous_color
+                    self.previous_color,
+                    self.previous_faction
                 )
             )
             self.entity.ai.enemy_target = next_enemy
@@ -301,13 +468,12 @@ class AllyFollowingAI(AllyAI):
             return
         
         # Move closer to player.
-        paths: list[tuple[int, int]] = a_star_path_to(
+        paths: list[tuple[int, int]] = self.path_to(
             floor,
             self.entity.x,
             self.entity.y,
             engine.player.x,
-            engine.player.y,
-            target_enemy=False
+            engine.player.y
         )[:-1]  # Don't bump/hit the player.
 
         if paths != []:
@@ -335,15 +501,15 @@ class AllyDefendingAI(AllyAI):
 
         # Rizzed effect has worn off.
         if self._turns_remaining <= 0:
-            engine.message_log.add(
-                f"{self.entity.name} is no longer under your rizz!")
+            engine.events.emit(EventType.RIZZ_ENDED, self.entity)
             self.entity.add_component("ai", self._previous_ai)
             self.entity.color = self.previous_color
+            self.entity.faction = self.previous_faction
             return
 
         # No enemies nearby.
         floor: Floor = engine.dungeon.current_floor
-        next_enemy: Optional[Creature] = self._get_next_enemy(floor.creatures)
+        next_enemy: Optional[Creature] = self._get_next_enemy(engine)
         if next_enemy is None:
             self.entity.add_component(
                 "ai",
@@ -351,16 +517,23 @@ class AllyDefendingAI(AllyAI):
                     self.entity,
                     self._previous_ai,
                     self._turns_remaining,
-                    self.previous_color
+                    self.previous_color,
+                    self.previous_faction
                 )
             )
             # Revert.
             self.entity.ai.enemy_target = None
             return
         
-        # Allow for target change if original target died.
-        if self.enemy_target.fighter.is_dead:
-            self.enemy_target = self._get_next_enemy(floor.entities)
+        # Allow for target change if original target died or got away.
+        if (
+            self.enemy_target.fighter.is_dead
+            or math.dist(
+                (self.enemy_target.x, self.enemy_target.y),
+                (self.entity.x, self.entity.y)
+            ) > ALLY_SEEK_RADIUS
+        ):
+            self.enemy_target = next_enemy
         
         # Attack the nearby enemy.
         paths: list[tuple[int, int]] = a_star_path_to(
@@ -393,7 +566,7 @@ class ConfusedAI(WanderingAI, EffectPerTurnAI):
 
         # Confusion effect has worn off.
         if self._turns_remaining <= 0:
-            engine.message_log.add(f"{self.entity.name} is no longer confused")
+            engine.events.emit(EventType.CONFUSION_ENDED, self.entity)
             self.entity.add_component("ai", self._previous_ai)
             return
         
@@ -412,7 +585,7 @@ class FrozenAI(EffectPerTurnAI):
 
         # Frozen effect has worn off.
         if self._turns_remaining <= 0:
-            engine.message_log.add(f"{self.entity.name} is no longer frozen")
+            engine.events.emit(EventType.FREEZE_ENDED, self.entity)
             self.entity.add_component("ai", self._previous_ai)
             return
         
@@ -1,12 +1,43 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
     from ..entities import Entity
 
+T = TypeVar("T")
+
+_UNSET = object()
+
+
+@functools.cache
+def get_slot_names(cls: type) -> tuple[str, ...]:
+    """Get every slot an instance of a class has, its bases' included"""
+    return tuple(
+        name
+        for base in reversed(cls.__mro__)
+        for name in base.__dict__.get("__slots__", ())
+        if name not in ("__dict__", "__weakref__")
+    )
+
+
+def copy_slots(obj: T) -> T:
+    """Make a shallow copy of a slotted object, leaving unset slots unset"""
+    clone = object.__new__(type(obj))
+    for name in get_slot_names(type(obj)):
+        value = getattr(obj, name, _UNSET)
+        if value is not _UNSET:
+            setattr(clone, name, value)
+    return clone
+
  
 class BaseComponent:
     """A basic component, lives in an entity's component pack"""
+    __slots__ = ("owner",)
     owner: Entity
 
+    def spawn_clone(self, owner: Entity) -> BaseComponent:
+        """Make a copy of this for another entity to be given"""
+        return copy_slots(self)
+
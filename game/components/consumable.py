@@ -6,6 +6,7 @@ if TYPE_CHECKING:
     from ..entities import Creature
     from ..gamestates import State
     from ..engine import Engine
+from ..events import EventType
 from ..item_types import PotionType
 from ..actions import Action, ItemAction
 from .base_component import BaseComponent
@@ -13,6 +14,7 @@ from .base_component import BaseComponent
 
 class Consumable(BaseComponent):
     """An item that can be consumed by a creature"""
+    __slots__ = ()
     
     def get_action_or_state(self, consumer: Creature) -> Union[Action, State]:
         """Get an action or state to be performed on consuming this item"""
@@ -32,6 +34,7 @@ class Consumable(BaseComponent):
 # TODO disallow entity from drinking if health/magicka is already full.
 class RestoreConsumable(Consumable):
     """Restore health or magicka on consumption"""
+    __slots__ = ("_potion_type", "_yield_amount")
 
     def __init__(self, yield_amount: int):
         self._potion_type: PotionType = None
@@ -47,26 +50,23 @@ class RestoreConsumable(Consumable):
     
     def perform(self, engine: Engine) -> None:
         consumer: Creature = self.owner.parent
-        point_regain_type: str = ""
 
         # Drink up if health/magicka bar isn't already full.
         if self.potion_type == PotionType.HEALTH:
             if consumer.fighter.health >= consumer.fighter.max_health:
-                engine.message_log.add("Health already full!")
+                engine.events.emit(
+                    EventType.ALREADY_FULL, consumer, self.owner)
                 return
-            point_regain_type = "hp"
             consumer.fighter.heal(self._yield_amount)
         elif self._potion_type == PotionType.MAGICKA:
             if consumer.fighter.magicka >= consumer.fighter.max_magicka:
-                engine.message_log.add("Magicka already full!")
+                engine.events.emit(
+                    EventType.ALREADY_FULL, consumer, self.owner)
                 return
-            point_regain_type = "mp"
             consumer.fighter.recharge(self._yield_amount)
         
-        engine.message_log.add(
-            f"{consumer.name} drinks {self.owner.name} for "
-            f"{self._yield_amount} {point_regain_type}!"
-        )
+        engine.events.emit(
+            EventType.DRINK, consumer, self.owner, self._yield_amount)
         
         return super().perform(engine)
 
@@ -8,11 +8,13 @@ if TYPE_CHECKING:
     from ..gamestates import State
     from ..engine import Engine
 from ..actions import Action, ItemAction
+from ..events import EventType
 from .base_component import BaseComponent
 
 
 class Equippable(BaseComponent):
     """An item that can be equipped in a creature's inventory"""
+    __slots__ = ()
 
     def get_action_or_state(self, wielder: Creature) -> Union[Action, State]:
         """Get an action or state to be performed on equipping this item"""
@@ -29,14 +31,15 @@ class Equippable(BaseComponent):
         # Toggle equipping.
         if inventory.is_equipped(self.owner):
             inventory.unequip(self.owner)
-            engine.message_log.add(f"{self.owner.name} has been unequipped")
+            engine.events.emit(EventType.UNEQUIP, equipper, self.owner)
         else:
             inventory.equip(self.owner)
-            engine.message_log.add(f"{self.owner.name} has been equipped")
+            engine.events.emit(EventType.EQUIP, equipper, self.owner)
 
 
 class Wieldable(Equippable):
     """An item that can be held by a creature"""
+    __slots__ = ("_damage_bonus",)
 
     def __init__(self, damage_bonus: int):
         self._damage_bonus = damage_bonus
@@ -48,6 +51,7 @@ class Wieldable(Equippable):
 
 class Wearable(Equippable):
     """An item that can be worn by a creature"""
+    __slots__ = ("_damage_reduction", "_coverage")
 
     def __init__(self, damage_reduction: int, coverage: int):
         self._damage_reduction = damage_reduction
@@ -30,11 +30,13 @@ SAGE:
 from __future__ import annotations
 
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
 if TYPE_CHECKING:
-    from ..entities import Creature
+    from ..entities import Entity, Creature
+    from .inventory import Inventory
     from ..rng import RandomNumberGenerator
+    from ..dungeon.creature_table import CreatureTable
 from .base_component import BaseComponent
 from ..render_order import RenderOrder
 
@@ -57,13 +59,13 @@ class StatModifier:
         
         `attribute` is either vitality or sage.
         """
-        extra_points = 0
-        for current_point in range(0, attribute - 1):
-            if current_point % 3 == 0:
-                extra_points += StatModifier.JUICE_PER_3_POINTS
-            else:
-                extra_points += StatModifier.JUICE_PER_POINT
-        return extra_points
+        points = max(0, attribute - 1)  # Offset, level 1 is base (+0)
+        # Every third point, starting with the first, is worth more.
+        return (
+            points * StatModifier.JUICE_PER_POINT
+            + (points + 2) // 3 * (
+                StatModifier.JUICE_PER_3_POINTS - StatModifier.JUICE_PER_POINT)
+        )
     
     @staticmethod
     def add_damage(power: int) -> int:
@@ -98,6 +100,19 @@ class StatModifier:
 
 class Fighter(BaseComponent):
     """Attaches to an entity that is able to do combat e.g. player, enemies"""
+    __slots__ = (
+        "rng", "_max_health", "_max_magicka", "_health", "_magicka",
+        "_damage", "_power", "_agility", "_vitality", "_sage", "_table",
+        "_row", "_stats"
+    )
+
+    # TODO add to data file?
+    # Combat chances.
+    _HIT_CHANCE: float = 0.75
+    _KNOCKOUT_CHANCE: float = 0.02
+    _CRITICAL_CHANCE: float = 0.02
+    _CRITICAL_DAMAGE_BONUS: float = 0.50
+    _DOUBLE_HIT_CHANCE: float = 0.01
 
     class AttributeType(Enum):
         """The set of attributes a fighter entity can have"""
@@ -106,6 +121,19 @@ class Fighter(BaseComponent):
         VITALITY = auto()
         SAGE = auto()
 
+    class Stats(NamedTuple):
+        """Stats that follow from a fighter's attributes, worked out only
+        when those change
+        """
+        max_health: int
+        max_magicka: int
+        damage: int
+        hit_chance: float
+        critical_hit_chance: float
+        critical_hit_damage_bonus: float
+        knockout_chance: float
+        double_hit_chance: float
+
     def __init__(self,
                  rng: RandomNumberGenerator,
                  base_health: int,
@@ -127,18 +155,51 @@ class Fighter(BaseComponent):
         self._agility = base_agility
         self._vitality = base_vitality
         self._sage = base_sage
-        
-        # TODO add to data file?
-        # Combat chances.
-        self._HIT_CHANCE: float = 0.75
-        self._KNOCKOUT_CHANCE: float = 0.02
-        self._CRITICAL_CHANCE: float = 0.02
-        self._CRITICAL_DAMAGE_BONUS: float = 0.50
-        self._DOUBLE_HIT_CHANCE: float = 0.01
+        self._stats: Fighter.Stats = self._get_stats()
+
+        # Row of its owner's floor's creature table holding its health and
+        # magicka, if any.
+        self._table: Optional[CreatureTable] = None
+        self._row: Optional[int] = None
 
         # After modifiers.
         self.complete_heal()
         self.complete_recharge()
+    
+    def _get_stats(self) -> Fighter.Stats:
+        """Work out stats from the current attributes"""
+        return Fighter.Stats(
+            max_health=self._max_health + \
+                StatModifier.add_max_points(self._vitality),
+            max_magicka=self._max_magicka + \
+                StatModifier.add_max_points(self._sage),
+            damage=self._damage + StatModifier.add_damage(self._power),
+            hit_chance=self._HIT_CHANCE + \
+                StatModifier.add_hit_chance(self._agility),
+            critical_hit_chance=self._CRITICAL_CHANCE + \
+                StatModifier.add_critical_hit_chance(self._agility),
+            critical_hit_damage_bonus=self._CRITICAL_DAMAGE_BONUS + \
+                StatModifier.add_critical_hit_damage_bonus(self._power),
+            knockout_chance=self._KNOCKOUT_CHANCE + \
+                StatModifier.add_knockout_chance(self._power),
+            double_hit_chance=self._DOUBLE_HIT_CHANCE + \
+                StatModifier.add_double_hit_chance(self._agility)
+        )
+    
+    def spawn_clone(self, owner: Entity) -> Fighter:
+        # Numbers may be in a creature table, which the copy isn't part of.
+        clone: Fighter = super().spawn_clone(owner)
+        clone._health, clone._magicka = self.health, self.magicka
+        clone._table = clone._row = None
+        return clone
+    
+    def get_state(self) -> tuple[int, ...]:
+        """Sum up its stats, for checksums"""
+        return (
+            self.health, self.magicka,
+            self.max_health, self.max_magicka,
+            self._power, self._agility, self._vitality, self._sage
+        )
 
     
     # HEALTH #
@@ -150,12 +211,13 @@ class Fighter(BaseComponent):
     @property
     def max_health(self) -> int:
         """Max health based on vitality level"""
-        return self._max_health + \
-            StatModifier.add_max_points(self.vitality)
+        return self._stats.max_health
     
     @property
     def health(self) -> int:
-        return self._health
+        if self._table is None:
+            return self._health
+        return self._table.health[self._row]
     
     def heal(self, amount: int) -> None:
         """Recover HP by some amount. Will call health setter."""
@@ -168,7 +230,11 @@ class Fighter(BaseComponent):
     @health.setter
     def health(self, new_health: int) -> None:
         # New HP cannot be lower than 0 or higher than max HP.
-        self._health = max(0, min(self.max_health, new_health))
+        new_health = max(0, min(self.max_health, new_health))
+        if self._table is None:
+            self._health = new_health
+        else:
+            self._table.health[self._row] = new_health
         if self.is_dead:
             self.die()
     
@@ -182,11 +248,13 @@ class Fighter(BaseComponent):
     @property
     def max_magicka(self) -> int:
         """Max magicka based on sage level"""
-        return self._max_magicka + StatModifier.add_max_points(self.sage)
+        return self._stats.max_magicka
     
     @property
     def magicka(self) -> int:
-        return self._magicka
+        if self._table is None:
+            return self._magicka
+        return self._table.magicka[self._row]
     
     @property
     def expend(self, amount: int) -> None:
@@ -204,7 +272,11 @@ class Fighter(BaseComponent):
     @magicka.setter
     def magicka(self, new_magicka: int) -> None:
         # New MP cannot be lower than 0 or higher than max MP.
-        self._magicka = max(0, min(self.max_magicka, new_magicka))
+        new_magicka = max(0, min(self.max_magicka, new_magicka))
+        if self._table is None:
+            self._magicka = new_magicka
+        else:
+            self._table.magicka[self._row] = new_magicka
     
 
     # ATTRIBUTES #
@@ -217,6 +289,7 @@ class Fighter(BaseComponent):
     @power.setter
     def power(self, new_power: int) -> None:
         self._power = max(1, new_power)
+        self._stats = self._get_stats()
     
     # AGILITY.
     @property
@@ -226,6 +299,7 @@ class Fighter(BaseComponent):
     @agility.setter
     def agility(self, new_agility: int) -> None:
         self._agility = max(1, new_agility)
+        self._stats = self._get_stats()
     
     # VITALITY.
     @property
@@ -235,6 +309,7 @@ class Fighter(BaseComponent):
     @vitality.setter
     def vitality(self, new_vitality: int) -> None:
         self._vitality = max(1, new_vitality)
+        self._stats = self._get_stats()
 
     # SAGE.
     @property
@@ -244,6 +319,7 @@ class Fighter(BaseComponent):
     @sage.setter
     def sage(self, new_sage: int) -> None:
         self._sage = max(1, new_sage)
+        self._stats = self._get_stats()
 
 
     # COMBAT #
@@ -251,14 +327,10 @@ class Fighter(BaseComponent):
     @property
     def damage(self) -> int:
         """Get modified damage from power level with weapon considered"""
-        damage_bonus = 0
-        if self.owner.get_component("inventory") is not None:
-            damage_bonus += self.owner.inventory.damage_bonus
-        return (
-            self._damage
-            + StatModifier.add_damage(self.power)
-            + damage_bonus
-        )
+        inventory: Optional[Inventory] = self.owner.get_component("inventory")
+        if inventory is None:
+            return self._stats.damage
+        return self._stats.damage + inventory.damage_bonus
     
     @property
     def critical_damage(self) -> int:
@@ -295,8 +367,7 @@ class Fighter(BaseComponent):
     # MELEE HIT CHANCE.
     @property
     def hit_chance(self) -> float:
-        return self._HIT_CHANCE + \
-            StatModifier.add_hit_chance(self.agility)
+        return self._stats.hit_chance
 
     def check_hit_success(self) -> bool:
         """Attempt to hit opponent succeeds or not"""
@@ -305,13 +376,11 @@ class Fighter(BaseComponent):
     # CRITICAL HIT CHANCE.
     @property
     def critical_hit_chance(self) -> float:
-        return self._CRITICAL_CHANCE + \
-            StatModifier.add_critical_hit_chance(self.agility)
+        return self._stats.critical_hit_chance
     
     @property
     def critical_hit_damage_bonus(self) -> float:
-        return self._CRITICAL_DAMAGE_BONUS + \
-            StatModifier.add_critical_hit_damage_bonus(self.power)
+        return self._stats.critical_hit_damage_bonus
     
     def check_critical_hit_success(self) -> bool:
         """A hit that turns out to be a critical hit"""
@@ -320,8 +389,7 @@ class Fighter(BaseComponent):
     # KNOCKOUT CHANCE.
     @property
     def knockout_chance(self) -> float:
-        return self._KNOCKOUT_CHANCE + \
-            StatModifier.add_knockout_chance(self.power)
+        return self._stats.knockout_chance
     
     def check_knockout_success(self) -> bool:
         """A hit that knocks out the target creature"""
@@ -330,8 +398,7 @@ class Fighter(BaseComponent):
     # DOUBLE HIT CHANCE.
     @property
     def double_hit_chance(self) -> float:
-        return self._DOUBLE_HIT_CHANCE + \
-            StatModifier.add_double_hit_chance(self.agility)
+        return self._stats.double_hit_chance
     
     def check_double_hit_success(self) -> bool:
         """A hit attempt that strikes the target creature twice"""
@@ -1,6 +1,6 @@
 from typing import Optional, Union
 
-from ..entities import Item, Weapon, Armor
+from ..entities import Entity, Item, Weapon, Armor
 from ..item_types import ArmorType
 from .base_component import BaseComponent
 
@@ -9,6 +9,11 @@ class Inventory(BaseComponent):
     """
     Inventory space and management for weapons, armor, potions, and other items
     """
+    __slots__ = (
+        "max_slots", "items", "equipped_weapon", "equipped_head_armor",
+        "equipped_torso_armor", "equipped_leg_armor", "_damage_bonus",
+        "_damage_reduction"
+    )
     
     def __init__(self, num_slots: int):
         self.max_slots = num_slots
@@ -18,6 +23,10 @@ class Inventory(BaseComponent):
         self.equipped_head_armor: Optional[Armor] = None
         self.equipped_torso_armor: Optional[Armor] = None
         self.equipped_leg_armor: Optional[Armor] = None
+
+        # Bonuses from what's equipped, worked out only when that changes.
+        self._damage_bonus: int = 0
+        self._damage_reduction: float = 0.00
     
     def __str__(self):
         return "Inventory: [" + ", ".join(self.items) + "]"
@@ -45,13 +54,19 @@ class Inventory(BaseComponent):
     
     @property
     def damage_bonus(self) -> int:
-        damage_bonus = 0
-        if self.weapon and self.weapon.get_component("equippable"):
-            damage_bonus += self.weapon.equippable.damage_bonus
-        return damage_bonus
+        return self._damage_bonus
     
     @property
     def damage_reduction(self) -> float:
+        return self._damage_reduction
+    
+    def _update_equipment_bonuses(self) -> None:
+        """Total up the bonuses of whatever is equipped"""
+        damage_bonus = 0
+        if self.weapon and self.weapon.get_component("equippable"):
+            damage_bonus += self.weapon.equippable.damage_bonus
+        self._damage_bonus = damage_bonus
+
         damage_reduction = 0.00
 
         if self.head_armor and self.head_armor.get_component("equippable"):
@@ -63,8 +78,7 @@ class Inventory(BaseComponent):
         if self.leg_armor and self.leg_armor.get_component("equippable"):
             damage_reduction += \
                 self.leg_armor.equippable.damage_reduction
-        
-        return damage_reduction
+        self._damage_reduction = damage_reduction
     
     @property
     def has_quest_item(self) -> bool:
@@ -74,6 +88,37 @@ class Inventory(BaseComponent):
                 return True
         return False
     
+    def spawn_clone(self, owner: Entity) -> "Inventory":
+        # Carry copies of the same items, not the very same ones.
+        clone: Inventory = super().spawn_clone(owner)
+        item_clones: dict[Item, Item] = {}
+        for item in self.items:
+            item_clones[item] = item.spawn_clone()
+            item_clones[item].parent = owner
+        clone.items = list(item_clones.values())
+        clone.equipped_weapon = item_clones.get(self.equipped_weapon)
+        clone.equipped_head_armor = item_clones.get(self.equipped_head_armor)
+        clone.equipped_torso_armor = item_clones.get(
+            self.equipped_torso_armor)
+        clone.equipped_leg_armor = item_clones.get(self.equipped_leg_armor)
+        clone._update_equipment_bonuses()
+        return clone
+    
+    def get_state(self) -> tuple:
+        """Sum up what's carried and what's worn, for checksums"""
+        return (
+            tuple(item.name for item in self.items),
+            tuple(
+                item.name if item is not None else None
+                for item in (
+                    self.weapon,
+                    self.head_armor,
+                    self.torso_armor,
+                    self.leg_armor
+                )
+            )
+        )
+    
 
     # ITEM MANAGEMENT #
     
@@ -159,10 +204,12 @@ class Inventory(BaseComponent):
     def equip_weapon(self, weapon: Weapon) -> None:
         """Equip a weapon if one is not already equipped"""
         self.equipped_weapon = weapon
+        self._update_equipment_bonuses()
     
     def unequip_weapon(self, weapon: Weapon) -> None:
         if self.equipped_weapon == weapon:
             self.equipped_weapon = None
+        self._update_equipment_bonuses()
 
 
     # ARMOR MANAGEMENT #
@@ -175,6 +222,7 @@ class Inventory(BaseComponent):
             self.equipped_torso_armor = armor
         elif armor.armor_type == ArmorType.LEGS:
             self.equipped_leg_armor = armor
+        self._update_equipment_bonuses()
     
     def unequip_armor(self, armor: Armor) -> None:
         if self.equipped_head_armor == armor:
@@ -183,4 +231,5 @@ class Inventory(BaseComponent):
             self.equipped_torso_armor = None
         elif self.equipped_leg_armor == armor:
             self.equipped_leg_armor = None
+        self._update_equipment_bonuses()
 
@@ -22,6 +22,10 @@ class Leveler(BaseComponent):
     Should be initialized after `Fighter` due to its dependence on attribute
     modification.
     """
+    __slots__ = (
+        "rng", "_start_level", "_current_level", "_base_drop_amount",
+        "_total_experience", "_current_experience"
+    )
 
     def __init__(self, rng: RandomNumberGenerator, start_level: int = 1, base_drop_amount: int = 5):
         self.rng = rng
@@ -75,6 +79,14 @@ class Leveler(BaseComponent):
             incoming_experience = 0
         self._current_experience += round(incoming_experience)
         self._total_experience += round(incoming_experience)
+    
+    def get_state(self) -> tuple[int, int, int]:
+        """Sum up its progress, for checksums"""
+        return (
+            self._current_level,
+            self._current_experience,
+            self._total_experience
+        )
 
 
     # ATTRIBUTE LEVELING #
@@ -7,6 +7,7 @@ if TYPE_CHECKING:
     from ..gamestates import State
     from ..dungeon.floor import Floor
 from ..entities import Entity, Item, Creature, Player
+from ..events import EventType
 from ..actions import Action, ItemAction
 from ..render_order import RenderOrder
 from .base_component import BaseComponent
@@ -17,6 +18,11 @@ from .ai import AllyFollowingAI, AllyDefendingAI, ConfusedAI, FrozenAI
 # for enemy or player wielding it.
 class Projectable(BaseComponent):
     """An item that is able to project something at a target cell"""
+    __slots__ = ("_uses_left", "_magicka_cost")
+
+    # What to say when cast at nothing, an item, a corpse, yourself, or a
+    # creature it won't work on.
+    FAILURE_MESSAGES: tuple[str, str, str, str, str] = ("", "", "", "", "")
 
     def __init__(self, uses: int, magicka_cost: int):
         self._uses_left = uses
@@ -35,15 +41,30 @@ class Projectable(BaseComponent):
                              x: int, y: int) -> Optional[Entity]:
         """Get the entity at target position if there is one"""
         # Off by one index due to game data vs curses window representation.
-        # Reversed to sort for creatures first.
-        for entity in reversed(floor.entities):
-            if entity.x == x - 1 and entity.y == y - 1:
-                return entity
-        return None
+        # Last in render order to pick creatures first.
+        entities: list[Entity] = floor.entities_at(x - 1, y - 1)
+        return entities[-1] if entities else None
 
     def expend_use(self) -> None:
         self._uses_left -= 1
 
+    def describe_failure(self, target: Optional[Entity]) -> str:
+        """Say why the item can't be projected at a target"""
+        if target is None:
+            return self.FAILURE_MESSAGES[0]
+        if isinstance(target, Item):
+            return self.FAILURE_MESSAGES[1]
+        if target.render_order == RenderOrder.CORPSE:
+            return self.FAILURE_MESSAGES[2]
+        if isinstance(target, Player):
+            return self.FAILURE_MESSAGES[3]
+        return self.FAILURE_MESSAGES[4].format(name=target.name)
+
+    def fail(self, engine: Engine, target: Optional[Entity]) -> bool:
+        """Let it be known the item can't be projected at a target"""
+        engine.events.emit(EventType.SPELL_FAILED, self.owner, target)
+        return False
+
     def get_action_or_state(self, projector: Creature) -> Union[Action, State]:
         """Get an action or state to be performed on projecting from item"""
         return ItemAction(projector, self.owner)
@@ -61,6 +82,7 @@ class Projectable(BaseComponent):
 
 class DamagingProjectable(Projectable):
     """Deal some damage when projected at a target"""
+    __slots__ = ("_magic_damage",)
 
     def __init__(self, uses: int, magicka_cost: int, magic_damage: int):
         super().__init__(uses, magicka_cost)
@@ -71,6 +93,7 @@ class EffectPerTurnProjectable(Projectable):
     """
     Cast an effect or debuff on an enemy, lasting however many turns specified
     """
+    __slots__ = ("_turns_remaining",)
 
     def __init__(self, uses: int, magicka_cost: int, turns_remaining: int):
         super().__init__(uses, magicka_cost)
@@ -79,6 +102,15 @@ class EffectPerTurnProjectable(Projectable):
 
 class LightningProjectable(DamagingProjectable):
     """An item that shoots out a powerful burst of lightning"""
+    __slots__ = ()
+
+    FAILURE_MESSAGES = (
+        "Nothing to strike at here",
+        "",
+        "Stop, it's already dead!",
+        "Don't strike yourself. Are you okay?",
+        "",
+    )
 
     def __init__(self, uses: int, magicka_cost: int, magic_damage: int):
         super().__init__(uses, magicka_cost, magic_damage)
@@ -92,39 +124,31 @@ class LightningProjectable(DamagingProjectable):
         )
         
         if not entity:
-            engine.message_log.add("Nothing to strike at here")
-            return turnable
+            return self.fail(engine, entity)
 
         if isinstance(entity, Item):
             self.expend_use()
-            engine.dungeon.current_floor.entities.remove(entity)
+            engine.dungeon.current_floor.remove_entity(entity)
 
-            engine.message_log.add(
-                f"The {entity.name} vaporizes!",
-                color="blue"
-            )
+            engine.events.emit(
+                EventType.LIGHTNING, self.owner.parent, entity)
 
             del entity
             turnable = True
             return turnable
         
-        if entity.render_order == RenderOrder.CORPSE:
-            engine.message_log.add("Stop, it's already dead!")
-            return turnable
-        
-        if isinstance(entity, Player):
-            engine.message_log.add("Don't strike yourself. Are you okay?")
-            return turnable
+        if (
+            entity.render_order == RenderOrder.CORPSE
+            or isinstance(entity, Player)
+        ):
+            return self.fail(engine, entity)
 
         if isinstance(entity, Creature):
             self.expend_use()
-            engine.message_log.add(
-                f"You cast a bolt of lightning at {entity.name}...",
-                color="blue"
-            )
+            engine.events.emit(EventType.LIGHTNING, self.owner.parent, entity,
+                               self._magic_damage)
             entity.fighter.take_damage(self._magic_damage)
             self.owner.parent.fighter.magicka -= self.magicka_cost
-            engine.message_log.add(f"for {self._magic_damage} pts!")
             turnable = True
 
         return turnable
@@ -135,6 +159,15 @@ class LightningProjectable(DamagingProjectable):
 
 class HealingProjectable(Projectable):
     """An item that shoots out a healing orb"""
+    __slots__ = ("_heal",)
+
+    FAILURE_MESSAGES = (
+        "Nothing to heal here",
+        "That item isn't broken",
+        "Doing that isn't going to bring it back",
+        "Health is already full!",
+        "Health is already full!",
+    )
 
     def __init__(self, uses: int, magicka_cost: int, heal: int):
         super().__init__(uses, magicka_cost)
@@ -148,50 +181,24 @@ class HealingProjectable(Projectable):
             engine.gamestate.cursor_index_y
         )
 
-        if not entity:
-            engine.message_log.add("Nothing to heal here")
-            return turnable
-        
-        if isinstance(entity, Item):
-            engine.message_log.add("That item isn't broken")
-            return turnable
-        
-        if entity.render_order == RenderOrder.CORPSE:
-            engine.message_log.add("Doing that isn't going to bring it back")
-            return turnable
-        
-        if entity.fighter.health >= entity.fighter.max_health:
-            engine.message_log.add("Health is already full!")
-            return turnable
-        
-        if isinstance(entity, Player):
-            self.expend_use()
-            engine.message_log.add(
-                "You cast the healing orb on yourself", color="blue")
-            
-            difference: int = self.owner.parent.fighter.health
-            entity.fighter.heal(self._heal)
-            entity.fighter.magicka -= self.magicka_cost
-            difference -= self.owner.parent.fighter.health
-
-            engine.message_log.add(
-                f"You regained {difference} pts!", color="blue")
-            
-            turnable = True
-            return turnable
+        if (
+            not entity
+            or isinstance(entity, Item)
+            or entity.render_order == RenderOrder.CORPSE
+            or entity.fighter.health >= entity.fighter.max_health
+        ):
+            return self.fail(engine, entity)
 
         if isinstance(entity, Creature):
             self.expend_use()
-            engine.message_log.add(
-                f"You cast the healing orb on {entity.name}")
             
             difference: int = entity.fighter.health
             entity.fighter.heal(self._heal)
             self.owner.parent.fighter.magicka -= self.magicka_cost
-            difference -= entity.fighter.health
+            difference = entity.fighter.health - difference
 
-            engine.message_log.add(
-                f"It regained {abs(difference)} pts!", color="blue")
+            engine.events.emit(
+                EventType.HEAL, self.owner.parent, entity, difference)
             turnable = True
 
         return turnable
@@ -202,6 +209,15 @@ class RizzProjectable(EffectPerTurnProjectable):
     Cast a spell to rizz up an enemy, following you around the floor and
     fighting other enemies with you
     """
+    __slots__ = ()
+
+    FAILURE_MESSAGES = (
+        "Nothing to rizz up here",
+        "Your rizz fails on this item",
+        "Doing that isn't going to bring it back",
+        "Can't rizz up yourself",
+        "{name} is already rizzed up!",
+    )
 
     def perform(self, engine: Engine) -> bool:
         turnable: bool = False
@@ -211,27 +227,17 @@ class RizzProjectable(EffectPerTurnProjectable):
             engine.gamestate.cursor_index_y
         )
 
-        if not entity:
-            engine.message_log.add("Nothing to rizz up here")
-            return turnable
-        
-        if isinstance(entity, Item):
-            engine.message_log.add("Your rizz fails on this item")
-            return turnable
-        
-        if entity.render_order == RenderOrder.CORPSE:
-            engine.message_log.add("Doing that isn't going to bring it back")
-            return turnable
-        
-        if isinstance(entity, Player):
-            engine.message_log.add("Can't rizz up yourself")
-            return turnable
+        if (
+            not entity
+            or isinstance(entity, Item)
+            or entity.render_order == RenderOrder.CORPSE
+            or isinstance(entity, Player)
+        ):
+            return self.fail(engine, entity)
         
         if isinstance(entity, Creature):
             if isinstance(entity.ai, (AllyDefendingAI, AllyFollowingAI)):
-                engine.message_log.add(
-                    f"{entity.name} is already rizzed up!")
-                return turnable
+                return self.fail(engine, entity)
             
             self.expend_use()
             entity.add_component(
@@ -244,10 +250,7 @@ class RizzProjectable(EffectPerTurnProjectable):
                 )
             )
             
-            engine.message_log.add(
-                f"{entity.name} is temporarily swayed by your rizz!",
-                color="blue"
-            )
+            engine.events.emit(EventType.RIZZ, self.owner.parent, entity)
 
             self.owner.parent.fighter.magicka -= self.magicka_cost
             turnable = True
@@ -261,6 +264,15 @@ class ConfusionProjectable(EffectPerTurnProjectable):
     Cast a spell to confuse an enemy, stumbling around and bumping into other
     living things
     """
+    __slots__ = ()
+
+    FAILURE_MESSAGES = (
+        "Nothing to confuse here",
+        "The item refuses to be confused",
+        "The corpse is just as confused as you are",
+        "Confused, your actions are. Confusion, you shall not be.",
+        "{name} is already confused!",
+    )
     
     def perform(self, engine: Engine) -> bool:
         turnable: bool = False
@@ -270,36 +282,23 @@ class ConfusionProjectable(EffectPerTurnProjectable):
             engine.gamestate.cursor_index_y
         )
 
-        if not entity:
-            engine.message_log.add("Nothing to confuse here")
-            return turnable
-        
-        if isinstance(entity, Item):
-            engine.message_log.add("The item refuses to be confused")
-            return turnable
-        
-        if entity.render_order == RenderOrder.CORPSE:
-            engine.message_log.add("The corpse is just as confused as you are")
-            return turnable
-        
-        if isinstance(entity, Player):
-            engine.message_log.add(
-                "Confused, your actions are. Confusion, you shall not be.")
-            return turnable
+        if (
+            not entity
+            or isinstance(entity, Item)
+            or entity.render_order == RenderOrder.CORPSE
+            or isinstance(entity, Player)
+        ):
+            return self.fail(engine, entity)
 
         if isinstance(entity, Creature):
             if isinstance(entity.ai, ConfusedAI):
-                engine.message_log.add(f"{entity.name} is already confused!")
-                return turnable
+                return self.fail(engine, entity)
             
             self.expend_use()
             entity.add_component(
                 "ai", ConfusedAI(entity, entity.ai, self._turns_remaining))
 
-            engine.message_log.add(
-                f"You cast a wave of bewilderment upon {entity.name}, now "
-                "stumbling around", color="blue"
-            )
+            engine.events.emit(EventType.CONFUSE, self.owner.parent, entity)
 
             self.owner.parent.fighter.magicka -= self.magicka_cost
             turnable = True
@@ -312,6 +311,7 @@ class RageProjectable(EffectPerTurnProjectable):
     
     Also temporarily buffs stats.
     """
+    __slots__ = ()
 
     def perform(self, engine: Engine) -> bool:
         turnable: bool = False
@@ -320,6 +320,15 @@ class RageProjectable(EffectPerTurnProjectable):
 
 class FreezeProjectable(EffectPerTurnProjectable):
     """Cast a spell to freeze an enemy in place"""
+    __slots__ = ()
+
+    FAILURE_MESSAGES = (
+        "Nothing to freeze here",
+        "Did you think this item was gonna move?",
+        "The corpse isn't going anywhere, don't worry",
+        "You can't play freeze tag with yourself",
+        "{name} is already frozen!",
+    )
     
     def perform(self, engine: Engine) -> bool:
         turnable: bool = False
@@ -329,36 +338,23 @@ class FreezeProjectable(EffectPerTurnProjectable):
             engine.gamestate.cursor_index_y
         )
 
-        if not entity:
-            engine.message_log.add("Nothing to freeze here")
-            return turnable
-        
-        if isinstance(entity, Item):
-            engine.message_log.add("Did you think this item was gonna move?")
-            return turnable
-        
-        if entity.render_order == RenderOrder.CORPSE:
-            engine.message_log.add(
-                "The corpse isn't going anywhere, don't worry")
-            return turnable
-        
-        if isinstance(entity, Player):
-            engine.message_log.add("You can't play freeze tag with yourself")
-            return turnable
+        if (
+            not entity
+            or isinstance(entity, Item)
+            or entity.render_order == RenderOrder.CORPSE
+            or isinstance(entity, Player)
+        ):
+            return self.fail(engine, entity)
         
         if isinstance(entity, Creature):
             if isinstance(entity.ai, FrozenAI):
-                engine.message_log.add(f"{entity.name} is already frozen!")
-                return turnable
+                return self.fail(engine, entity)
             
             self.expend_use()
             entity.add_component(
                 "ai", FrozenAI(entity, entity.ai, self._turns_remaining))
 
-            engine.message_log.add(
-                f"{entity.name} stops in its tracks, completely unable to"
-                "move", color="blue"
-            )
+            engine.events.emit(EventType.FREEZE, self.owner.parent, entity)
 
             self.owner.parent.fighter.magicka -= self.magicka_cost
             turnable = True
@@ -5,12 +5,15 @@ class QuestItem(BaseComponent):
     """
     Indicate that the item is involved in the main quest
     """
+    __slots__ = ()
 
 
 class Relic(QuestItem):
     """To be fetched back up to the entrance"""
+    __slots__ = ()
 
 
 class Glyph(QuestItem):
     """To be combined to reveal the hidden room"""
+    __slots__ = ()
 
@@ -1,6 +1,12 @@
 ### NUMERICAL ###
 # General.
 MAX_FOV_DISTANCE: int = 8
+CACHE_MENU_BACKGROUND: bool = True  # Keep next launch's menu map on disk.
+CACHE_CONTENT: bool = False  # Keep checked creature/item data on disk.
+MESSAGE_HISTORY_SIZE: int = 200  # Messages kept in memory and in saves.
+SPILL_MESSAGE_HISTORY: bool = False  # Write older messages to a log file.
+RECORD_REPLAYS: bool = True  # Save your actions to play the run back later.
+REPLAY_CHECKSUM_INTERVAL: int = 50  # Actions between replay state checks.
 
 # Floor specs.
 NUM_FLOORS: int = 10  # At least 5 or main quest will break.
@@ -16,8 +22,16 @@ MAX_ROOM_WIDTH: int = 18
 # Entities/AI.
 MAX_ENEMIES_PER_FLOOR: int = 3
 MAX_ITEMS_PER_FLOOR: int = 6
+ENEMY_GROWTH_PER_FLOOR: float = 0.25  # Share of the above added per depth.
+ITEM_GROWTH_PER_FLOOR: float = 0.1
 CHANCE_TO_SWITCH_ROOMS: float = 0.03  # Travelling creature to another room.
 CHANCE_TO_TAKE_STEP: float = 0.75  # Creature pacing around a room.
+AI_DORMANT_DISTANCE: int = 20  # Creatures further than this from you sleep.
+NOISE_RADIUS: int = 12  # Combat wakes sleeping creatures within this range.
+ALLY_SEEK_RADIUS: int = 10  # How far allies look for enemies to fight.
+PARALLEL_AI_DECISIONS: bool = False  # Work out creature paths across cores.
+AI_DECISION_WORKERS: int = 4  # Processes to path on when the above is on.
+CREATURE_TABLES: bool = False  # Keep creature stats in per-floor arrays.
 
 ### CHARACTER ###
 # Tile representations.
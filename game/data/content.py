@@ -0,0 +1,266 @@
+"""
+Loads the creature and item tables from the data files, checks them over, and
+compiles them into immutable records for the spawner to build from.
+
+Any mistake in the tables gets reported all at once the first time content is
+loaded, instead of whenever a bad entry happens to spawn mid-game.
+"""
+from __future__ import annotations
+
+import dataclasses
+import enum
+import functools
+import hashlib
+import pickle
+import typing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .. import __version__
+from ..item_types import ArmorType, WeaponType, ProjectileType, PotionType
+from .config import CACHE_CONTENT
+
+CONTENT_CACHE_LOCATION: Path = Path("saves/content.pickle")
+
+# Data files the content is compiled from, for telling if a cache is stale.
+_DATA_DIRECTORY: Path = Path(__file__).parent
+_DATA_FILES: tuple[str, ...] = (
+    "creatures.py",
+    "items/weapons.py",
+    "items/staves.py",
+    "items/armor.py",
+    "items/potions.py"
+)
+
+
+def _data_key(name: str) -> dict[str, str]:
+    """Field metadata for a field named differently in the data files"""
+    return {"key": name}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StatBonuses:
+    power: int = 0
+    agility: int = 0
+    vitality: int = 0
+    sage: int = 0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PlayerRecord:
+    name: str
+    char: str
+    color: str
+    health: int = field(metadata=_data_key("hp"))
+    magicka: int = field(metadata=_data_key("mp"))
+    damage: int = field(metadata=_data_key("dmg"))
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CreatureRecord:
+    name: str
+    char: str
+    color: str
+    health: int = field(metadata=_data_key("hp"))
+    damage: int = field(metadata=_data_key("dmg"))
+    spawn_chance: int  # Relative weight.
+    energy: int  # Gained per turn, 10 is a full turn's worth.
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ItemRecord:
+    name: str
+    desc: str
+    char: str
+    color: str
+    spawn_chance: int  # Relative weight within its kind of item.
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WeaponRecord(ItemRecord):
+    weapon_type: WeaponType = field(metadata=_data_key("type"))
+    damage: int = field(metadata=_data_key("dmg"))
+    stat_bonuses: StatBonuses = StatBonuses()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class StaffRecord(WeaponRecord):
+    projectile_type: ProjectileType = field(
+        metadata=_data_key("staff_type"))
+    uses: int
+    magicka_cost: int
+    magic_damage: int = field(metadata=_data_key("magic_dmg"))
+    heal: int = field(default=0, metadata=_data_key("hp"))
+    turns_remaining: int = 0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ArmorRecord(ItemRecord):
+    armor_type: ArmorType = field(metadata=_data_key("type"))
+    # Percent of damage taken off.
+    damage_reduction: int = field(metadata=_data_key("dmg_reduct"))
+    coverage: int
+    stat_bonuses: StatBonuses = StatBonuses()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PotionRecord(ItemRecord):
+    potion_type: PotionType = field(metadata=_data_key("type"))
+    yield_amount: int = field(metadata=_data_key("yield"))
+
+
+@dataclass(frozen=True, slots=True)
+class Content:
+    """Everything the game spawns, checked over and ready to build from"""
+    player: PlayerRecord
+    enemies: tuple[CreatureRecord, ...]
+    weapons: tuple[WeaponRecord, ...]
+    staves: tuple[StaffRecord, ...]
+    armor: tuple[ArmorRecord, ...]
+    potions: tuple[PotionRecord, ...]
+
+
+@functools.cache
+def load_content() -> Content:
+    """Get the game's content, compiling it the first time around.
+
+    Raises ValueError listing every problem found in the data files.
+    """
+    if not CACHE_CONTENT:
+        return compile_content()
+
+    data_hash: str = _get_data_hash()
+    content: Optional[Content] = _load_cached_content(data_hash)
+    if content is None:
+        content = compile_content()
+        _save_cached_content(content, data_hash)
+    return content
+
+
+def compile_content() -> Content:
+    """Check over the data files and turn them into records"""
+    from .creatures import player, enemies
+    from .items.weapons import weapons
+    from .items.staves import staves
+    from .items.armor import armor
+    from .items.potions import restoration_potions
+
+    problems: list[str] = []
+
+    def compile_all(record_class: type,
+                    entries: Union[dict[str, Any], list[Any]],
+                    source: str) -> tuple[Any, ...]:
+        if isinstance(entries, list):
+            entries = dict(enumerate(entries))
+        return tuple(
+            _compile_record(
+                record_class, entry, f"{source}[{index!r}]", problems)
+            for index, entry in entries.items()
+        )
+
+    content = Content(
+        player=_compile_record(PlayerRecord, player, "player", problems),
+        enemies=compile_all(CreatureRecord, enemies, "enemies"),
+        weapons=compile_all(WeaponRecord, weapons, "weapons"),
+        staves=compile_all(StaffRecord, staves, "staves"),
+        armor=compile_all(ArmorRecord, armor, "armor"),
+        potions=compile_all(
+            PotionRecord, restoration_potions, "restoration_potions")
+    )
+    if problems:
+        raise ValueError(
+            "Malformed game data:\n" + "\n".join(
+                f"  {problem}" for problem in problems))
+    return content
+
+
+def _compile_record(record_class: type,
+                    entry: Any,
+                    source: str,
+                    problems: list[str]) -> Any:
+    """Make a record out of a data entry, noting down anything wrong"""
+    if not isinstance(entry, dict):
+        problems.append(f"{source}: expected a dict, got {entry!r}")
+        return None
+
+    types: dict[str, Any] = _get_field_types(record_class)
+    values: dict[str, Any] = {}
+    known_keys: set[str] = set()
+    for record_field in dataclasses.fields(record_class):
+        data_key: str = record_field.metadata.get("key", record_field.name)
+        known_keys.add(data_key)
+        if data_key not in entry:
+            if (
+                record_field.default is dataclasses.MISSING
+                and record_field.default_factory is dataclasses.MISSING
+            ):
+                problems.append(f"{source}: missing {data_key!r}")
+            continue
+
+        value: Any = entry[data_key]
+        field_type: Any = types[record_field.name]
+        if dataclasses.is_dataclass(field_type):
+            value = _compile_record(
+                field_type, value, f"{source}.{data_key}", problems)
+        elif not _is_of_type(value, field_type):
+            problems.append(
+                f"{source}: {data_key!r} should be "
+                f"{field_type.__name__}, got {value!r}")
+        values[record_field.name] = value
+
+    for data_key in sorted(entry.keys() - known_keys):
+        problems.append(f"{source}: unknown key {data_key!r}")
+    if isinstance(values.get("char"), str) and len(values["char"]) != 1:
+        problems.append(f"{source}: 'char' should be a single character")
+    if isinstance(values.get("spawn_chance"), int) and \
+        values["spawn_chance"] < 0:
+        problems.append(f"{source}: 'spawn_chance' can't be negative")
+
+    try:
+        return record_class(**values)
+    except TypeError:
+        return None  # Missing fields, already noted down.
+
+
+@functools.cache
+def _get_field_types(record_class: type) -> dict[str, Any]:
+    return typing.get_type_hints(record_class)
+
+
+def _is_of_type(value: Any, field_type: type) -> bool:
+    if field_type is int:
+        # Booleans are ints too, but never what's meant.
+        return isinstance(value, int) and not isinstance(value, bool)
+    if isinstance(field_type, enum.EnumMeta) or field_type is str:
+        return isinstance(value, field_type)
+    return True
+
+
+def _get_data_hash() -> str:
+    """Hash the data files along with the game version"""
+    data_hash = hashlib.blake2b(__version__.encode(), digest_size=16)
+    for data_file in _DATA_FILES:
+        data_hash.update((_DATA_DIRECTORY / data_file).read_bytes())
+    return data_hash.hexdigest()
+
+
+def _load_cached_content(data_hash: str) -> Optional[Content]:
+    """Read in content compiled by an earlier launch, if still up to date"""
+    try:
+        with open(CONTENT_CACHE_LOCATION, "rb") as cache_file:
+            cached_hash, content = pickle.load(cache_file)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError,
+            AttributeError, TypeError):
+        return None
+    return content if cached_hash == data_hash else None
+
+
+def _save_cached_content(content: Content, data_hash: str) -> None:
+    """Keep compiled content on disk for next launch"""
+    try:
+        CONTENT_CACHE_LOCATION.parent.mkdir(exist_ok=True)
+        with open(CONTENT_CACHE_LOCATION, "wb") as cache_file:
+            pickle.dump((data_hash, content), cache_file)
+    except OSError:
+        pass  # Just compile it again next time.
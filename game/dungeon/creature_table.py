@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import operator
+from array import array
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from ..components.fighter import Fighter
+    from ..entities import Creature
+
+
+class CreatureTable:
+    """The numbers living creatures on a floor change turn after turn, kept
+    in typed columns with a row for each creature.
+
+    While a creature has a row, its energy and its fighter's health and
+    magicka are read from and written to the row instead of the objects, so
+    systems can step every creature on the floor at once. Energy gain is
+    fixed per creature and only gets copied in.
+    """
+
+    def __init__(self):
+        self.creatures: list[Creature] = []  # In row order.
+        self.energy = array("i")
+        self.energy_gain = array("i")
+        self.health = array("i")
+        self.magicka = array("i")
+
+
+    def __len__(self) -> int:
+        return len(self.creatures)
+
+
+    def add(self, creature: Creature) -> None:
+        """Move a creature's numbers into a new row"""
+        fighter: Optional[Fighter] = creature.get_component("fighter")
+        self.energy.append(creature.energy)
+        self.energy_gain.append(creature.energy_gain_per_turn)
+        self.health.append(fighter.health if fighter else 0)
+        self.magicka.append(fighter.magicka if fighter else 0)
+
+        row: int = len(self.creatures)
+        self.creatures.append(creature)
+        self._assign_row(creature, row)
+
+
+    def remove(self, creature: Creature) -> None:
+        """Move a creature's numbers back out, its row taken by the last one"""
+        row: int = creature._row
+        self._assign_row(creature, None)
+        fighter: Optional[Fighter] = creature.get_component("fighter")
+        creature.energy = self.energy[row]
+        if fighter:
+            fighter._health = self.health[row]
+            fighter._magicka = self.magicka[row]
+
+        last: Creature = self.creatures.pop()
+        for column in (
+            self.energy, self.energy_gain, self.health, self.magicka
+        ):
+            column[row] = column[-1]
+            column.pop()
+        if last is not creature:
+            self.creatures[row] = last
+            self._assign_row(last, row)
+
+
+    def gain_energy(self) -> None:
+        """Give every creature its energy for the turn"""
+        self.energy = array(
+            "i", map(operator.add, self.energy, self.energy_gain))
+
+
+    def _assign_row(self, creature: Creature, row: Optional[int]) -> None:
+        table: Optional[CreatureTable] = self if row is not None else None
+        creature._table, creature._row = table, row
+        fighter: Optional[Fighter] = creature.get_component("fighter")
+        if fighter:
+            fighter._table, fighter._row = table, row
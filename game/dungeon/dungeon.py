@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
 
@@ -50,7 +51,22 @@ class Dungeon:
 
         self.spawner = spawner
         self.floors: list[Floor] = []
-        self.current_floor_index: int = 0
+        self._current_floor_index: int = 0
+
+        # Floors' checksums are kept until something on them changes, or
+        # until the player has been on them since last time.
+        self._floor_checksums: dict[int, bytes] = {}
+    
+    @property
+    def current_floor_index(self) -> int:
+        return self._current_floor_index
+    
+    @current_floor_index.setter
+    def current_floor_index(self, new_index: int) -> None:
+        # Anything could have happened on the floor the player is leaving.
+        if self._current_floor_index < len(self.floors):
+            self.current_floor.changed_since_checksum = True
+        self._current_floor_index = new_index
     
     @property
     def current_floor(self) -> Floor:
@@ -75,6 +91,24 @@ class Dungeon:
         """Indicates which floors to put a descending staircase on"""
         return True
     
+    def get_checksum(self) -> bytes:
+        """Hash every floor, only going over again the ones played on or
+        changed since last time
+        """
+        self.current_floor.changed_since_checksum = True
+
+        checksum = hashlib.blake2b(
+            self.current_floor_index.to_bytes(4, "big"), digest_size=16)
+        for floor_index, floor in enumerate(self.floors):
+            if (
+                floor.changed_since_checksum
+                or floor_index not in self._floor_checksums
+            ):
+                self._floor_checksums[floor_index] = floor.get_checksum()
+                floor.changed_since_checksum = False
+            checksum.update(self._floor_checksums[floor_index])
+        return checksum.digest()
+    
     def spawn_player(self, player: Player) -> None:
         """Place player in middle of first room"""
         self.spawner.spawn_player(player, self.current_floor.first_room)
@@ -86,6 +120,7 @@ class Dungeon:
         if self.floors:
             self.floors = []
             self.current_floor_index = 0
+            self._floor_checksums.clear()
         
         self.generate_next_floor()
     
@@ -114,11 +149,13 @@ class Dungeon:
             )
             .place_items(
                 spawner=self.spawner,
-                max_items_per_floor=self._config.max_items_per_floor
+                max_items_per_floor=self._config.max_items_per_floor,
+                depth=self.current_floor_index
             )
             .place_creatures(
                 spawner=self.spawner,
-                max_creatures_per_floor=self._config.max_enemies_per_floor
+                max_creatures_per_floor=self._config.max_enemies_per_floor,
+                depth=self.current_floor_index
             )
             .build(self)
         )
@@ -164,8 +201,8 @@ class NormalDungeon(Dungeon):
 
     def floor_has_glyph(self, floor: Floor) -> bool:
         """Given floor has one or more glyphs"""
-        for entity in floor.entities:
-            if entity.get_component("glyph"):
+        for item in floor.items:
+            if item.get_component("glyph"):
                 return True
         return False
     
@@ -215,11 +252,13 @@ class NormalDungeon(Dungeon):
             )
             .place_items(
                 spawner=self.spawner,
-                max_items_per_floor=self._config.max_items_per_floor
+                max_items_per_floor=self._config.max_items_per_floor,
+                depth=self.current_floor_index
             )
             .place_creatures(
                 spawner=self.spawner,
-                max_creatures_per_floor=self._config.max_enemies_per_floor
+                max_creatures_per_floor=self._config.max_enemies_per_floor,
+                depth=self.current_floor_index
             )
             .build(self)
         )
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
 import bisect
-from typing import Iterator, Optional, Union, Generator, TYPE_CHECKING
+import hashlib
+import itertools
+from typing import (
+    Iterator, KeysView, Optional, Union, Generator, TYPE_CHECKING)
 
 if TYPE_CHECKING:
     from .dungeon import Dungeon
     from ..entities import Entity, Player
-    from ..tile import Tile
     from ..spawner import Spawner
     from ..rng import RandomNumberGenerator
 from .room import Room
-from ..entities import Creature, Item, Player
+from .creature_table import CreatureTable
+from .spawn_planner import SpawnPlanner
+from ..entities import Creature, Item, Player, Furniture
+from ..render_order import RenderOrder
 from ..tile import *
+from ..data.config import (
+    CREATURE_TABLES, ENEMY_GROWTH_PER_FLOOR, ITEM_GROWTH_PER_FLOOR)
 
 
 class Floor:
@@ -21,14 +28,30 @@ class Floor:
         self.width = width
         self.height = height
 
-        self.tiles: list[list[Tile]] = []
+        self.tiles: list[bytearray] = []  # Tile types, see tile.py.
         self.wall_locations: set[tuple[int, int]] = set()  # For A* algorithm.
-        self.explored_tiles: dict[tuple[int, int], Tile] = {}
+        # Cells seen so far, one byte per cell row by row.
+        self.explored: bytearray = bytearray(width * height)
         
         self.rooms: list[Room] = []
-        self.entities: list[Union[Player, Creature, Item]] = []
+        # Entities by render order, each in the order they were added in.
+        self._entities_by_render_order: dict[RenderOrder, dict[Entity, None]] \
+            = {render_order: {} for render_order in RenderOrder}
+        # Entities standing on each occupied cell, sorted by render order.
+        self._entities_by_cell: dict[tuple[int, int], list[Entity]] = {}
+        # Entities of each kind, kept up to date as they come, go, and die.
+        self._creatures: dict[Creature, None] = {}
+        self._living_creatures: dict[Creature, None] = {}
+        self._items: dict[Item, None] = {}
+        self._furniture: dict[Furniture, None] = {}
+        self._staircases: dict[Entity, None] = {}
+        # Living creatures' energy, health and magicka, if kept in columns.
+        self.creature_table: Optional[CreatureTable] = \
+            CreatureTable() if CREATURE_TABLES else None
         
         self.dungeon: Optional[Dungeon] = None
+        # If its dungeon must hash it again, see Dungeon.get_checksum.
+        self.changed_since_checksum: bool = True
 
         self.descending_staircase_location: tuple[int, int] = None
         self.ascending_staircase_location: tuple[int, int] = None
@@ -37,24 +60,46 @@ class Floor:
         self.relic_room: Optional[Room] = None
         self.glyphs_room: Optional[Room] = None
         self.passage_revealed: bool = False
+
+        # Where combat happened this turn, waking up any dormant creatures.
+        self.noise_locations: list[tuple[int, int]] = []
+
+    
+    @property
+    def entities(self) -> Iterator[Union[Player, Creature, Item]]:
+        """Go through every entity on the floor in render order"""
+        return itertools.chain.from_iterable(
+            self._entities_by_render_order.values())
     
     
     @property
-    def items(self) -> Iterator[Item]:
+    def items(self) -> KeysView[Item]:
         """Select the items from the entities list"""
-        yield from (
-            entity for entity in self.entities
-            if isinstance(entity, Item)
-        )
+        return self._items.keys()
     
     
     @property
-    def creatures(self) -> Iterator[Creature]:
-        """Select the creatures from the entities list"""
-        yield from (
-            entity for entity in self.entities
-            if isinstance(entity, Creature)
-        )
+    def creatures(self) -> KeysView[Creature]:
+        """Select the creatures, dead or alive, from the entities list"""
+        return self._creatures.keys()
+    
+    
+    @property
+    def living_creatures(self) -> KeysView[Creature]:
+        """Select the creatures that have not been slain yet"""
+        return self._living_creatures.keys()
+    
+    
+    @property
+    def furniture(self) -> KeysView[Furniture]:
+        """Select the furniture from the entities list"""
+        return self._furniture.keys()
+    
+    
+    @property
+    def staircases(self) -> KeysView[Entity]:
+        """Select the staircases from the entities list"""
+        return self._staircases.keys()
     
     
     @property
@@ -78,14 +123,57 @@ class Floor:
     def get_random_room(self, rng: RandomNumberGenerator) -> Room:
         """Get a random room"""
         return rng.choice(self.rooms)
-    
+
+
+    def get_checksum(self) -> bytes:
+        """Hash the floor's layout, what's been seen of it, and everything
+        on it
+        """
+        checksum = hashlib.blake2b(digest_size=16)
+        for tiles_row in self.tiles:
+            checksum.update(tiles_row)
+        checksum.update(self.explored)
+        checksum.update(repr(
+            [entity.get_state() for entity in self.entities]).encode())
+        return checksum.digest()
+
+
+    def is_explored(self, x: int, y: int) -> bool:
+        """Check if a cell has ever been seen"""
+        return self.explored[x * self.width + y] == 1
+
+
+    def reveal(self, mask: bytearray) -> None:
+        """Mark the cells set in a mask shaped like the floor as explored"""
+        self.changed_since_checksum = True
+        self.explored[:] = (
+            int.from_bytes(self.explored, "big")
+            | int.from_bytes(mask, "big")
+        ).to_bytes(len(self.explored), "big")
+
+
+    def room_at(self, x: int, y: int) -> Optional[Room]:
+        """Get the room a cell is inside of, if any"""
+        for room in self.rooms:
+            if room.contains_point((x, y)):
+                return room
+        return None
+
+
+    def make_noise(self, x: int, y: int) -> None:
+        """Make a noise at a cell for creatures to hear until the turn ends"""
+        self.noise_locations.append((x, y))
+
+
+    def entities_at(self, x: int, y: int) -> list[Entity]:
+        """Get the entities on a cell, sorted by render order"""
+        return self._entities_by_cell.get((x, y), [])
+
 
     def entity_at(self, x: int, y: int) -> Optional[Entity]:
         """Check if a cell is occupied by any entity"""
-        for entity in self.entities:
-            if isinstance(entity, Player):
-                continue
-            if entity.x == x and entity.y == y:
+        for entity in self.entities_at(x, y):
+            if not isinstance(entity, Player):
                 return entity
         return None
     
@@ -97,18 +185,152 @@ class Floor:
         include_player: bool = True
     ) -> Optional[Union[Player, Creature]]:
         """Check if a cell is occupied by an entity that blocks movement"""
-        for entity in self.entities:
+        for entity in self.entities_at(x, y):
             if isinstance(entity, Player) and not include_player:
                 continue
-            if entity.x == x and entity.y == y and entity.blocking:
+            if entity.blocking:
                 return entity
         return None
     
     
     def add_entity(self, entity: Entity) -> None:
-        """Keep entities list sorted when adding by render order"""
+        """Add an entity to the end of its render order"""
+        # Leave whichever floor it was on before, e.g. the player on stairs.
+        if entity.floor is not None:
+            entity.floor.remove_entity(entity)
+        self.changed_since_checksum = True
+
+        self._entities_by_render_order[entity.render_order][entity] = None
+        for view in self._views_of(entity):
+            view[entity] = None
+        self._index_entity(entity, entity.x, entity.y)
+        entity.floor = self
+
+        table: Optional[CreatureTable] = self.creature_table
+        if table is not None and entity in self._living_creatures:
+            table.add(entity)
+    
+    
+    def remove_entity(self, entity: Entity) -> None:
+        """Take an entity off the floor"""
+        self.changed_since_checksum = True
+        table: Optional[CreatureTable] = self.creature_table
+        if table is not None and entity in self._living_creatures:
+            table.remove(entity)
+
+        del self._entities_by_render_order[entity.render_order][entity]
+        for view in self._views_of(entity):
+            del view[entity]
+        self._unindex_entity(entity, entity.x, entity.y)
+        entity.floor = None
+    
+    
+    def relocate_entity(self, entity: Entity, x: int, y: int) -> None:
+        """Move an entity to another cell in the cell index"""
+        self.changed_since_checksum = True
+        self._unindex_entity(entity, entity.x, entity.y)
+        self._index_entity(entity, x, y)
+    
+    
+    def _views_of(self, entity: Entity) -> list[dict[Entity, None]]:
+        """Get the views of each kind of entity that it belongs in"""
+        if isinstance(entity, Creature):
+            # Slain creatures turn into corpses, see Fighter.die.
+            if entity.render_order == RenderOrder.CORPSE:
+                return [self._creatures]
+            return [self._creatures, self._living_creatures]
+        if isinstance(entity, Item):
+            return [self._items]
+        if isinstance(entity, Furniture):
+            return [self._furniture]
+        if entity.render_order == RenderOrder.STAIRCASE:
+            return [self._staircases]
+        return []
+    
+    
+    def _index_entity(self, entity: Entity, x: int, y: int) -> None:
         bisect.insort(
-            self.entities, entity, key=lambda x: x.render_order.value)
+            self._entities_by_cell.setdefault((x, y), []),
+            entity, key=lambda other: other.render_order.value)
+    
+    
+    def _unindex_entity(self, entity: Entity, x: int, y: int) -> None:
+        cell: list[Entity] = self._entities_by_cell[(x, y)]
+        cell.remove(entity)
+        if not cell:
+            del self._entities_by_cell[(x, y)]
+
+
+class FloorSnapshot:
+    """A frozen copy of what pathfinding needs to know about a floor.
+    
+    Safe to hand over to other processes to path on while the floor itself
+    keeps changing.
+    """
+
+    def __init__(self, floor: Floor):
+        self.width = floor.width
+        self.height = floor.height
+        self.wall_locations: frozenset[tuple[int, int]] = \
+            frozenset(floor.wall_locations)
+
+        self._player_location: Optional[tuple[int, int]] = None
+        blocking_locations: set[tuple[int, int]] = set()
+        for entity in floor.entities:
+            if isinstance(entity, Player):
+                self._player_location = (entity.x, entity.y)
+            elif entity.blocking:
+                blocking_locations.add((entity.x, entity.y))
+        self._blocking_locations = frozenset(blocking_locations)
+        # The only ones of those that can come or go while creatures move.
+        self._creature_locations: frozenset[tuple[int, int]] = frozenset(
+            (creature.x, creature.y) for creature in floor.living_creatures
+            if creature.blocking and not isinstance(creature, Player)
+        )
+
+
+    def blocking_entity_at(
+        self,
+        x: int,
+        y: int,
+        include_player: bool = True
+    ) -> bool:
+        """Check if a cell was occupied by an entity that blocks movement"""
+        if include_player and (x, y) == self._player_location:
+            return True
+        return (x, y) in self._blocking_locations
+
+
+    def blocking_unchanged(
+            self, floor: Floor, area: tuple[int, int, int, int]) -> bool:
+        """Check if no entity blocking movement, besides the player, has come
+        or gone within an area of the floor since the snapshot was taken
+        """
+        x1, y1, x2, y2 = area
+
+        # Look over whichever there are fewer of, the cells in the area or the
+        # creatures that could have moved into or out of it.
+        if (x2 - x1 + 1) * (y2 - y1 + 1) <= len(floor.living_creatures):
+            for cell in itertools.product(
+                    range(x1, x2 + 1), range(y1, y2 + 1)):
+                blocked: bool = False
+                for entity in floor.entities_at(*cell):
+                    if entity.blocking and not isinstance(entity, Player):
+                        blocked = True
+                        break
+                if blocked != (cell in self._blocking_locations):
+                    return False
+            return True
+
+        creature_locations: set[tuple[int, int]] = {
+            (creature.x, creature.y) for creature in floor.living_creatures
+            if creature.blocking and not isinstance(creature, Player)
+            and x1 <= creature.x <= x2 and y1 <= creature.y <= y2
+        }
+        return creature_locations == {
+            (x, y) for x, y in self._creature_locations
+            if x1 <= x <= x2 and y1 <= y <= y2
+        }
 
 
 class FloorBuilder:
@@ -137,15 +359,16 @@ class FloorBuilder:
         # change all the references.
         self.relic_room: Optional[Room] = None
         self.glyphs_room: Optional[Room] = None
+
+        # Made once the staircases are in, shared by items and creatures.
+        self._spawn_planner: Optional[SpawnPlanner] = None
     
     
-    def place_walls(
-        self, tile_type: Tile = wall_tile_shrouded) -> FloorBuilder:
+    def place_walls(self, tile_type: int = TILE_WALL) -> FloorBuilder:
         """Fill the floor with wall tiles"""
         for x in range(self.floor_height):
-            row: list[Tile] = []
+            row = bytearray([tile_type]) * self.floor_width
             for y in range(self.floor_width):
-                row.append(tile_type)
                 # Track for pathfinding.
                 self._floor.wall_locations.add((x, y))
             self._floor.tiles.append(row)
@@ -156,7 +379,7 @@ class FloorBuilder:
 
 
     def place_relic_room(
-            self, tile_type: Tile = floor_tile_shrouded) -> FloorBuilder:
+            self, tile_type: int = TILE_FLOOR) -> FloorBuilder:
         """QUEST - place on a random corner of the map.
         
         Must be called before place_rooms()
@@ -186,7 +409,7 @@ class FloorBuilder:
     def place_glyphs_room(
         self,
         spawner: Spawner,
-        tile_type: Tile = floor_tile_shrouded
+        tile_type: int = TILE_FLOOR
     ) -> FloorBuilder:
         """QUEST - place next to the relic room.
         
@@ -336,7 +559,7 @@ class FloorBuilder:
         max_room_height: int,
         min_room_width: int,
         max_room_width: int,
-        tile_type: Tile = floor_tile_shrouded
+        tile_type: int = TILE_FLOOR
     ) -> FloorBuilder:
         """Algorithm to scatter randomly-sized rooms across the floor"""
         # Place rooms until we reach our desired limit.
@@ -383,7 +606,7 @@ class FloorBuilder:
         return self
     
     
-    def place_tunnels(self, tile_type: Tile = floor_tile_dim, vertical_first: bool = True) -> FloorBuilder:
+    def place_tunnels(self, tile_type: int = TILE_FLOOR, vertical_first: bool = True) -> FloorBuilder:
         """Build a tunnel path from one room to the next"""
         rooms: list[Room] = self._floor.rooms
 
@@ -450,12 +673,15 @@ class FloorBuilder:
     def place_items(
         self,
         spawner: Spawner,
-        max_items_per_floor: int
+        max_items_per_floor: int,
+        depth: int = 0
     ) -> FloorBuilder:
-        """Scatter random items throughout the level"""
-        for _ in range(max_items_per_floor):
-            room: Room = self.rng.choice(self._floor.rooms)
-            spawner.spawn_item(room, item_type="normal")
+        """Scatter random items throughout the level, more the deeper it is"""
+        planner: SpawnPlanner = self._get_spawn_planner()
+        num_items: int = planner.get_budget(
+            max_items_per_floor, depth, ITEM_GROWTH_PER_FLOOR)
+        for room, coord in planner.plan(self._floor.rooms, num_items):
+            spawner.spawn_item_at(coord, room, item_type="normal")
         
         return self
     
@@ -463,13 +689,18 @@ class FloorBuilder:
     def place_creatures(
         self, 
         spawner: Spawner, 
-        max_creatures_per_floor: int
+        max_creatures_per_floor: int,
+        depth: int = 0
     ) -> FloorBuilder:
-        """Create and place enemies throughout the rooms in the level"""
-        for _ in range(max_creatures_per_floor):
-            # Don't include the room the player spawns in.
-            room: Room = self.rng.choice(self._floor.rooms[1:])
-            spawner.spawn_enemy(room)
+        """Create and place enemies throughout the rooms in the level, more
+        the deeper it is
+        """
+        planner: SpawnPlanner = self._get_spawn_planner()
+        num_creatures: int = planner.get_budget(
+            max_creatures_per_floor, depth, ENEMY_GROWTH_PER_FLOOR)
+        # Don't include the room the player spawns in.
+        for room, coord in planner.plan(self._floor.rooms[1:], num_creatures):
+            spawner.spawn_enemy_at(coord, room)
         
         return self
     
@@ -479,14 +710,22 @@ class FloorBuilder:
         self._floor.dungeon = dungeon  # Pass dungeon reference.
         return self._floor
     
+    
+    def _get_spawn_planner(self) -> SpawnPlanner:
+        """Plan spawns around whatever's been placed on the floor so far"""
+        if self._spawn_planner is None:
+            self._spawn_planner = SpawnPlanner(self.rng, self._floor)
+        return self._spawn_planner
+    
 
     @staticmethod
     def dig_tunnel(
         floor: Floor,
         tunnel_set: set[tuple[int, int]],
-        tile_type: Tile = floor_tile_dim
+        tile_type: int = TILE_FLOOR
     ) -> None:
         """Dig through the desired tunnel path from point a to point b"""
+        floor.changed_since_checksum = True
         for x, y in tunnel_set:
             floor.tiles[x][y] = tile_type
             # Track for pathfinding.
@@ -528,7 +767,7 @@ class FloorBuilder:
     def _dig_room(
         self,
         room: Room,
-        tile_type: Tile = floor_tile_shrouded
+        tile_type: int = TILE_FLOOR
     ) -> None:
         """Carve out the walls for a room"""
         for x in range(room.x1, room.x2):
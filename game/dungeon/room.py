@@ -61,6 +61,12 @@ class Room:
         )
         return within_x_ranges and within_y_ranges
 
+
+    def contains_point(self, coord: tuple[int, int]) -> bool:
+        """Check if a coordinate lies on one of this room's floor cells"""
+        x, y = coord
+        return self.x1 <= x < self.x2 and self.y1 <= y < self.y2
+
     
     def get_center_cell(self) -> tuple[int, int]:
         """The spot in the middle of the room"""
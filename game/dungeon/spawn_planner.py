@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .floor import Floor
+    from .room import Room
+    from ..rng import RandomNumberGenerator
+
+
+class SpawnPlanner:
+    """Works out where on a floor things get spawned before spawning them.
+
+    Every room's free cells are listed once up front, and each spawn takes a
+    random one out of its room's list. No spawn has to retry around taken
+    cells, and rooms that fill up just stop getting picked, so floors can
+    hold as many spawns as they have room for.
+    """
+
+    def __init__(self, rng: RandomNumberGenerator, floor: Floor):
+        self.rng = rng
+        self._free_cells: dict[Room, list[tuple[int, int]]] = {
+            room: [
+                (x, y)
+                for x in range(room.x1, room.x2)
+                for y in range(room.y1, room.y2)
+                if floor.entity_at(x, y) is None
+            ]
+            for room in floor.rooms
+        }
+
+
+    @staticmethod
+    def get_budget(base_count: int, depth: int, growth: float) -> int:
+        """How many of something to spawn at a depth, growing by a share of
+        the base count each floor down
+        """
+        return base_count + int(base_count * growth * depth)
+
+
+    def plan(self,
+             rooms: list[Room],
+             count: int) -> list[tuple[Room, tuple[int, int]]]:
+        """Pick a room and a free cell in it for each of a number of spawns.
+
+        Rooms are picked evenly at random until they run out of free cells.
+        """
+        open_rooms: list[Room] = [
+            room for room in rooms if self._free_cells[room]]
+        placements: list[tuple[Room, tuple[int, int]]] = []
+        for _ in range(count):
+            if not open_rooms:
+                break  # Floor is full.
+            room_index: int = self.rng.randrange(len(open_rooms))
+            room: Room = open_rooms[room_index]
+            cells: list[tuple[int, int]] = self._free_cells[room]
+
+            # Swap the cell to the end so it can be taken out right away.
+            cell_index: int = self.rng.randrange(len(cells))
+            cells[cell_index], cells[-1] = cells[-1], cells[cell_index]
+            placements.append((room, cells.pop()))
+
+            if not cells:
+                open_rooms[room_index] = open_rooms[-1]
+                open_rooms.pop()
+        return placements
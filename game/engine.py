@@ -1,17 +1,31 @@
 from __future__ import annotations
 
 import curses
+import hashlib
+import math
+import pickle
+import random
+from array import array
+from itertools import chain, repeat
 from typing import TYPE_CHECKING, Optional, Union, Any
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
     from .dungeon.dungeon import Dungeon
     from .terminal_control import TerminalController
     from .entities import Player
     from .message_log import MessageLog
+    from .replay import Replay
     from .save_handling import Save
     from .rng import RandomNumberGenerator
+    from .dungeon.creature_table import CreatureTable
 from .gamestates import *
-from .fov import compute_fov
+from .events import Event, EventBus, EventType
+from .fov import compute_fov, has_line_of_sight, VisibilityBuffer
+from .pathfinding import a_star_planned_path_to
+from .dungeon.floor import FloorSnapshot
+from .spatial import CreatureIndex
+from .data.config import PARALLEL_AI_DECISIONS, AI_DECISION_WORKERS
 
 
 class Engine:
@@ -28,14 +42,24 @@ class Engine:
         self.save_meta: Optional[dict[str, Any]] = save.metadata
         self.player: Optional[Player] = save.data.get("dummy")
         self.dungeon: Optional[Dungeon] = None
-        self.message_log: Optional[MessageLog] = None
+        # What happens in the game, for the message log and anyone else.
+        self.events = EventBus()
+        self.events.subscribe(self._count_slaying, EventType.DEATH)
+        self._message_log: Optional[MessageLog] = None
         self.rng: Optional[RandomNumberGenerator] = None
         self.terminal_controller = terminal_controller
+        # Your actions this game, if it's being recorded.
+        self.replay: Optional[Replay] = None
 
         self.gamestate = gamestate
         
         # Displayed and refreshed at runtime.
-        self.tiles_in_fov: dict[tuple[int, int], Tile] = {}
+        self.fov = VisibilityBuffer()
+
+        # Worker processes for creature pathfinding, started when first needed.
+        self._ai_executor: Optional[Executor] = None
+        # Where creatures stand this turn, built when first needed.
+        self._creature_index: Optional[CreatureIndex] = None
 
 
     def run(self):
@@ -45,39 +69,107 @@ class Engine:
         while True:
             self.display()
             turnable: bool = self.get_valid_action()
-            if not turnable:
-                continue
-            self.process()
+            if turnable:
+                self.process()
+            if self.replay is not None:
+                self.replay.checkpoint(self)
+
+
+    @property
+    def message_log(self) -> Optional[MessageLog]:
+        return self._message_log
+
+
+    @message_log.setter
+    def message_log(self, message_log: Optional[MessageLog]) -> None:
+        # Have the game's events written into whichever log is in use.
+        if self._message_log is not None:
+            self.events.unsubscribe(self._message_log.log_event)
+        self._message_log = message_log
+        if message_log is not None:
+            self.events.subscribe(message_log.log_event)
+
+
+    def _count_slaying(self, event: Event) -> None:
+        """Record the player's kills towards the save's stats"""
+        if event.source is self.player:
+            self.save_meta["slayed"] += 1
+
+
+    @property
+    def creature_index(self) -> CreatureIndex:
+        """Creatures on the current floor bucketed by position this turn"""
+        if self._creature_index is None:
+            self._creature_index = CreatureIndex(
+                self.dungeon.current_floor.living_creatures)
+        return self._creature_index
+
+
+    def reindex_creature(self, creature: Creature) -> None:
+        """Keep this turn's creature index in step with a creature that went
+        further than a step, e.g. a dormant one hopping rooms
+        """
+        if self._creature_index is not None:
+            self._creature_index.move(creature)
 
 
     def display(self) -> None:
         """Display the game to the screen"""
-        # Player's field of view.
+        self.update_fov()
+        self.gamestate.render(self)
+
+
+    def update_fov(self) -> None:
+        """Work out what the player can see, when exploring"""
         if isinstance(
             self.gamestate,
             (ExploreState, GameEndState, ProjectileTargetState)
         ):
             floor: Floor = self.dungeon.current_floor
-            
-            def mark_visible(x: int, y: int) -> None:
-                if floor.tiles[x][y].char == WALL_TILE:
-                    floor.explored_tiles[(x, y)] = wall_tile_dim
-                    self.tiles_in_fov[(x, y)] = wall_tile
-                elif floor.tiles[x][y].char == FLOOR_TILE:
-                    floor.explored_tiles[(x, y)] = floor_tile_dim
-                    self.tiles_in_fov[(x, y)] = floor_tile
+            tiles: list[bytearray] = floor.tiles
+            self.fov.start(floor.width, floor.height)  # Refresh.
             
             def is_blocking(x: int, y: int) -> bool:
-                return not floor.tiles[x][y].walkable
+                return not TILE_TRANSPARENT[tiles[x][y]]
             
             compute_fov(
                 origin=(self.player.x, self.player.y),
                 is_blocking=is_blocking,
-                mark_visible=mark_visible
+                mark_visible=self.fov.mark_visible
             )
+            floor.reveal(self.fov.mask)
 
-        self.gamestate.render(self)
-        self.tiles_in_fov = {}  # Refresh.
+
+    def in_player_sight(self, x: int, y: int, max_distance: float) -> bool:
+        """Check if a tile within range has a clear line to the player.
+
+        Always traced as a straight line, never read off the player's field of
+        view, so the answer doesn't depend on whether the player has moved
+        since it was computed.
+        """
+        floor: Floor = self.dungeon.current_floor
+        player_pos: tuple[int, int] = (self.player.x, self.player.y)
+
+        def is_blocking(x: int, y: int) -> bool:
+            return not TILE_TRANSPARENT[floor.tiles[x][y]]
+
+        return has_line_of_sight((x, y), player_pos, is_blocking, max_distance)
+
+
+    def get_checksum(self) -> str:
+        """Hash the whole state of the game, to tell if two runs of it went
+        exactly the same way.
+
+        Covers the dungeon's floors and everything on them (the player and
+        their inventory included), the random number generator, and turns
+        taken. Cheap enough to take every turn, since floors the player is
+        not on get hashed only once.
+        """
+        checksum = hashlib.blake2b(self.dungeon.get_checksum(), digest_size=16)
+        version, internal_state, gauss_next = random.getstate()
+        checksum.update(array("I", internal_state).tobytes())
+        checksum.update(repr((gauss_next, self.save_meta["turns"])).encode())
+        return checksum.hexdigest()
 
 
     def get_valid_action(self) -> bool:
@@ -90,6 +182,8 @@ class Engine:
  
             action_or_state = self.gamestate.handle_input(player_input)
 
+        if self.replay is not None:
+            self.replay.record(self.gamestate, action_or_state)
         turnable: bool = self.gamestate.perform(self, action_or_state)
         return turnable
 
@@ -102,19 +196,117 @@ class Engine:
                 self.gamestate = LevelUpSelectionState(self.player)
                 return
 
-            creatures = self.dungeon.current_floor.creatures
-            for creature in creatures:
+            floor: Floor = self.dungeon.current_floor
+            self._creature_index = None  # Refresh.
+            planned_ais: list[BaseAI] = []
+            if PARALLEL_AI_DECISIONS:
+                planned_ais = self.plan_creature_turns(floor)
+            # Give everyone their energy up front when stored in columns.
+            table: Optional[CreatureTable] = floor.creature_table
+            if table is not None:
+                table.gain_energy()
+            # Creatures dying mid-turn get moved to the corpses.
+            for creature in list(floor.living_creatures):
                 if not creature.get_component("ai") or \
-                    not creature.get_component("fighter"):
+                    not creature.get_component("fighter") or \
+                    creature.fighter.is_dead:
+                    if table is not None:
+                        # Wouldn't have gained any, e.g. slain before its turn.
+                        creature.energy -= creature.energy_gain_per_turn
                     continue
-                if not creature.fighter.is_dead:
-                    creature.take_turn(self)
-        
+                creature.take_turn(self, gain_energy=table is None)
+            floor.noise_locations.clear()  # Noises only last for the turn.
+            # So do planned paths, some of which might have gone unused.
+            for ai in planned_ais:
+                ai.forget_path()
+
             # Check if player has died.
             if (
                 self.player.fighter.is_dead
                 and isinstance(self.gamestate, ExploreState)
             ):
                 self.gamestate = GameOverEndState(self.player)
-                self.message_log.add("Game over!", color="blue")
+                self.events.emit(EventType.GAME_OVER, self.player)
+
+
+    def plan_creature_turns(self, floor: Floor) -> list[BaseAI]:
+        """Work out the paths of creatures due this turn across processes.
+
+        Paths are found on a frozen snapshot of the floor taken before anyone
+        moves, handed to the workers once through shared memory. Creatures
+        then still take their turns one by one in floor order, finding a new
+        path if anyone has since come or gone from where theirs was searched
+        for, so the game plays out just as it would with this turned off.
+        """
+        requests: list[tuple[BaseAI, tuple[tuple[int, int], ...]]] = []
+        for creature in floor.living_creatures:
+            ai: Optional[BaseAI] = creature.get_component("ai")
+            fighter: Optional[Fighter] = creature.get_component("fighter")
+            if not ai or not fighter or fighter.is_dead or not creature.is_due:
+                continue
+            request = ai.path_request(self)
+            if request is not None:
+                requests.append((ai, request))
+        if requests == []:
+            return []
+
+        # Only loaded when turned on, as they're slow to import.
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing.shared_memory import SharedMemory
+
+        snapshot = FloorSnapshot(floor)
+        data: bytes = pickle.dumps(snapshot)
+        shared_snapshot = SharedMemory(create=True, size=len(data))
+        try:
+            shared_snapshot.buf[:len(data)] = data
+            if self._ai_executor is None:
+                self._ai_executor = ProcessPoolExecutor(AI_DECISION_WORKERS)
+
+            # A chunk of paths for each worker.
+            chunk_size: int = math.ceil(len(requests) / AI_DECISION_WORKERS)
+            chunks: list[list[tuple[tuple[int, int], ...]]] = [
+                [request for _, request in requests[i:i + chunk_size]]
+                for i in range(0, len(requests), chunk_size)
+            ]
+            planned_paths = list(chain.from_iterable(self._ai_executor.map(
+                _plan_paths,
+                repeat(shared_snapshot.name),
+                repeat(len(data)),
+                chunks
+            )))
+        finally:
+            shared_snapshot.close()
+            shared_snapshot.unlink()
+
+        for (ai, (start, goal)), (path, area) in zip(requests, planned_paths):
+            ai.receive_path(start, goal, path, snapshot, area)
+        return [ai for ai, _ in requests]
+
+
+    def shut_down_ai_workers(self) -> None:
+        """Stop the processes creature paths are worked out on, if started"""
+        if self._ai_executor is not None:
+            self._ai_executor.shutdown()
+            self._ai_executor = None
+
+
 
+def _plan_paths(
+        snapshot_name: str,
+        snapshot_size: int,
+        requests: list[tuple[tuple[int, int], ...]]
+) -> list[tuple[list[tuple[int, int]], tuple[int, int, int, int]]]:
+    """Find a chunk of creature paths on the floor snapshot shared this turn,
+    in a worker process
+    """
+    from multiprocessing.shared_memory import SharedMemory
+    shared_snapshot = SharedMemory(snapshot_name)
+    try:
+        snapshot: FloorSnapshot = pickle.loads(
+            bytes(shared_snapshot.buf[:snapshot_size]))
+    finally:
+        shared_snapshot.close()
+    return [
+        a_star_planned_path_to(snapshot, *start, *goal)
+        for start, goal in requests
+    ]
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
-import copy
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
-    from .components.base_component import BaseComponent
     from .color import Color
     from .engine import Engine
     from .dungeon.floor import Floor
+    from .dungeon.creature_table import CreatureTable
     from .item_types import WeaponType, ProjectileType, ArmorType, PotionType
+from .components.base_component import BaseComponent
+from .templates import EntityTemplate
 from .render_order import RenderOrder
+from .factions import Faction
 
 
 class Entity:
-    """A generic entity that creatures and objects derive from"""
+    """A generic entity that creatures and objects derive from.
+
+    Entities are made by the thousands, so each kind has a fixed set of slots
+    rather than a dict, including a slot for every component it can be given.
+    """
+    __slots__ = (
+        "floor", "_x", "_y", "name", "char", "color", "_render_order",
+        "blocking"
+    )
     
     def __init__(self,
                  x: int,
@@ -23,6 +33,7 @@ class Entity:
                  color: str,
                  render_order: RenderOrder,
                  blocking: bool):
+        self.floor: Optional[Floor] = None  # Set once added to a floor.
         self.x = x
         self.y = y
         self.name = name
@@ -32,6 +43,47 @@ class Entity:
         self.blocking = blocking
     
 
+    @property
+    def x(self) -> int:
+        return self._x
+    
+
+    @x.setter
+    def x(self, x: int) -> None:
+        # Keep the floor's cell index in step with where this stands.
+        if self.floor is not None:
+            self.floor.relocate_entity(self, x, self._y)
+        self._x = x
+    
+
+    @property
+    def y(self) -> int:
+        return self._y
+    
+
+    @y.setter
+    def y(self, y: int) -> None:
+        if self.floor is not None:
+            self.floor.relocate_entity(self, self._x, y)
+        self._y = y
+    
+
+    @property
+    def render_order(self) -> RenderOrder:
+        return self._render_order
+    
+
+    @render_order.setter
+    def render_order(self, render_order: RenderOrder) -> None:
+        # Re-add to the floor so it gets drawn in its new place, e.g. corpses.
+        floor: Optional[Floor] = self.floor
+        if floor is not None:
+            floor.remove_entity(self)
+        self._render_order = render_order
+        if floor is not None:
+            floor.add_entity(self)
+    
+
     def get_component(self, name: str) -> Optional[BaseComponent]:
         return getattr(self, name, None)
     
@@ -45,15 +97,39 @@ class Entity:
         delattr(self, name)
     
     def spawn_clone(self) -> Entity:
-        return copy.deepcopy(self)
+        """Make a copy of this to place somewhere.
+
+        Only its components get copied in turn, everything else is shared.
+        See EntityTemplate for making many copies of the same entity.
+        """
+        return EntityTemplate(self).spawn()
+    
+
+    def get_state(self) -> tuple:
+        """Sum up where it is and how it's doing, for checksums"""
+        state: list = [
+            type(self).__name__,
+            self.name,
+            self.x,
+            self.y,
+            self.render_order.value
+        ]
+        for name in ("fighter", "leveler", "inventory"):
+            component: Optional[BaseComponent] = self.get_component(name)
+            if component is not None:
+                state.append(component.get_state())
+        return tuple(state)
 
 
 class Furniture(Entity):
     """An impassable, inanimate piece of furnature fixed to the ground"""
+    __slots__ = ("inventory",)
 
 
 class Item(Entity):
     """A holdable or usable thing to a creature"""
+    __slots__ = (
+        "parent", "equippable", "consumable", "projectable", "relic", "glyph")
     parent: Optional[Creature]
     
     def place(self, floor: Floor, x: int, y: int) -> None:
@@ -66,25 +142,35 @@ class Item(Entity):
 
 class Potion(Item):
     """An item to be consumed"""
+    __slots__ = ()
 
 
 class Weapon(Item):
     """An item that deals damage"""
+    __slots__ = ("weapon_type",)
     weapon_type: WeaponType
 
 
 class Staff(Weapon):
     """A long rod of magical uses"""
+    __slots__ = ("projectile_type",)
     projectile_type: ProjectileType
 
 
 class Armor(Item):
     """An item to be worn and offers protection"""
+    __slots__ = ("armor_type",)
     armor_type: ArmorType
 
 
 class Creature(Entity):
     """A moving, living, wandering thing"""
+    __slots__ = (
+        "og_name", "energy_gain_per_turn", "_energy", "faction", "_table",
+        "_row", "fighter", "leveler", "inventory", "ai"
+    )
+    ENERGY_THRESHOLD: int = 10
+    FACTION: Faction = Faction.MONSTER  # Whose side it starts out on.
 
     def __init__(self,
                  x: int,
@@ -98,24 +184,73 @@ class Creature(Entity):
         super().__init__(x, y, name, char, color, render_order, blocking)
         self.og_name = name  # Track old name after name change upon death.
         self.energy_gain_per_turn = energy
+        # Row of its floor's creature table holding its energy, if any.
+        self._table: Optional[CreatureTable] = None
+        self._row: Optional[int] = None
         self.energy = energy
+        self.faction: Faction = self.FACTION  # Whose side it fights on.
+    
+
+    def spawn_clone(self) -> Creature:
+        # Energy may be in a creature table, which the copy isn't part of.
+        clone: Creature = super().spawn_clone()
+        clone._energy = self.energy
+        clone._table = clone._row = None
+        return clone
+    
+
+    @property
+    def energy(self) -> int:
+        if self._table is None:
+            return self._energy
+        return self._table.energy[self._row]
+    
+
+    @energy.setter
+    def energy(self, energy: int) -> None:
+        if self._table is None:
+            self._energy = energy
+        else:
+            self._table.energy[self._row] = energy
     
 
     def move(self, dx: int, dy: int) -> None:
         self.x += dx
         self.y += dy
     
+
+    def get_state(self) -> tuple:
+        ai: Optional[BaseComponent] = self.get_component("ai")
+        return super().get_state() + (
+            self.energy,
+            self.faction.value,
+            type(ai).__name__ if ai is not None else None
+        )
+    
     
-    def take_turn(self, engine: Engine) -> None:
-        """If monster has enough energy, perform its turn"""
-        ENERGY_THRESHOLD: int = 10
+    @property
+    def is_due(self) -> bool:
+        """Check if monster will have enough energy to act on its next turn"""
+        return (
+            self.energy + self.energy_gain_per_turn >= self.ENERGY_THRESHOLD)
+
+
+    def take_turn(self, engine: Engine, gain_energy: bool = True) -> None:
+        """If monster has enough energy, perform its turn.
+
+        Energy for the turn may have already been given, see
+        CreatureTable.gain_energy.
+        """
         if self.ai:
-            self.energy += self.energy_gain_per_turn
-            if self.energy >= ENERGY_THRESHOLD:
+            if gain_energy:
+                self.energy += self.energy_gain_per_turn
+            if self.energy >= self.ENERGY_THRESHOLD:
                 self.ai.perform(engine)
-                self.energy -= ENERGY_THRESHOLD  # Expend energy.
+                self.energy -= self.ENERGY_THRESHOLD  # Expend energy.
 
 
 class Player(Creature):
     """A special and heroic creature controlled by you, Player"""
+    __slots__ = ()
+    FACTION: Faction = Faction.PLAYER
 
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from .entities import Entity
+
+
+class EventType(Enum):
+    """Things that happen in the game worth telling others about.
+
+    ATTACK - source hits target for amount of damage.
+    CRITICAL - same as ATTACK, but a critical hit.
+    MISS - source misses target.
+    DOUBLE_HIT - source gets to hit target twice this turn.
+    DEATH - source slays target, worth amount of experience.
+    PICKUP - source picks up target item.
+    LEVEL_UP - source reaches level amount.
+    DROP - source drops target item.
+    EQUIP - source equips target item.
+    UNEQUIP - source unequips target item.
+    DRINK - source drinks target potion, regaining amount points.
+    ALREADY_FULL - source has no need to drink target potion.
+    LIGHTNING - source strikes target with lightning for amount of damage,
+        vaporizing it if an item.
+    HEAL - source heals target for amount of health.
+    RIZZ - source rizzes up target.
+    CONFUSE - source confuses target.
+    FREEZE - source freezes target.
+    SPELL_FAILED - source item's spell can't be cast at target, if any.
+    OUT_OF_CHARGE - source has no charge left in target item.
+    RIZZ_ENDED - source is no longer rizzed up.
+    CONFUSION_ENDED - source is no longer confused.
+    FREEZE_ENDED - source is no longer frozen.
+    WAIT - source takes no action.
+    OUT_OF_BOUNDS - source tries to walk off the floor.
+    PATH_BLOCKED - source walks into a wall.
+    NOTHING_TO_PICK_UP - source finds no item to pick up.
+    INVENTORY_FULL - source has no room for target item.
+    DESCEND - source descends a level.
+    ASCEND - source ascends a level.
+    CANT_DESCEND - source isn't on a staircase down.
+    CANT_ASCEND - source isn't on a staircase up.
+    RELIC_MISSING - source can't leave the dungeon without the relic.
+    GLYPH_PLACED - source places a glyph, amount placed so far.
+    PEDESTAL_FULL - source finds a glyph already on the pedestal.
+    NO_GLYPH - source has no glyph to place.
+    PASSAGE_REVEALED - source reveals the passage to the relic.
+    GAME_OVER - source has fallen.
+    DEFEAT - source's defeat is saved.
+    VICTORY - source makes it out of the dungeon.
+
+    """
+    ATTACK = auto()
+    CRITICAL = auto()
+    MISS = auto()
+    DOUBLE_HIT = auto()
+    DEATH = auto()
+    PICKUP = auto()
+    LEVEL_UP = auto()
+    DROP = auto()
+    EQUIP = auto()
+    UNEQUIP = auto()
+    DRINK = auto()
+    ALREADY_FULL = auto()
+    LIGHTNING = auto()
+    HEAL = auto()
+    RIZZ = auto()
+    CONFUSE = auto()
+    FREEZE = auto()
+    SPELL_FAILED = auto()
+    OUT_OF_CHARGE = auto()
+    RIZZ_ENDED = auto()
+    CONFUSION_ENDED = auto()
+    FREEZE_ENDED = auto()
+    WAIT = auto()
+    OUT_OF_BOUNDS = auto()
+    PATH_BLOCKED = auto()
+    NOTHING_TO_PICK_UP = auto()
+    INVENTORY_FULL = auto()
+    DESCEND = auto()
+    ASCEND = auto()
+    CANT_DESCEND = auto()
+    CANT_ASCEND = auto()
+    RELIC_MISSING = auto()
+    GLYPH_PLACED = auto()
+    PEDESTAL_FULL = auto()
+    NO_GLYPH = auto()
+    PASSAGE_REVEALED = auto()
+    GAME_OVER = auto()
+    DEFEAT = auto()
+    VICTORY = auto()
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """A compact record of something that happened"""
+    type: EventType
+    source: Entity
+    target: Optional[Entity] = None
+    amount: int = 0
+
+
+EventHandler = Callable[[Event], None]
+
+
+class EventBus:
+    """Passes events on from whoever emits them to whoever subscribed.
+
+    Events are only made when someone is listening, so nothing gets built up
+    (or worded into messages) for a headless run that doesn't care for them.
+    """
+
+    def __init__(self):
+        self._handlers: dict[EventType, list[EventHandler]] = {
+            event_type: [] for event_type in EventType}
+
+
+    def subscribe(self, handler: EventHandler, *event_types: EventType) -> None:
+        """Have a handler called on events of the given types, or on all"""
+        for event_type in event_types or EventType:
+            self._handlers[event_type].append(handler)
+
+
+    def unsubscribe(self, handler: EventHandler) -> None:
+        """Stop a handler being called on any more events"""
+        for handlers in self._handlers.values():
+            if handler in handlers:
+                handlers.remove(handler)
+
+
+    def emit(self,
+             type: EventType,
+             source: Entity,
+             target: Optional[Entity] = None,
+             amount: int = 0) -> None:
+        """Let the handlers of an event type know it happened"""
+        handlers: list[EventHandler] = self._handlers[type]
+        if not handlers:
+            return
+        event = Event(type, source, target, amount)
+        for handler in handlers:
+            handler(event)
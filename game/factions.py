@@ -0,0 +1,25 @@
+from enum import Enum
+
+
+class Faction(Enum):
+    """Sides a creature can fight for.
+
+    PLAYER - you, and any creature swayed over to your side.
+    MONSTER - the dungeon's inhabitants.
+
+    """
+    PLAYER = 0
+    MONSTER = 1
+
+
+# Whether a faction (row) attacks another faction (column).
+_HOSTILITY: tuple[tuple[bool, ...], ...] = (
+    #  PLAYER  MONSTER
+    (False,  True),   # PLAYER
+    (True,   False),  # MONSTER
+)
+
+
+def is_hostile(faction: Faction, other: Faction) -> bool:
+    """Check if a faction is out to attack another"""
+    return _HOSTILITY[faction.value][other.value]
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import math
 from fractions import Fraction
-from typing import Optional, Generator
+from typing import Optional, Generator, Iterator
 
+from .pathfinding import bresenham_line
 from .data.config import MAX_FOV_DISTANCE
 
 
@@ -71,6 +72,95 @@ def compute_fov(
         scan(first_row)
 
 
+def has_line_of_sight(
+    origin: tuple[int, int],
+    target: tuple[int, int],
+    is_blocking: callable[tuple[int, int], bool],
+    max_distance: float = MAX_FOV_DISTANCE
+) -> bool:
+    """Check if there's a clear straight line between two tiles in range.
+    
+    Rejects by distance before tracing anything, then stops tracing at the
+    first blocking tile found along the line.
+    """
+    if math.dist(origin, target) > max_distance:
+        return False
+    return not any(
+        is_blocking(x, y) for x, y in bresenham_line(*origin, *target))
+
+
+class VisibilityBuffer:
+    """The cells in a field of view, reused from one computation to the next.
+
+    Holds a mask shaped like the floor, one byte per cell row by row, along
+    with a list of the visible cells. The previous field of view is kept
+    around to tell what came into or went out of view.
+    """
+
+
+    def __init__(self):
+        self.width = 0
+        self.height = 0
+        self.mask = bytearray()
+        self.cells: list[tuple[int, int]] = []
+        self._previous_mask = bytearray()
+        self._previous_cells: list[tuple[int, int]] = []
+
+
+    def start(self, width: int, height: int) -> None:
+        """Clear out the buffer for a new field of view on a floor"""
+        if (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            self.mask = bytearray(width * height)
+            self._previous_mask = bytearray(width * height)
+            self.cells.clear()
+            self._previous_cells.clear()
+
+        # Reuse the oldest mask, only unsetting the cells that were set.
+        for x, y in self._previous_cells:
+            self._previous_mask[x * self.width + y] = 0
+        self._previous_cells.clear()
+        self.mask, self._previous_mask = self._previous_mask, self.mask
+        self.cells, self._previous_cells = self._previous_cells, self.cells
+
+
+    def mark_visible(self, x: int, y: int) -> None:
+        """Add a cell to the field of view"""
+        index: int = x * self.width + y
+        if not self.mask[index]:  # Quadrants overlap along their edges.
+            self.mask[index] = 1
+            self.cells.append((x, y))
+
+
+    def is_visible(self, x: int, y: int) -> bool:
+        """Check if a cell is in the field of view"""
+        return (
+            0 <= x < self.height and 0 <= y < self.width
+            and self.mask[x * self.width + y] == 1
+        )
+
+
+    def was_visible(self, x: int, y: int) -> bool:
+        """Check if a cell was in the previous field of view"""
+        return (
+            0 <= x < self.height and 0 <= y < self.width
+            and self._previous_mask[x * self.width + y] == 1
+        )
+
+
+    def newly_visible(self) -> Iterator[tuple[int, int]]:
+        """Cells that have come into view since the previous field of view"""
+        return (cell for cell in self.cells if not self.was_visible(*cell))
+
+
+    def newly_hidden(self) -> Iterator[tuple[int, int]]:
+        """Cells that have gone out of view since the previous field of view"""
+        return (
+            cell for cell in self._previous_cells
+            if not self.is_visible(*cell)
+        )
+
+
 class Quadrant:
     """Represent a 90-degree sector pointing north, south, east, west
     
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from .entities import Weapon
 from .actions import *
 from .components.fighter import Fighter
-from .save_handling import Save, get_new_game, fetch_saves
+from .save_handling import Save, fetch_saves
 
 # In order, if applicable: arrow keys, numpad keys, and vi keys. Separated
 # so as to not read vi keys when typing characters.
@@ -147,7 +147,7 @@ class State(AbstractState):
         """Display the map, message_log, and sidebars"""
         engine.terminal_controller.ensure_right_terminal_size()
         engine.terminal_controller.display_map(
-            engine.dungeon.current_floor, engine.tiles_in_fov)
+            engine.dungeon.current_floor, engine.fov)
         engine.terminal_controller.display_message_log(engine.message_log)
         engine.terminal_controller.display_sidebar(
             engine.dungeon, engine.player)
@@ -428,7 +428,7 @@ class EnterGameConfigState(IndexableOptionsState):
                     gamemode: GameMode = GameMode.NORMAL \
                         if self._config.is_normal_gamemode else GameMode.ENDLESS
                     action_or_state = StartNewGameAction(
-                        get_new_game(gamemode, self._prev_state.cursor_index_y),
+                        gamemode,
                         self._prev_state.saves_dir,
                         self._prev_state.cursor_index_y,
                         player_name="".join(self._config.player_name),
@@ -559,8 +559,8 @@ class ContinueGameMenuState(ListSavesMenuState):
 
         if player_input in CONFIRM_KEYS:
             save: Save = self.saves[self.cursor_index_y]
-            # Can't continue an empty save.
-            if save.is_empty:
+            # Can't continue an empty save, or one this version can't load.
+            if save.is_empty or save.is_incompatible:
                 action_or_state = DoNothingAction(self.parent)
             
             # TODO add info box showing you can't continue save.
@@ -604,8 +604,10 @@ class GameEndState(State):
         turnable: bool = super().perform(engine, action_or_state)
 
         if isinstance(action_or_state, OnPlayerDeathAction):
+            engine.shut_down_ai_workers()
             engine.gamestate = MainMenuState(self.parent)
         elif isinstance(action_or_state, OnPlayerWinAction):
+            engine.shut_down_ai_workers()
             engine.gamestate = MainMenuState(self.parent)
 
 
@@ -734,6 +736,7 @@ class ExploreState(State):
         turnable: bool = super().perform(engine, action_or_state)
 
         if isinstance(action_or_state, SaveAction):
+            engine.shut_down_ai_workers()
             engine.gamestate = MainMenuState(self.parent)
         
         return turnable
@@ -793,11 +796,11 @@ class ProjectileTargetState(State):
 
     def render(self, engine: Engine) -> None:
         map_window: curses.window = engine.terminal_controller.display_map(
-            engine.dungeon.current_floor, engine.tiles_in_fov)
+            engine.dungeon.current_floor, engine.fov)
         new_cursor_pos: tuple[int, int] = \
             engine.terminal_controller.display_projectile_target(
-            map_window, engine.player, engine.tiles_in_fov,
-            self.cursor_index_x, self.cursor_index_y
+            map_window, engine.dungeon.current_floor, engine.player,
+            engine.fov, self.cursor_index_x, self.cursor_index_y
         )
         self.cursor_index_x, self.cursor_index_y = new_cursor_pos
 
@@ -1,5 +1,14 @@
+from __future__ import annotations
+
+import textwrap
 from collections import deque
 from enum import Enum, auto
+from typing import Optional
+
+from .entities import Item, Player
+from .events import Event, EventType
+from .item_types import PotionType
+from .data.config import MESSAGE_HISTORY_SIZE
 
 
 class MessageType(Enum):
@@ -26,12 +35,47 @@ class Message:
         
         if debug:
             self.message = "[DEBUG] " + self.message
+        
+        # Wrapped lines from the last time it was drawn, and at what width.
+        self._lines: Optional[list[str]] = None
+        self._lines_width: int = 0
+    
+    
+    def __getstate__(self) -> dict:
+        # Wrapped lines are only for drawing, so leave them out of saves.
+        state: dict = self.__dict__.copy()
+        state["_lines"] = None
+        state["_lines_width"] = 0
+        return state
     
     
     def __str__(self):
         if self.count > 1:
             return f"{self.message} x{self.count}"
         return self.message
+    
+    
+    def get_lines(self, width: int) -> list[str]:
+        """Get the message wrapped to fit a width, only worked out again
+        once the message changes
+        """
+        if self._lines is None or self._lines_width != width:
+            self._lines = textwrap.wrap(str(self), width) or [""]
+            self._lines_width = width
+        return self._lines
+    
+    
+    def chain(self, message: Message) -> None:
+        """Attach another message onto the end of this one"""
+        self.message += "; " + message.message
+        self.chained_messages += 1
+        self._lines = None
+    
+    
+    def repeat(self) -> None:
+        """Count the message as having happened once more"""
+        self.count += 1
+        self._lines = None
 
 
 class MessageLog:
@@ -44,10 +88,44 @@ class MessageLog:
         debug=False,
         color="blue"
     )
+    # Events that always read the same, and in what color.
+    EVENT_MESSAGES: dict[EventType, tuple[str, str]] = {
+        EventType.OUT_OF_CHARGE: ("The staff fizzles with no charge left", ""),
+        EventType.WAIT: ("You take no action", ""),
+        EventType.OUT_OF_BOUNDS: ("Out of bounds", "red"),
+        EventType.PATH_BLOCKED: ("That way is blocked", "red"),
+        EventType.NOTHING_TO_PICK_UP: ("Nothing to be picked up here", "red"),
+        EventType.INVENTORY_FULL: (
+            "There is not enough space in your inventory", "red"),
+        EventType.DESCEND: ("You descend a level...", "blue"),
+        EventType.ASCEND: ("You ascend a level...", "blue"),
+        EventType.CANT_DESCEND: ("Can't descend here", "red"),
+        EventType.CANT_ASCEND: ("Can't ascend here", "red"),
+        EventType.RELIC_MISSING: ("You must bring back the relic first!", ""),
+        EventType.PEDESTAL_FULL: ("Pedestal already has glyph", ""),
+        EventType.NO_GLYPH: ("You do not have a glyph!", ""),
+        EventType.PASSAGE_REVEALED: (
+            "A hidden passageway has been revealed!", "blue"),
+        EventType.GAME_OVER: ("Game over!", "blue"),
+        EventType.DEFEAT: ("You have been defeated!", "red"),
+        EventType.VICTORY: ("You made it out of the dungeon!", "gold"),
+    }
     
-    def __init__(self):
-        self.messages: deque = deque([self.START_MESSAGE])
-        self.history: deque = deque([self.START_MESSAGE])    
+    def __init__(self, spill_location: Optional[str] = None):
+        # Only the latest messages are kept, with older ones dropped or, if
+        # given a file, written out to it.
+        self.messages: deque = deque(
+            [self.START_MESSAGE], maxlen=MESSAGE_HISTORY_SIZE)
+        self.history: deque = deque(
+            [self.START_MESSAGE], maxlen=MESSAGE_HISTORY_SIZE)
+        self.spill_location = spill_location
+
+        # Start afresh from whatever an earlier game in the slot left.
+        if self.spill_location is not None:
+            try:
+                open(self.spill_location, "w").close()
+            except OSError:
+                pass
     
     @property
     def size(self) -> int:
@@ -79,18 +157,147 @@ class MessageLog:
             and new_message.type == MessageType.ENEMY_ATTACK
             and self.prev_message.chained_messages < self.MAX_CHAINS
         ):
-            self.prev_message.message += "; " + new_message.message
-            self.prev_message.chained_messages += 1
+            self.prev_message.chain(new_message)
             return
         
         # Message is the same as the previous.
         if new_message.message == self.prev_message.message:
-            self.messages[0].count += 1
+            self.messages[0].repeat()
             return
 
+        if len(self.history) == self.history.maxlen:
+            self.spill(self.history[-1])
         self.messages.appendleft(new_message)
         self.history.appendleft(new_message)
     
     
+    def log_event(self, event: Event) -> None:
+        """Put an event from the game into words, if it's one you'd see"""
+        source, target = event.source, event.target
+
+        if event.type in self.EVENT_MESSAGES:
+            message, color = self.EVENT_MESSAGES[event.type]
+            self.add(message, color=color)
+
+        elif event.type == EventType.MISS:
+            if isinstance(target, Player):
+                self.add(f"{source.og_name} missed you",
+                         type=MessageType.ENEMY_ATTACK, color="blue")
+            elif isinstance(source, Player):
+                self.add(f"You missed {target.og_name}",
+                         type=MessageType.PLAYER_ATTACK, color="red")
+
+        elif event.type in (EventType.ATTACK, EventType.CRITICAL):
+            critical: str = " !!!" if event.type == EventType.CRITICAL else ""
+            if isinstance(target, Player):
+                self.add(
+                    f"{source.og_name} hits you for {event.amount} pts"
+                    + critical,
+                    type=MessageType.ENEMY_ATTACK, color="red")
+            elif isinstance(source, Player):
+                self.add(
+                    f"You hit {target.og_name} for {event.amount} pts"
+                    + critical,
+                    type=MessageType.PLAYER_ATTACK, color="blue")
+
+        elif event.type == EventType.DOUBLE_HIT:
+            if isinstance(source, Player):
+                self.add("Double hit!", color="green")
+
+        elif event.type == EventType.DEATH:
+            self.add(f"{target.og_name} has perished!")
+            if isinstance(source, Player):
+                self.add(f"You slayed {target.og_name} "
+                         f"and gained {event.amount} EXP!",
+                         type=MessageType.INFO, color="green")
+
+        elif event.type == EventType.PICKUP:
+            self.add(f"You picked up: {target.name.lower()}", color="blue")
+
+        elif event.type == EventType.LEVEL_UP:
+            self.add(f"Leveled up to {event.amount}",
+                     type=MessageType.INFO, color="green")
+
+        elif event.type == EventType.DROP:
+            self.add(f"You dropped: {target.name.lower()}", color="blue")
+
+        elif event.type == EventType.EQUIP:
+            self.add(f"{target.name} has been equipped")
+
+        elif event.type == EventType.UNEQUIP:
+            self.add(f"{target.name} has been unequipped")
+
+        elif event.type == EventType.DRINK:
+            point_regain_type: str = (
+                "hp" if target.consumable.potion_type == PotionType.HEALTH
+                else "mp")
+            self.add(f"{source.name} drinks {target.name} for "
+                     f"{event.amount} {point_regain_type}!")
+
+        elif event.type == EventType.ALREADY_FULL:
+            if target.consumable.potion_type == PotionType.HEALTH:
+                self.add("Health already full!")
+            else:
+                self.add("Magicka already full!")
+
+        elif event.type == EventType.LIGHTNING:
+            if isinstance(target, Item):
+                self.add(f"The {target.name} vaporizes!", color="blue")
+            else:
+                self.add(f"You cast a bolt of lightning at {target.name}...",
+                         color="blue")
+                self.add(f"for {event.amount} pts!")
+
+        elif event.type == EventType.HEAL:
+            if isinstance(target, Player):
+                self.add("You cast the healing orb on yourself", color="blue")
+                self.add(f"You regained {event.amount} pts!", color="blue")
+            else:
+                self.add(f"You cast the healing orb on {target.name}")
+                self.add(f"It regained {event.amount} pts!", color="blue")
+
+        elif event.type == EventType.RIZZ:
+            self.add(f"{target.name} is temporarily swayed by your rizz!",
+                     color="blue")
+
+        elif event.type == EventType.CONFUSE:
+            self.add(f"You cast a wave of bewilderment upon {target.name}, "
+                     "now stumbling around", color="blue")
+
+        elif event.type == EventType.FREEZE:
+            self.add(f"{target.name} stops in its tracks, completely unable "
+                     "to move", color="blue")
+
+        elif event.type == EventType.SPELL_FAILED:
+            self.add(source.projectable.describe_failure(target))
+
+        elif event.type == EventType.RIZZ_ENDED:
+            self.add(f"{source.name} is no longer under your rizz!")
+
+        elif event.type == EventType.CONFUSION_ENDED:
+            self.add(f"{source.name} is no longer confused")
+
+        elif event.type == EventType.FREEZE_ENDED:
+            self.add(f"{source.name} is no longer frozen")
+
+        elif event.type == EventType.GLYPH_PLACED:
+            self.add(f"You place the glyph on the pedestal ({event.amount}/3)",
+                     color="blue")
+    
+    
+    def spill(self, message: Message) -> None:
+        """Write a message about to be dropped from history out to the log
+        file, if there is one
+        """
+        if self.spill_location is None:
+            return
+        try:
+            with open(self.spill_location, "a") as spill_file:
+                spill_file.write(f"{message}\n")
+        except OSError:
+            pass  # Nothing lost that the game needs.
+    
+    
     def clear(self) -> None:
-        self.messages = deque([self.START_MESSAGE])
\ No newline at end of file
+        self.messages = deque(
+            [self.START_MESSAGE], maxlen=MESSAGE_HISTORY_SIZE)
\ No newline at end of file
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import heapq
-from typing import TYPE_CHECKING, Iterator, TypeVar, Optional
+from typing import TYPE_CHECKING, Iterator, TypeVar, Optional, Union
 
 if TYPE_CHECKING:
-    from .dungeon.floor import Floor
+    from .dungeon.floor import Floor, FloorSnapshot
 
 
-def bresenham_path_to(x1: int, y1: int, x2: int, y2: int) -> list[tuple[int, int]]:
-    """Get a set coordinate points following a path to desired x and y.
-    Useful for FOV and basic pathfinding.
+def bresenham_line(x1: int, y1: int, x2: int, y2: int) -> Iterator[tuple[int, int]]:
+    """Lazily trace the coordinate points of a line between two points.
+
+    The points come out in the order they are traced, which isn't always from
+    the first point to the second, so use `bresenham_path_to()` when a path is
+    needed. Stopping early skips tracing the rest of the line.
     
     Uses Bresenham's algorithm from RogueBasin:
     http://www.roguebasin.com/index.php/Bresenham%27s_Line_Algorithm#Python
@@ -26,12 +29,10 @@ def bresenham_path_to(x1: int, y1: int, x2: int, y2: int) -> list[tuple[int, int
         x1, y1 = y1, x1
         x2, y2 = y2, x2
 
-    # Swap start and end points if necessary and store swap state
-    swapped = False
+    # Swap start and end points if necessary
     if x1 > x2:
         x1, x2 = x2, x1
         y1, y2 = y2, y1
-        swapped = True
 
     # Recalculate differentials
     dx = x2 - x1
@@ -43,16 +44,23 @@ def bresenham_path_to(x1: int, y1: int, x2: int, y2: int) -> list[tuple[int, int
 
     # Iterate over bounding box generating points between start and end
     y = y1
-    points = []
     for x in range(x1, x2 + 1):
-        coord = (y, x) if is_steep else (x, y)
-        points.append(coord)
+        yield (y, x) if is_steep else (x, y)
         error -= abs(dy)
         if error < 0:
             y += ystep
             error += dx
 
-    # Reverse the list if the coordinates were swapped
+
+def bresenham_path_to(x1: int, y1: int, x2: int, y2: int) -> list[tuple[int, int]]:
+    """Get a set coordinate points following a path to desired x and y.
+    Useful for FOV and basic pathfinding.
+    """
+    points: list[tuple[int, int]] = list(bresenham_line(x1, y1, x2, y2))
+
+    # Reverse the list if the line was traced from the desired end
+    is_steep = abs(y2 - y1) > abs(x2 - x1)
+    swapped = y1 > y2 if is_steep else x1 > x2
     if swapped:
         points.reverse()
     return points
@@ -181,7 +189,38 @@ def a_star_path_to(
     goal: GridLocation = (x2, y2)
     graph: WeightedFloorGrid = WeightedFloorGrid(floor, target_enemy)
     came_from = a_star_search(graph, start, goal)
+    return _get_path(came_from, start, goal)
+
+
+def a_star_planned_path_to(
+        floor: Union[Floor, FloorSnapshot],
+        x1: int,
+        y1: int,
+        x2: int,
+        y2: int
+) -> tuple[list[tuple[int, int]], tuple[int, int, int, int]]:
+    """
+    Get an A* path along with the corners of the area of the floor the search
+    looked at, as nothing outside of it could have changed the path
+    """
+    start: GridLocation = (x1, y1)
+    goal: GridLocation = (x2, y2)
+    came_from = a_star_search(WeightedFloorGrid(floor), start, goal)
+
+    # Cells were only checked next to the ones reached.
+    xs: list[int] = [x for x, _ in came_from]
+    ys: list[int] = [y for _, y in came_from]
+    area: tuple[int, int, int, int] = (
+        min(xs) - 1, min(ys) - 1, max(xs) + 1, max(ys) + 1)
+    return _get_path(came_from, start, goal), area
+
 
+def _get_path(
+        came_from: dict[GridLocation, Optional[GridLocation]],
+        start: GridLocation,
+        goal: GridLocation
+) -> list[tuple[int, int]]:
+    """Trace back the path a search found, if any"""
     current: GridLocation = goal
     path: list[GridLocation] = []
     if goal not in came_from:  # No path was found.
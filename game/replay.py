@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+if TYPE_CHECKING:
+    from .entities import Item, Player
+from . import __version__
+from .actions import (
+    Action,
+    ItemAction,
+    HandleSpecialWeaponAction,
+    PickUpItemAction,
+    DropItemAction,
+    StartNewGameAction,
+    LevelUpAction,
+    DoNothingAction,
+    DescendStairsAction,
+    AscendStairsAction,
+    BumpAction
+)
+from .components.fighter import Fighter
+from .engine import Engine
+from .gamestates import (
+    State,
+    ExploreState,
+    ProjectileTargetState,
+    InventoryMenuState,
+    LevelUpSelectionState
+)
+from .modes import GameMode
+from .save_handling import Save
+from .data.config import REPLAY_CHECKSUM_INTERVAL
+
+# A player action in short, e.g. ["bump", 0, 1] or ["drop", 3].
+ActionRecord = list[Union[str, int]]
+
+
+@dataclass
+class Replay:
+    """A game kept as how it started and the actions you took in it.
+
+    Every so many actions the state of the game gets checksummed, so playing
+    it back can tell if it has gone any differently than it did.
+    """
+    gamemode: GameMode
+    player_name: str
+    seed: str
+    random_state: tuple  # Of the random module right before game creation.
+    actions: list[ActionRecord] = field(default_factory=list)
+    checksums: list[str] = field(default_factory=list)
+    checksum_interval: int = REPLAY_CHECKSUM_INTERVAL
+    version: str = __version__
+
+
+    def record(self,
+               gamestate: State,
+               action_or_state: Union[Action, State]) -> None:
+        """Note down an action you're about to take, if it affects the game"""
+        record: Optional[ActionRecord] = encode_action(
+            gamestate, action_or_state)
+        if record is not None:
+            self.actions.append(record)
+
+
+    def checkpoint(self, engine: Engine) -> None:
+        """Checksum the game once another interval of actions has passed"""
+        if len(self.actions) == \
+            (len(self.checksums) + 1) * self.checksum_interval:
+            self.checksums.append(engine.get_checksum())
+
+
+    def save(self, path: Path) -> None:
+        """Write to a file"""
+        data: dict[str, Any] = {
+            "version": self.version,
+            "gamemode": self.gamemode.name,
+            "player_name": self.player_name,
+            "seed": self.seed,
+            "random_state": self.random_state,
+            "checksum_interval": self.checksum_interval,
+            "actions": self.actions,
+            "checksums": self.checksums
+        }
+        with open(path, "w") as replay_file:
+            json.dump(data, replay_file, separators=(",", ":"))
+
+
+    @classmethod
+    def load(cls, path: Path) -> Replay:
+        """Read from a file"""
+        with open(path) as replay_file:
+            data: dict[str, Any] = json.load(replay_file)
+        version, internal_state, gauss_next = data["random_state"]
+        return cls(
+            gamemode=GameMode[data["gamemode"]],
+            player_name=data["player_name"],
+            seed=data["seed"],
+            random_state=(version, tuple(internal_state), gauss_next),
+            actions=data["actions"],
+            checksums=data["checksums"],
+            checksum_interval=data["checksum_interval"],
+            version=data["version"]
+        )
+
+
+def encode_action(gamestate: State,
+                  action_or_state: Union[Action, State]
+                  ) -> Optional[ActionRecord]:
+    """Shorten an action down to what's needed to take it again.
+
+    Only actions that can change the game are kept. Moving cursors around
+    and switching menus are left out, as playing back puts the player right
+    into the gamestate each action was taken from.
+    """
+    if isinstance(gamestate, ExploreState):
+        if isinstance(action_or_state, BumpAction):
+            return ["bump", action_or_state.dx, action_or_state.dy]
+        if isinstance(action_or_state, DoNothingAction):
+            return ["wait"]
+        if isinstance(action_or_state, DescendStairsAction):
+            return ["descend"]
+        if isinstance(action_or_state, AscendStairsAction):
+            return ["ascend"]
+        if isinstance(action_or_state, PickUpItemAction):
+            return ["pick_up"]
+        if isinstance(action_or_state, HandleSpecialWeaponAction):
+            return ["special"]
+
+    elif isinstance(gamestate, ProjectileTargetState):
+        if isinstance(action_or_state, ItemAction):
+            return [
+                "project", gamestate.cursor_index_x, gamestate.cursor_index_y]
+
+    elif isinstance(gamestate, InventoryMenuState):
+        items: list[Item] = gamestate.parent.inventory.items
+        if isinstance(action_or_state, DropItemAction):
+            return ["drop", items.index(action_or_state.item)]
+        if isinstance(action_or_state, ItemAction):
+            return ["use", items.index(action_or_state.item)]
+
+    elif isinstance(gamestate, LevelUpSelectionState):
+        if isinstance(action_or_state, LevelUpAction):
+            return ["level_up", action_or_state.attribute.name]
+
+    return None
+
+
+def decode_action(engine: Engine,
+                  record: ActionRecord) -> tuple[State, Action]:
+    """Get back an action and the gamestate it was taken from"""
+    player: Player = engine.player
+    name, *args = record
+
+    if name == "bump":
+        dx, dy = args
+        return ExploreState(player), BumpAction(player, dx, dy)
+    if name == "wait":
+        return ExploreState(player), DoNothingAction(player)
+    if name == "descend":
+        return ExploreState(player), DescendStairsAction(player)
+    if name == "ascend":
+        return ExploreState(player), AscendStairsAction(player)
+    if name == "pick_up":
+        return ExploreState(player), PickUpItemAction(player)
+    if name == "special":
+        return (
+            ExploreState(player),
+            HandleSpecialWeaponAction(player, player.inventory.weapon)
+        )
+
+    if name == "project":
+        weapon: Item = player.inventory.weapon
+        gamestate = ProjectileTargetState(player, weapon)
+        gamestate.cursor_index_x, gamestate.cursor_index_y = args
+        return gamestate, weapon.projectable.get_action_or_state(player)
+
+    if name == "drop":
+        item: Item = player.inventory.get_item(args[0])
+        return InventoryMenuState(player), DropItemAction(player, item)
+    if name == "use":
+        item: Item = player.inventory.get_item(args[0])
+        return InventoryMenuState(player), ItemAction(player, item)
+
+    if name == "level_up":
+        attribute = Fighter.AttributeType[args[0]]
+        return LevelUpSelectionState(player), LevelUpAction(player, attribute)
+
+    raise ValueError(f"Unknown replay action: {name}")
+
+
+def play_back(replay: Replay) -> Optional[int]:
+    """Take all of a replay's actions again as fast as possible, offscreen.
+
+    Returns how many actions in it first went differently, if it did.
+    """
+    engine = Engine(
+        screen=None,
+        save=Save(-1, None, {}, {}),
+        terminal_controller=None,
+        gamestate=None
+    )
+    random.setstate(replay.random_state)
+    StartNewGameAction(
+        replay.gamemode, None, -1, replay.player_name, replay.seed
+    ).start_game(engine)
+
+    for count, record in enumerate(replay.actions, start=1):
+        engine.gamestate, action = decode_action(engine, record)
+        engine.update_fov()
+        if engine.gamestate.perform(engine, action):
+            engine.process()
+
+        if count % replay.checksum_interval == 0:
+            index: int = count // replay.checksum_interval - 1
+            if (
+                index < len(replay.checksums)
+                and engine.get_checksum() != replay.checksums[index]
+            ):
+                return count
+
+    return None
@@ -3,14 +3,14 @@ from __future__ import annotations
 import pickle
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
-    from pathlib import Path
     from .engine import Engine
+    from .spawner import Spawner
 from . import __version__
 from .modes import GameMode, GameStatus
-from .spawner import Spawner
 from .entities import Player
 from .dungeon.dungeon import (
     DungeonConfig, Dungeon, NormalDungeon, EndlessDungeon)
@@ -18,6 +18,9 @@ from .message_log import MessageLog
 from .rng import RandomNumberGenerator
 from .data.config import *
 
+# Where messages too old to keep in a save go, if spilling is turned on.
+MESSAGE_HISTORY_LOCATION: str = "saves/messages_{slot_index}.log"
+
 
 @dataclass
 class Save:
@@ -35,6 +38,11 @@ class Save:
             and self.metadata is None
         )
     
+    @property
+    def is_incompatible(self) -> bool:
+        """A savefile that another version of the game wrote"""
+        return self.path is not None and self.data is None
+    
     @classmethod
     def get_empty(cls) -> Save:
         return cls(-1, None, None, None)
@@ -42,6 +50,9 @@ class Save:
 
 def get_new_game(gamemode: GameMode, slot_index: int) -> Save:
     """Create a fresh game"""
+    # Gameplay only, so left out of loading up the main menu.
+    from .spawner import Spawner
+
     rng: RandomNumberGenerator = RandomNumberGenerator()
     spawner: Spawner = Spawner(rng=rng)
     player: Player = spawner.get_player_instance()
@@ -71,7 +82,10 @@ def get_new_game(gamemode: GameMode, slot_index: int) -> Save:
             config=dungeon_config
         )
     )
-    message_log: MessageLog = MessageLog()
+    message_log: MessageLog = MessageLog(
+        spill_location=MESSAGE_HISTORY_LOCATION.format(slot_index=slot_index)
+        if SPILL_MESSAGE_HISTORY else None
+    )
     time_created: datetime = datetime.now()
 
     return Save(
@@ -116,6 +130,23 @@ def is_same_version(save: Save) -> bool:
     return __version__ == save.metadata.get("version")
 
 
+def load_save_file(path: Path) -> Optional[Save]:
+    """Read in a savefile, if it's one this version of the game can load.
+
+    Saves from other versions that happen to load are kept only for knowing
+    what slot they were in, see fetch_saves.
+    """
+    try:
+        with open(path, "rb") as f:
+            save: Save = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError, TypeError, ValueError, KeyError, IndexError):
+        return None  # Classes it was pickled with have since changed.
+    if not isinstance(save, Save) or not is_valid_save(save):
+        return None
+    return save
+
+
 def fetch_saves(saves_dir: Path) -> list[Save]:
     """Fetch savefiles from the saves directory"""
     NUMBER_SAVE_SLOTS: int = 6
@@ -124,25 +155,30 @@ def fetch_saves(saves_dir: Path) -> list[Save]:
         saves_dir.mkdir()
         
     saves: list[Save] = []
+    # Which slots they were in is lost along with the rest of their data.
+    incompatible_paths: list[Path] = []
     indices_inside: set[int] = set()  # Tracking which slot indices are filled.
     for path in saves_dir.glob("*.sav"):
-        with open(path, "rb") as f:
-            save: Save = pickle.load(f)
-            try:
-                assert is_valid_save(save)
-            except AssertionError:
-                raise Exception("Corrupted save")
-            saves.append(save)
-            indices_inside.add(save.slot_index)
-
-            if len(saves) >= NUMBER_SAVE_SLOTS:  # Number of save slots.
-                break
+        save: Optional[Save] = load_save_file(path)
+        if save is None:
+            incompatible_paths.append(path)
+            continue
+        if not is_same_version(save):
+            save = Save(save.slot_index, path, None, save.metadata)
+        saves.append(save)
+        indices_inside.add(save.slot_index)
+
+        if len(saves) >= NUMBER_SAVE_SLOTS:  # Number of save slots.
+            break
     
-    # Order the save slots by their indices.
+    # Order the save slots by their indices, incompatible ones in the gaps.
     for i in range(NUMBER_SAVE_SLOTS):
         if i in indices_inside:
             continue
-        saves.append(Save(i, None, None, None))
+        if incompatible_paths:
+            saves.append(Save(i, incompatible_paths.pop(0), None, None))
+        else:
+            saves.append(Save(i, None, None, None))
     saves.sort(key=lambda save: save.slot_index)
 
     return saves
@@ -151,16 +187,14 @@ def fetch_saves(saves_dir: Path) -> list[Save]:
 def fetch_save(saves: list[Save], index: int) -> Save:
     """Load and return the savedata from a selected savefile"""
     save: Save = saves[index]
-    if save.is_empty:
+    if save.is_empty or save.is_incompatible:
         return save
-    try:
-        with open(save.path, "rb") as f:
-            save: Save = pickle.load(f)
-            assert is_valid_save(save)
-    except FileNotFoundError:
+    if not save.path.exists():
         return Save.get_empty()
-        
-    return save
+    loaded_save: Optional[Save] = load_save_file(save.path)
+    if loaded_save is None or not is_same_version(loaded_save):
+        return Save(save.slot_index, save.path, None, None)
+    return loaded_save
 
 
 def get_current_save_data(engine: Engine) -> Save:
@@ -181,6 +215,9 @@ def save_current_game(engine: Engine) -> None:
     with open(current_savegame.path, "wb") as f:
         pickle.dump(current_savegame, f)
 
+    if engine.replay is not None:
+        engine.replay.save(current_savegame.path.with_suffix(".replay"))
+
 
 def save_to_dir(saves_dir: Path, index: int, save: Save) -> None:
     """Save file data given a save in the saves directory"""
@@ -208,5 +245,14 @@ def delete_save_slot(save: Save) -> None:
         path: Path = save.path
         if path.exists():
             path.unlink()
+        delete_replay(save)
+        Path(MESSAGE_HISTORY_LOCATION.format(
+            slot_index=save.slot_index)).unlink(missing_ok=True)
+
+    
+
 
-    
\ No newline at end of file
+def delete_replay(save: Save) -> None:
+    """Delete the replay recorded alongside a save, if there is one"""
+    if save.path is not None:
+        save.path.with_suffix(".replay").unlink(missing_ok=True)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .entities import Creature
+
+
+class CreatureIndex:
+    """Creatures on a floor bucketed by position for nearby lookups.
+
+    Built once per turn. Creatures may take a step after being indexed, so
+    lookups search one cell past the radius and measure from where creatures
+    actually stand. Any going further have to be moved.
+    """
+    BUCKET_SIZE: int = 8
+
+    def __init__(self, creatures: Iterable[Creature]):
+        self._buckets: dict[tuple[int, int], list[Creature]] = \
+            defaultdict(list)
+        self._bucket_by_creature: dict[Creature, tuple[int, int]] = {}
+        for creature in creatures:
+            bucket: tuple[int, int] = self._bucket_of(creature.x, creature.y)
+            self._buckets[bucket].append(creature)
+            self._bucket_by_creature[creature] = bucket
+
+    def _bucket_of(self, x: int, y: int) -> tuple[int, int]:
+        return x // self.BUCKET_SIZE, y // self.BUCKET_SIZE
+
+    def move(self, creature: Creature) -> None:
+        """Rebucket a creature that has gone further than a step since"""
+        bucket: tuple[int, int] = self._bucket_of(creature.x, creature.y)
+        old_bucket: Optional[tuple[int, int]] = \
+            self._bucket_by_creature.get(creature)
+        if old_bucket == bucket:
+            return
+        if old_bucket is not None:
+            self._buckets[old_bucket].remove(creature)
+        self._buckets[bucket].append(creature)
+        self._bucket_by_creature[creature] = bucket
+
+    def nearest(
+            self,
+            x: int,
+            y: int,
+            radius: float,
+            is_wanted: Callable[[Creature], bool]) -> Optional[Creature]:
+        """Get the closest wanted creature within a radius of a cell"""
+        reach: int = math.ceil(radius) + 1  # Might have stepped since.
+        min_bucket_x, min_bucket_y = self._bucket_of(x - reach, y - reach)
+        max_bucket_x, max_bucket_y = self._bucket_of(x + reach, y + reach)
+
+        closest: Optional[Creature] = None
+        closest_distance: float = radius
+        for bucket_x in range(min_bucket_x, max_bucket_x + 1):
+            for bucket_y in range(min_bucket_y, max_bucket_y + 1):
+                for creature in self._buckets.get((bucket_x, bucket_y), ()):
+                    distance: float = math.dist((x, y), (creature.x, creature.y))
+                    if distance > closest_distance:
+                        continue
+                    if closest is not None and distance == closest_distance:
+                        continue
+                    if is_wanted(creature):
+                        closest, closest_distance = creature, distance
+        return closest
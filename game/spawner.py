@@ -1,25 +1,25 @@
 from __future__ import annotations
 
-import copy
-from typing import TYPE_CHECKING, Any, Optional
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from .dungeon.room import Room
     from .dungeon.floor import Floor
+    from .data.content import (
+        CreatureRecord, ItemRecord, WeaponRecord, StaffRecord, ArmorRecord,
+        PotionRecord)
 from .components.inventory import Inventory
 from .components.fighter import Fighter
 from .components.leveler import Leveler
 from .render_order import RenderOrder
 from .entities import (
     Entity, Item, Potion, Weapon, Staff, Armor, Creature, Player, Furniture)
-from .item_types import WeaponType, ProjectileType, ArmorType, PotionType
-from .rng import RandomNumberGenerator
-
-from .data.creatures import enemies, player
-from .data.items.potions import restoration_potions
-from .data.items.weapons import weapons
-from .data.items.staves import staves
-from .data.items.armor import armor
+from .item_types import ProjectileType
+from .rng import RandomNumberGenerator, WeightedTable
+from .templates import EntityTemplate
+
+from .data.content import Content, load_content
 from .data.config import DESCENDING_STAIRCASE_TILE, ASCENDING_STAIRCASE_TILE
 
 class Spawner:
@@ -27,19 +27,45 @@ class Spawner:
     
     def __init__(self, rng: RandomNumberGenerator):
         self.rng = rng
+        self.content: Content = load_content()
         # Create staircase prefabs.
-        self.descending_staircase: Entity = Entity(
-            x=-1, y=-1,
-            name="Descending staircase",
-            char=DESCENDING_STAIRCASE_TILE,
-            color="white",
-            render_order=RenderOrder.STAIRCASE,
-            blocking=False
-        )
-        self.ascending_staircase: Entity = copy.deepcopy(
-            self.descending_staircase)
-        self.ascending_staircase.name = "Ascending staircase"
-        self.ascending_staircase.char = ASCENDING_STAIRCASE_TILE
+        self.descending_staircase: EntityTemplate[Entity] = EntityTemplate(
+            self._get_staircase_instance(
+                "Descending staircase", DESCENDING_STAIRCASE_TILE))
+        self.ascending_staircase: EntityTemplate[Entity] = EntityTemplate(
+            self._get_staircase_instance(
+                "Ascending staircase", ASCENDING_STAIRCASE_TILE))
+
+        # Templates of everything in the data files, built once and copied
+        # on every spawn, weighted by their spawn chances.
+        self._enemy_table: WeightedTable[EntityTemplate[Creature]] = \
+            WeightedTable(
+                [
+                    EntityTemplate(self._get_enemy_instance(record))
+                    for record in self.content.enemies
+                ],
+                [record.spawn_chance for record in self.content.enemies]
+            )
+        # Pick a kind of item first, then an item of that kind.
+        item_tables: list[WeightedTable[EntityTemplate[Item]]] = []
+        item_kind_weights: list[int] = []
+        for factory, item_pool, spawn_chance in (
+            (WeaponFactory, self.content.weapons, 20),
+            (StaffFactory, self.content.staves, 100),
+            (ArmorFactory, self.content.armor, 20),
+            (PotionFactory, self.content.potions, 20)
+        ):
+            item_tables.append(WeightedTable(
+                [
+                    EntityTemplate(factory.build_item(record))
+                    for record in item_pool
+                ],
+                [record.spawn_chance for record in item_pool]
+            ))
+            item_kind_weights.append(spawn_chance)
+        self._item_table: WeightedTable[
+            WeightedTable[EntityTemplate[Item]]
+        ] = WeightedTable(item_tables, item_kind_weights)
 
 
     def spawn_staircase(
@@ -48,10 +74,10 @@ class Spawner:
         staircase: Entity = None
         
         if type == "descending":
-            staircase = self.descending_staircase.spawn_clone()
+            staircase = self.descending_staircase.spawn()
             floor.descending_staircase_location = x, y
         elif type == "ascending":
-            staircase = self.ascending_staircase.spawn_clone()
+            staircase = self.ascending_staircase.spawn()
             floor.ascending_staircase_location = x, y
         
         staircase.x = x
@@ -71,18 +97,25 @@ class Spawner:
     
     def spawn_enemy(self, room: Room) -> None:
         """Spawn a random creature and place it inside a room"""
-        x, y = room.get_random_empty_cell()
-
+        self.spawn_enemy_at(room.get_random_empty_cell(), room)
+    
+    
+    def spawn_enemy_at(self, coord: tuple[int, int], room: Room) -> None:
+        """Spawn a random creature into a spot in the room"""
         enemy: Creature = self._get_random_enemy_instance()
-        enemy.x, enemy.y = x, y
+        enemy.x, enemy.y = coord
         
         room.floor.add_entity(enemy)
     
     
     def spawn_item(self, room: Room, item_type: str) -> None:
         """Spawn a random item and place it inside a room"""
-        x, y = room.get_random_empty_cell()
-        
+        self.spawn_item_at(room.get_random_empty_cell(), room, item_type)
+    
+    
+    def spawn_item_at(
+            self, coord: tuple[int, int], room: Room, item_type: str) -> None:
+        """Spawn an item into a spot in the room"""
         item: Optional[Item] = None
         if item_type == "relic":
             item = self._get_relic_instance()
@@ -90,7 +123,7 @@ class Spawner:
             item = self._get_glyph_instance()
         else:
             item = self._get_random_item_instance()
-        item.x, item.y = x, y
+        item.x, item.y = coord
         
         room.floor.add_entity(item)
     
@@ -114,9 +147,9 @@ class Spawner:
         """Load player data and create an instance out of it"""
         player_obj = Player(
             x=-1, y=-1,
-            name=player["name"],
-            char=player["char"],
-            color=player["color"],
+            name=self.content.player.name,
+            char=self.content.player.char,
+            color=self.content.player.color,
             render_order=RenderOrder.CREATURE,
         )
 
@@ -141,33 +174,31 @@ class Spawner:
 
 
     def _get_random_enemy_instance(self) -> Creature:
-        """Load enemy data and create an instance out of it"""
+        """Copy a random enemy from the templates"""
+        return self._enemy_table.pick(self.rng).spawn()
+
+
+    def _get_enemy_instance(self, record: CreatureRecord) -> Creature:
+        """Create an instance out of an enemy's record"""
         # Prevent circular import.
         from .components.ai import WanderingAroundRoomAI
 
-        # Fetch a random enemy data object.
-        enemy_data: dict = self.rng.choices(
-            population=list(enemies.values()),
-            weights=[enemy["spawn_chance"] for enemy in enemies.values()]
-        )[0]
-        
-        # Create the instance and spawn the enemy.
         enemy = Creature(
             x=-1, y=-1,
-            name=enemy_data["name"],
-            char=enemy_data["char"],
-            color=enemy_data["color"],
+            name=record.name,
+            char=record.char,
+            color=record.color,
             render_order=RenderOrder.CREATURE,
-            energy=enemy_data["energy"]
+            energy=record.energy
         )
 
         enemy.add_component(
             name="fighter",
             component=Fighter(
                 rng=self.rng,
-                base_health=enemy_data["hp"],
+                base_health=record.health,
                 base_magicka=1,
-                base_damage=enemy_data["dmg"],
+                base_damage=record.damage,
                 base_agility=1,
                 base_power=1,
                 base_sage=1,
@@ -183,36 +214,18 @@ class Spawner:
 
 
     def _get_random_item_instance(self) -> Item:
-        """Load item data and create an instance out of it"""
-        factory_pool: dict = [
-            {
-                "factory": WeaponFactory(self.rng, item_pool=weapons),
-                "spawn_chance": 20
-            },
-            {
-                "factory": StaffFactory(self.rng, item_pool=staves),
-                "spawn_chance": 100
-            },
-            {
-                "factory": ArmorFactory(self.rng, item_pool=armor),
-                "spawn_chance": 20
-            },
-            {
-                "factory": PotionFactory(
-                    self.rng, item_pool=restoration_potions),
-                "spawn_chance": 20
-            },
-        ]
-
-        item_factory: ItemFactory = self.rng.choices(
-            population=factory_pool,
-            weights=[
-                factory["spawn_chance"]
-                for factory in factory_pool
-            ]
-        )[0]["factory"]
-
-        return item_factory.get_random_item()
+        """Copy a random item from the templates"""
+        return self._item_table.pick(self.rng).pick(self.rng).spawn()
+    
+
+    def _get_staircase_instance(self, name: str, char: str) -> Entity:
+        return Entity(
+            x=-1, y=-1,
+            name=name, char=char,
+            color="white",
+            render_order=RenderOrder.STAIRCASE,
+            blocking=False
+        )
     
 
     def _get_pedestal_instance(self) -> Furniture:
@@ -258,27 +271,25 @@ class Spawner:
         return item
 
 
-class ItemFactory:
-    """Base factory for spitting out items to spawn throughout the dungeon"""
+class ItemFactory(ABC):
+    """Base factory for building items out of their records.
 
-    def __init__(self,
-                 rng: RandomNumberGenerator,
-                 item_pool: list[dict[str, Any]]):
-        self.rng = rng
-        self._item_data: dict = self.rng.choices(
-            population=item_pool,
-            weights=[
-                item["spawn_chance"]
-                for item in item_pool
-            ]
-        )[0]
+    The spawner builds one of each item up front to make templates out of.
+    """
+
+    @classmethod
+    @abstractmethod
+    def build_item(cls, record: ItemRecord) -> Item:
+        """Create an instance out of an item's record"""
     
-    def get_instance_from_class(self, item_class: Item) -> Item:
+    @staticmethod
+    def get_instance_from_class(
+            item_class: type[Item], record: ItemRecord) -> Item:
         return item_class(
             x=-1, y=-1,
-            name=self._item_data["name"],
-            char=self._item_data["char"],
-            color=self._item_data["color"],
+            name=record.name,
+            char=record.char,
+            color=record.color,
             render_order=RenderOrder.ITEM,
             blocking=False
         )
@@ -286,28 +297,28 @@ class ItemFactory:
 
 class WeaponFactory(ItemFactory):
     """Process for instantiating a weapon from data"""
+    weapon_class: type[Weapon] = Weapon
     
-    def get_random_item(self) -> Weapon:
+    @classmethod
+    def build_item(cls, record: WeaponRecord) -> Weapon:
         # Prevent circular import.
         from .components.equippable import Wieldable
 
-        weapon = self.get_instance_from_class(Weapon)
+        weapon = cls.get_instance_from_class(cls.weapon_class, record)
         weapon.add_component(
-            "equippable", Wieldable(damage_bonus=self._item_data["dmg"])
+            "equippable", Wieldable(damage_bonus=record.damage)
         )
+        weapon.weapon_type = record.weapon_type
 
-        if self._item_data["type"] == WeaponType.SWORD:
-            weapon.weapon_type = WeaponType.SWORD
-        elif self._item_data["type"] == WeaponType.STAFF:
-            weapon.weapon_type = WeaponType.STAFF
-        
         return weapon
 
 
 class StaffFactory(WeaponFactory):
     """Process for instantiating a staff weapon from data"""
+    weapon_class: type[Weapon] = Staff
 
-    def get_random_item(self) -> Staff:
+    @classmethod
+    def build_item(cls, record: StaffRecord) -> Staff:
         # Prevent circular import.
         from .components.projectable import (
             EffectPerTurnProjectable, LightningProjectable,
@@ -315,52 +326,52 @@ class StaffFactory(WeaponFactory):
             FreezeProjectable
         )
 
-        staff: Staff = super().get_random_item()
+        staff: Staff = super().build_item(record)
 
-        match self._item_data["staff_type"]:
+        match record.projectile_type:
             case ProjectileType.LIGHTNING:
                 staff.projectile_type = ProjectileType.LIGHTNING
                 staff.add_component(
                     "projectable", LightningProjectable(
-                        uses=self._item_data["uses"],
-                        magicka_cost=self._item_data["magicka_cost"],
-                        magic_damage=self._item_data["magic_dmg"]
+                        uses=record.uses,
+                        magicka_cost=record.magicka_cost,
+                        magic_damage=record.magic_damage
                     )
                 )
             case ProjectileType.HEALING:
                 staff.projectile_type = ProjectileType.HEALING
                 staff.add_component(
                     "projectable", HealingProjectable(
-                        uses=self._item_data["uses"],
-                        magicka_cost=self._item_data["magicka_cost"],
-                        heal=self._item_data["hp"]
+                        uses=record.uses,
+                        magicka_cost=record.magicka_cost,
+                        heal=record.heal
                     )
                 )
             case ProjectileType.RIZZ:
                 staff.projectile_type = ProjectileType.RIZZ
                 staff.add_component(
                     "projectable", RizzProjectable(
-                        uses=self._item_data["uses"],
-                        magicka_cost=self._item_data["magicka_cost"],
-                        turns_remaining=self._item_data["turns_remaining"]
+                        uses=record.uses,
+                        magicka_cost=record.magicka_cost,
+                        turns_remaining=record.turns_remaining
                     )
                 )
             case ProjectileType.CONFUSION:
                 staff.projectile_type = ProjectileType.CONFUSION
                 staff.add_component(
                     "projectable", ConfusionProjectable(
-                        uses=self._item_data["uses"],
-                        magicka_cost=self._item_data["magicka_cost"],
-                        turns_remaining=self._item_data["turns_remaining"]
+                        uses=record.uses,
+                        magicka_cost=record.magicka_cost,
+                        turns_remaining=record.turns_remaining
                     )
                 )
             case ProjectileType.FREEZING:
                 staff.projectile_type = ProjectileType.FREEZING
                 staff.add_component(
                     "projectable", FreezeProjectable(
-                        uses=self._item_data["uses"],
-                        magicka_cost=self._item_data["magicka_cost"],
-                        turns_remaining=self._item_data["turns_remaining"]
+                        uses=record.uses,
+                        magicka_cost=record.magicka_cost,
+                        turns_remaining=record.turns_remaining
                     )
                 )
 
@@ -369,47 +380,37 @@ class StaffFactory(WeaponFactory):
 class ArmorFactory(ItemFactory):
     """Process for instantiating an armor piece from data"""
 
-    def get_random_item(self) -> Armor:
+    @classmethod
+    def build_item(cls, record: ArmorRecord) -> Armor:
         # Prevent circular import.
         from .components.equippable import Wearable
 
-        armor = self.get_instance_from_class(Armor)
+        armor = cls.get_instance_from_class(Armor, record)
         armor.add_component(
             "equippable",
             Wearable(
-                damage_reduction=self._item_data["dmg_reduct"],
-                coverage=self._item_data["coverage"])
+                damage_reduction=record.damage_reduction,
+                coverage=record.coverage)
         )
+        armor.armor_type = record.armor_type
 
-        if self._item_data["type"] == ArmorType.HEAD:
-            armor.armor_type = ArmorType.HEAD
-        elif self._item_data["type"] == ArmorType.TORSO:
-            armor.armor_type = ArmorType.TORSO
-        elif self._item_data["type"] == ArmorType.LEGS:
-            armor.armor_type = ArmorType.LEGS
-        
         return armor
 
 
 class PotionFactory(ItemFactory):
     """Process for instantiating a potion item from data"""
 
-    def get_random_item(self) -> Potion:
+    @classmethod
+    def build_item(cls, record: PotionRecord) -> Potion:
         # Prevent circular import.
         from .components.consumable import RestoreConsumable
 
-        potion = self.get_instance_from_class(Potion)
+        potion = cls.get_instance_from_class(Potion, record)
         potion.add_component(
             "consumable",
-            RestoreConsumable(yield_amount=self._item_data["yield"])
+            RestoreConsumable(yield_amount=record.yield_amount)
         )
-
-        # Create restore health potion.
-        if self._item_data["type"] == PotionType.HEALTH:
-            potion.consumable.potion_type = PotionType.HEALTH
-        # Create restore magicka potion.
-        elif self._item_data["type"] == PotionType.MAGICKA:
-            potion.consumable.potion_type = PotionType.MAGICKA
+        potion.consumable.potion_type = record.potion_type
         
         return potion
 
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .entities import Entity
+from .components.base_component import BaseComponent, get_slot_names
+
+E = TypeVar("E", bound="Entity")
+
+
+class EntityTemplate(Generic[E]):
+    """A prototype entity boiled down to what every copy of it needs set.
+
+    Working that out once makes stamping out copies far cheaper than going
+    through constructors and data files, or deep copying, on every spawn.
+    """
+    __slots__ = ("entity_class", "fields", "components")
+
+    def __init__(self, prototype: E):
+        self.entity_class: type[E] = type(prototype)
+        self.fields: list[tuple[str, Any]] = []
+        self.components: list[tuple[str, BaseComponent]] = []
+        for name in get_slot_names(self.entity_class):
+            if name == "floor" or not hasattr(prototype, name):
+                continue
+            value: Any = getattr(prototype, name)
+            if isinstance(value, BaseComponent):
+                self.components.append((name, value))
+            else:
+                self.fields.append((name, value))
+
+
+    def spawn(self) -> E:
+        """Make a new copy, not yet on any floor"""
+        entity: E = object.__new__(self.entity_class)
+        entity.floor = None
+        for name, value in self.fields:
+            setattr(entity, name, value)
+        for name, component in self.components:
+            entity.add_component(name, component.spawn_clone(entity))
+        return entity
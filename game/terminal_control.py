@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import curses
 import itertools
+import json
+import random
+import threading
 from math import ceil
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING, Optional, Any
 
 if TYPE_CHECKING:
@@ -14,10 +18,11 @@ if TYPE_CHECKING:
     from .components.inventory import Inventory
     from .components.leveler import Leveler
     from .components.fighter import Fighter
-    from .message_log import Message, MessageLog
+    from .message_log import MessageLog
     from .gamestates import MenuOption, GameConfig
     from .save_handling import Save
     from .engine import Engine
+    from .fov import VisibilityBuffer
 from .modes import GameStatus
 from .dungeon.floor import FloorBuilder
 from .tile import *
@@ -29,9 +34,13 @@ from .render_order import RenderOrder
 from .data.config import PROGRESS_BAR_FILLED, PROGRESS_BAR_UNFILLED
 from .save_handling import fetch_save
 from .rng import RandomNumberGenerator
-from .tile import FLOOR_TILE
 from .pathfinding import bresenham_path_to
 
+# Where on a row a run of same-colored characters starts, its text and color.
+GlyphRun = tuple[int, str, str]
+
+MENU_BACKGROUND_CACHE_LOCATION = Path("saves/menu_background.json")
+
 
 def get_filled_bar(percent: float, width: int) -> str:
     """Return a filled progress bar as a string of block letters"""
@@ -288,6 +297,12 @@ class TerminalController:
         self.floor_height = floor_height
         self.floor_width = floor_width
         self.colors = Color()  # Fetch available character tile colors.
+
+        # Color attributes of each tile type, indexed by the type.
+        self.lit_tile_colors: tuple[int, ...] = tuple(
+            self.colors.get_color(color) for color in TILE_LIT_COLORS)
+        self.dim_tile_colors: tuple[int, ...] = tuple(
+            self.colors.get_color(color) for color in TILE_DIM_COLORS)
         
         # Keep track of visible enemies.
         self.entities_in_fov: list[Entity] = []
@@ -314,24 +329,60 @@ class TerminalController:
         self.game_height = self.map_height + self.message_log_height + 2
         self.game_width = self.map_width + self.sidebar_width + 2
 
-        # Game title setup for main menu.
-        file_location = "game/data/title.txt"
-        self.title_lines: list[str] = self._get_title_lines(
-            file_location=file_location, max_width=(self.game_width // 2)
-        )
-        self.title_width, self.title_height = self._get_title_dimensions(
-            self.title_lines)
-        
-        self.main_menu_tiles: list[list[Tile]] = \
-            self._get_main_menu_map_tiles()
+        # Game title and background for main menu, set up when first shown.
+        self._title_lines: Optional[list[str]] = None
+        self._main_menu_glyphs: Optional[list[list[GlyphRun]]] = None
+        self._stale_main_menu_cache: bool = False
 
 
         self.screen.refresh()
 
 
+    @property
+    def title_lines(self) -> list[str]:
+        """Lines of the title's ASCII art, read in when first needed"""
+        if self._title_lines is None:
+            self._title_lines = self._get_title_lines(
+                file_location="game/data/title.txt",
+                max_width=(self.game_width // 2)
+            )
+        return self._title_lines
+    
+
+    @property
+    def title_width(self) -> int:
+        return self._get_title_dimensions(self.title_lines)[0]
+    
+
+    @property
+    def title_height(self) -> int:
+        return self._get_title_dimensions(self.title_lines)[1]
+
+
+    @property
+    def main_menu_glyphs(self) -> list[list[GlyphRun]]:
+        """Rows of the main menu background, made when first needed.
+        
+        Prefer what the last launch left on disk over generating a new floor
+        before the first frame. If that was used, a fresh one gets made for
+        next launch while the menu waits on input.
+        """
+        if self._main_menu_glyphs is None:
+            if CACHE_MENU_BACKGROUND:
+                self._main_menu_glyphs = self._load_main_menu_glyphs()
+                self._stale_main_menu_cache = \
+                    self._main_menu_glyphs is not None
+            if self._main_menu_glyphs is None:
+                self._main_menu_glyphs = self._get_main_menu_glyphs(
+                    RandomNumberGenerator(seed=None))
+                if CACHE_MENU_BACKGROUND:
+                    self._save_main_menu_glyphs(self._main_menu_glyphs)
+        return self._main_menu_glyphs
+
+
     def display_map(self,
                     floor: Floor,
-                    tiles_in_fov: dict[tuple[int, int], Tile]
+                    fov: VisibilityBuffer
                     ) -> curses.newwin:
         """Display the dungeon map along with entities in view.
         
@@ -350,14 +401,27 @@ class TerminalController:
         dungeon_level = \
             f"DUNGEON LEVEL {floor.dungeon.current_floor_index + 1}"
         window.addstr(0, 2, f"[ {dungeon_level} ]")
-        for pos, tile in floor.explored_tiles.items():
-            x, y = pos
-            window.addstr(
-                x + 1, y + 1, tile.char, self.colors.get_color(tile.color))
-        for pos, tile in tiles_in_fov.items():
-            x, y = pos
-            window.addstr(
-                x + 1, y + 1, tile.char, self.colors.get_color(tile.color))
+        for x, tiles_row in enumerate(floor.tiles):
+            explored_row: bytearray = \
+                floor.explored[x * floor.width:(x + 1) * floor.width]
+            if 1 not in explored_row:
+                continue
+
+            # Draw each run of same-colored tiles at once, blanking the
+            # unexplored ones.
+            glyphs: str = "".join(
+                TILE_CHARS[tile_type] if explored else " "
+                for tile_type, explored in zip(tiles_row, explored_row)
+            )
+            y: int = 0
+            for color, run in itertools.groupby(
+                tiles_row, key=self.dim_tile_colors.__getitem__
+            ):
+                run_length: int = len(bytes(run))
+                text: str = glyphs[y:y + run_length]
+                if not text.isspace():
+                    window.addstr(x + 1, y + 1, text, color)
+                y += run_length
 
 
         def is_displayable_entity(entity: Entity) -> bool:
@@ -368,42 +432,39 @@ class TerminalController:
             )
 
 
-        # Iterate through the entities list forwards and backwards at the same
-        # time. Forwards for keeping render order (creatures on top of items on
-        # top of corpses) and backwards for displaying creatures before items
-        # on the entities sidebar of the game view.
-        for entity_for_render, entity_for_sidebar in zip(
-            floor.entities, reversed(floor.entities)
-        ):
-            # For display on map.
-            if (entity_for_render.x, entity_for_render.y) in tiles_in_fov:
+        # Only the cells in view get drawn lit along with whatever stands on
+        # them, so this costs as much as the view and not the whole floor.
+        for x, y in fov.cells:
+            tile_type: int = floor.tiles[x][y]
+            window.addstr(
+                x + 1, y + 1,
+                TILE_CHARS[tile_type], self.lit_tile_colors[tile_type])
+
+            # Each cell's entities come in render order, so creatures end up
+            # drawn on top of items on top of corpses.
+            for entity in floor.entities_at(x, y):
                 window.addstr(
-                    entity_for_render.x + 1,
-                    entity_for_render.y + 1,
-                    entity_for_render.char,
-                    self.colors.get_color(entity_for_render.color)
-                )
+                    x + 1, y + 1,
+                    entity.char, self.colors.get_color(entity.color))
 
                 # Render glyph on top of pedestal, if in its inventory.
-                if isinstance(entity_for_render, Furniture):
-                    if entity_for_render.get_component("inventory"):
-                        inventory: Inventory = entity_for_render.inventory
+                if isinstance(entity, Furniture):
+                    if entity.get_component("inventory"):
+                        inventory: Inventory = entity.inventory
                         item: Optional[Item] = inventory.get_item(0)
 
                         if item is not None:
                             window.addstr(
-                                entity_for_render.x + 1,
-                                entity_for_render.y + 1,
-                                item.char,
-                                self.colors.get_color(item.color)
-                            )
-
-            # For display on sidebar.
-            if (
-                (entity_for_sidebar.x, entity_for_sidebar.y) in tiles_in_fov
-                and is_displayable_entity(entity_for_sidebar)
-            ):
-                self.entities_in_fov.append(entity_for_sidebar)
+                                x + 1, y + 1,
+                                item.char, self.colors.get_color(item.color))
+
+                # For display on sidebar.
+                if is_displayable_entity(entity):
+                    self.entities_in_fov.append(entity)
+        
+        # List creatures before items on the entities sidebar.
+        self.entities_in_fov.sort(
+            key=lambda entity: entity.render_order.value, reverse=True)
         
         window.refresh()
 
@@ -412,8 +473,9 @@ class TerminalController:
 
     def display_projectile_target(self,
                                   map_window: curses.window,
+                                  floor: Floor,
                                   player: Player,
-                                  tiles_in_fov: dict[tuple[int, int], Tile],
+                                  fov: VisibilityBuffer,
                                   cursor_index_x: int, 
                                   cursor_index_y: int) -> tuple[int, int]:
         """
@@ -440,9 +502,9 @@ class TerminalController:
             Subtract 1 from indices to account for left and top window border
             padding.
             """
-            targeted_tile: Optional[Tile] = tiles_in_fov.get((x - 1, y - 1))
-            if targeted_tile is None:
+            if not fov.is_visible(x - 1, y - 1):
                 return "", ""
+            targeted_tile: int = floor.tiles[x - 1][y - 1]
 
             # Temporarily include player to be seen in highlight targeting.
             self.entities_in_fov.insert(0, player)
@@ -457,12 +519,7 @@ class TerminalController:
             if targeted_entity is not None:
                 return targeted_entity.name, targeted_entity.char
             
-            tile_name: str = (
-                "Floor Tile"
-                if targeted_tile.char == FLOOR_TILE
-                else "Wall Tile"
-            )
-            return tile_name, targeted_tile.char
+            return TILE_NAMES[targeted_tile], TILE_CHARS[targeted_tile]
 
 
         target_name, target_char = get_tile_info_from_coords(
@@ -517,14 +574,16 @@ class TerminalController:
         window.border()
 
         window.addstr(0, 2, "[ MESSAGE LOG ]")
-        cursor = 0
-        for i in range(MESSAGE_LOG_HEIGHT - 2, 0, -1):
-            message: Message = message_log.get(cursor)
-            message_text = str(message)
-            color: str = message.color
-            window.addstr(i, 2, message_text, self.colors.get_color(color))
-            cursor += 1
-            if cursor > message_log.size - 1:
+        # Fill in from the bottom up, latest message first.
+        i: int = MESSAGE_LOG_HEIGHT - 2
+        for message in message_log.messages:
+            color: int = self.colors.get_color(message.color)
+            for line in reversed(message.get_lines(MESSAGE_LOG_WIDTH - 3)):
+                window.addstr(i, 2, line, color)
+                i -= 1
+                if i < 1:
+                    break
+            if i < 1:
                 break
         
         window.refresh()
@@ -1158,6 +1217,12 @@ class TerminalController:
         if save.is_empty:
             metadata_window.addstr(1, 1, "<Empty>")
         
+        # Written by another version, can only be deleted or overwritten.
+        elif save.is_incompatible:
+            metadata_window.addstr(1, 1, "<Incompatible>")
+            metadata_window.addstr(3, 1, "Saved by another")
+            metadata_window.addstr(4, 1, "version of the game.")
+        
         # Save metadata enumerated here.
         else:
             save_info: dict[str, str] = {
@@ -1230,13 +1295,10 @@ class TerminalController:
         window.erase()
         
         # Display the cool map background.
-        for x in range(self.game_height - 2):
-            for y in range(self.game_width - 2):
+        for x, row in enumerate(self.main_menu_glyphs):
+            for y, text, color in row:
                 window.addstr(
-                    x + 1, y + 1,
-                    self.main_menu_tiles[x][y].char,
-                    self.colors.get_color(self.main_menu_tiles[x][y].color)
-                )
+                    x + 1, y + 1, text, self.colors.get_color(color))
         
         window.border()
         options_subwindow.erase()
@@ -1278,6 +1340,12 @@ class TerminalController:
         
         window.refresh()
         options_subwindow.refresh()
+
+        # Now that the menu is up, leave a new background for next launch.
+        if self._stale_main_menu_cache:
+            self._stale_main_menu_cache = False
+            threading.Thread(
+                target=self._replace_main_menu_cache, daemon=True).start()
         
         return cursor_index
 
@@ -1560,9 +1628,9 @@ class TerminalController:
         return self.screen.getkey()
 
 
-    def _get_main_menu_map_tiles(self) -> list[list[Tile]]:
+    def _get_main_menu_map_tiles(
+            self, rng: RandomNumberGenerator) -> list[bytearray]:
         """A cool, randomly-generated dungeon background for the main menu"""
-        rng = RandomNumberGenerator(seed=None)
         num_rooms: int = rng.randint(15, 20)
         floor: Floor = (
             FloorBuilder(
@@ -1570,20 +1638,82 @@ class TerminalController:
                 floor_height=self.game_height - 2,
                 floor_width=self.game_width - 2
             )
-            .place_walls(tile_type=wall_tile_dim)
+            .place_walls()
             .place_rooms(
                 num_rooms=num_rooms,
                 min_room_height=MIN_ROOM_HEIGHT,
                 max_room_height=MAX_ROOM_HEIGHT,
                 min_room_width=MIN_ROOM_WIDTH,
-                max_room_width=MAX_ROOM_WIDTH,
-                tile_type=floor_tile_shrouded
+                max_room_width=MAX_ROOM_WIDTH
             )
-            .place_tunnels(tile_type=floor_tile_shrouded)
+            .place_tunnels()
         ).build(dungeon=None)
         return floor.tiles
 
 
+    def _get_main_menu_glyphs(
+            self, rng: RandomNumberGenerator) -> list[list[GlyphRun]]:
+        """Generate a main menu background as rows of same-colored runs"""
+        # Walls dimly outline the shrouded rooms and tunnels.
+        colors: tuple[str, ...] = (
+            TILE_DIM_COLORS[TILE_WALL], TILE_SHROUDED_COLORS[TILE_FLOOR])
+
+        glyphs: list[list[GlyphRun]] = []
+        for tiles_row in self._get_main_menu_map_tiles(rng):
+            row: list[GlyphRun] = []
+            for y, tile_type in enumerate(tiles_row):
+                char: str = TILE_CHARS[tile_type]
+                color: str = colors[tile_type]
+                if row and row[-1][2] == color:
+                    start_y, text, _ = row[-1]
+                    row[-1] = (start_y, text + char, color)
+                else:
+                    row.append((y, char, color))
+            glyphs.append(row)
+        return glyphs
+
+
+    def _load_main_menu_glyphs(self) -> Optional[list[list[GlyphRun]]]:
+        """Read in the background cached by the last launch, if it fits"""
+        try:
+            with open(MENU_BACKGROUND_CACHE_LOCATION) as cache_file:
+                cache: dict[str, Any] = json.load(cache_file)
+        except (OSError, ValueError):
+            return None
+        if cache.get("size") != [self.game_height - 2, self.game_width - 2]:
+            return None
+        return [[tuple(run) for run in row] for row in cache["glyphs"]]
+
+
+    def _save_main_menu_glyphs(self, glyphs: list[list[GlyphRun]]) -> None:
+        """Cache a background to be shown on next launch"""
+        cache: dict[str, Any] = {
+            "size": [self.game_height - 2, self.game_width - 2],
+            "glyphs": glyphs
+        }
+        # Written whole and then moved into place, in case the game quits
+        # midway through.
+        temp_location: Path = MENU_BACKGROUND_CACHE_LOCATION.with_suffix(
+            ".tmp")
+        try:
+            MENU_BACKGROUND_CACHE_LOCATION.parent.mkdir(exist_ok=True)
+            with open(temp_location, "w") as cache_file:
+                json.dump(cache, cache_file)
+            temp_location.replace(MENU_BACKGROUND_CACHE_LOCATION)
+        except OSError:
+            pass  # Just generate one again next time.
+
+
+    def _replace_main_menu_cache(self) -> None:
+        """Cache a different background for next launch, meant to be run off
+        the main thread
+        """
+        # Its own generator, so as to not use up the game's random numbers.
+        glyphs: list[list[GlyphRun]] = self._get_main_menu_glyphs(
+            random.Random())
+        self._save_main_menu_glyphs(glyphs)
+
+
     def _get_title_lines(
             self, file_location: str, max_width: str) -> list[str]:
         """Get the lines for the cool ASCII art for the title I got online.
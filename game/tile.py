@@ -1,38 +1,23 @@
 from .data.config import WALL_TILE, FLOOR_TILE
 
 
-class Tile:
-    """Tile representation for each cell on the map"""
-    
-    def __init__(self,
-                 char: str,
-                 color: str,
-                 walkable: bool,
-                 explored: bool = False):
-        self.char = char
-        self.color = color
-        self.walkable = walkable
-        self.explored = explored
+# TILE TYPES #
 
+# Each cell on the map holds one of these, indexing into the tables below.
+TILE_WALL: int = 0
+TILE_FLOOR: int = 1
 
-# WALLS AND FLOORS #
+# Per tile type properties.
+TILE_CHARS: tuple[str, ...] = (WALL_TILE, FLOOR_TILE)
+TILE_NAMES: tuple[str, ...] = ("Wall Tile", "Floor Tile")
+TILE_WALKABLE: tuple[bool, ...] = (False, True)
+TILE_TRANSPARENT: tuple[bool, ...] = (False, True)
 
 # Tiles in FOV.
-wall_tile = Tile(
-    char=WALL_TILE, color="white", walkable=False, explored=True)
-floor_tile = Tile(
-    char=FLOOR_TILE, color="white", walkable=True, explored=True)
+TILE_LIT_COLORS: tuple[str, ...] = ("white", "white")
 
 # Tiles explored but not in FOV.
-wall_tile_dim = Tile(
-    char=WALL_TILE, color="grey", walkable=False, explored=True
-)
-floor_tile_dim = Tile(
-    char=FLOOR_TILE, color="grey", walkable=True, explored=True
-)
+TILE_DIM_COLORS: tuple[str, ...] = ("grey", "grey")
 
 # Tiles unexplored.
-wall_tile_shrouded = Tile(
-    char=WALL_TILE, color="black", walkable=False, explored=False)
-floor_tile_shrouded = Tile(
-    char=FLOOR_TILE, color="black", walkable=True, explored=False)
+TILE_SHROUDED_COLORS: tuple[str, ...] = ("black", "black")
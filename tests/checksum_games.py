@@ -0,0 +1,54 @@
+"""Script that plays seeded games offscreen with a seeded stand-in player
+and prints the game's checksum after every turn.
+
+Run it before and after a change and diff the outputs to see whether, and on
+which turn of which game, anything played out differently.
+
+`python3 -m tests.checksum_games [games] [turns] > checksums.txt`
+"""
+import random
+import sys
+
+from game.actions import StartNewGameAction
+from game.engine import Engine
+from game.gamestates import GameEndState, LevelUpSelectionState
+from game.modes import GameMode
+from game.replay import decode_action
+from game.save_handling import Save
+
+DIRECTIONS: list[tuple[int, int]] = [
+    (-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+
+def play(seed: int, turns: int) -> None:
+    """Play a game and print its checksum every turn"""
+    engine = Engine(None, Save(-1, None, {}, {}), None, None)
+    random.seed(seed)
+    StartNewGameAction(
+        GameMode.NORMAL, None, -1, "Player", str(seed)).start_game(engine)
+    engine.gamestate = None
+
+    # Separate from the game's randomness so it doesn't get in the way.
+    player_rng = random.Random(seed)
+    for turn in range(turns):
+        if isinstance(engine.gamestate, GameEndState):
+            break
+        if isinstance(engine.gamestate, LevelUpSelectionState):
+            record = ["level_up", player_rng.choice(
+                ["POWER", "AGILITY", "VITALITY", "SAGE"])]
+        elif player_rng.random() < 0.05:
+            record = [player_rng.choice(["wait", "pick_up", "descend"])]
+        else:
+            record = ["bump", *player_rng.choice(DIRECTIONS)]
+
+        engine.gamestate, action = decode_action(engine, record)
+        engine.update_fov()
+        if engine.gamestate.perform(engine, action):
+            engine.process()
+        print(seed, turn, engine.get_checksum())
+
+
+games: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+turns: int = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+for seed in range(games):
+    play(seed, turns)
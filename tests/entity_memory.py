@@ -0,0 +1,42 @@
+"""Script that measures how much memory entities take up once they're spawned
+onto a floor, components and all.
+
+`python3 -m tests.entity_memory [entities]`
+"""
+import sys
+import tracemalloc
+from typing import Callable
+
+from game.dungeon.floor import Floor
+from game.entities import Entity
+from game.rng import RandomNumberGenerator
+from game.spawner import Spawner
+
+
+def measure(get_entity: Callable[[], Entity], count: int) -> float:
+    """Spawn entities across a floor and get the bytes allocated per entity"""
+    floor = Floor(width=count, height=1)
+    get_entity()  # Get any imports done beforehand.
+    tracemalloc.start()
+    for x in range(count):
+        entity: Entity = get_entity()
+        entity.x, entity.y = x, 0
+        floor.add_entity(entity)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / count
+
+
+count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+spawner = Spawner(RandomNumberGenerator("memory"))
+
+kinds: dict[str, Callable[[], Entity]] = {
+    "creature": spawner._get_random_enemy_instance,
+    "item": spawner._get_random_item_instance,
+    "staircase": spawner.descending_staircase.spawn
+}
+
+print(f"ENTITY MEMORY (over {count} of each)")
+print("------------------")
+for name, get_entity in kinds.items():
+    print(f"{name}: {measure(get_entity, count):.0f} bytes")
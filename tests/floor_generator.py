@@ -31,8 +31,8 @@ def main(stdscr):
             for y in range(FLOOR_WIDTH):
                 stdscr.addstr(
                     x + 1, y + 1,
-                    floor.tiles[x][y].char,
-                    Color().get_color(floor.tiles[x][y].color)
+                    TILE_CHARS[floor.tiles[x][y]],
+                    Color().get_color(TILE_LIT_COLORS[floor.tiles[x][y]])
                 )
         
         # Debug info.
@@ -64,21 +64,20 @@ def get_builder(rng: RandomNumberGenerator, vertical_first: bool) -> FloorBuilde
             floor_height=FLOOR_HEIGHT,
             floor_width=FLOOR_WIDTH
         )
-        .place_walls(tile_type=wall_tile)
-        .place_relic_room(tile_type=floor_tile_dim)
-        .place_glyphs_room(Spawner(rng), tile_type=floor_tile_shrouded)
+        .place_walls()
+        .place_relic_room()
+        .place_glyphs_room(Spawner(rng))
         .place_rooms(
             # num_rooms=rng.randint(MIN_NUM_ROOMS, MAX_NUM_ROOMS),
             num_rooms=3,
             min_room_height=MIN_ROOM_HEIGHT,
             max_room_height=MAX_ROOM_HEIGHT,
             min_room_width=MIN_ROOM_WIDTH,
-            max_room_width=MAX_ROOM_WIDTH,
-            tile_type=floor_tile_shrouded
+            max_room_width=MAX_ROOM_WIDTH
         )
-        # .place_glyphs_room(tile_type=floor_tile_shrouded)
+        # .place_glyphs_room()
         .reverse_rooms()
-        .place_tunnels(tile_type=floor_tile, vertical_first=vertical_first)
+        .place_tunnels(vertical_first=vertical_first)
     )
 
 
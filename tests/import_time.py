@@ -0,0 +1,49 @@
+"""Script that measures how long the game takes to import before the main menu
+can show, using Python's `-X importtime`.
+
+`python3 -m tests.import_time [runs]`
+"""
+import subprocess
+import sys
+
+
+def get_import_times() -> dict[str, int]:
+    """Import the game in a fresh interpreter and get each module's
+    cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+runs: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+samples: list[dict[str, int]] = [get_import_times() for _ in range(runs)]
+
+# Best of all runs, to cut out noise from whatever else the machine is doing.
+best: dict[str, int] = {
+    module: min(sample.get(module, 0) for sample in samples)
+    for module in samples[0]
+}
+
+print(f"STARTUP IMPORT TIME (best of {runs})")
+print("------------------")
+print(f"main: {best['main'] / 1000:.1f}ms")
+print()
+print("Slowest game modules (cumulative):")
+game_modules = sorted(
+    (module for module in best if module.startswith("game")),
+    key=lambda module: best[module],
+    reverse=True
+)
+for module in game_modules[:10]:
+    print(f"{best[module] / 1000:>6.1f}ms  {module}")
@@ -0,0 +1,30 @@
+"""Script that plays back a recorded game offscreen as fast as it can, to
+check that it still turns out the same way.
+
+Replays are saved next to their savefiles, e.g. `saves/Player-01_234567.replay`
+
+`python3 -m tests.play_replay <replay file>`
+"""
+import sys
+import time
+from pathlib import Path
+
+from game.replay import Replay, play_back
+
+replay: Replay = Replay.load(Path(sys.argv[1]))
+
+start: float = time.perf_counter()
+diverged_at = play_back(replay)
+elapsed: float = time.perf_counter() - start
+
+print(f"REPLAY ({replay.gamemode.name.lower()}, version {replay.version})")
+print("------------------")
+print(f"Actions: {len(replay.actions)}")
+print(f"Played back in: {elapsed:.2f}s "
+      f"({len(replay.actions) / elapsed:.0f} actions/s)")
+if diverged_at is None:
+    print(f"All {len(replay.checksums)} checksums matched")
+else:
+    print(f"Went differently within the {replay.checksum_interval} actions "
+          f"leading up to action {diverged_at}")
+    sys.exit(1)
@@ -0,0 +1,28 @@
+"""Script that measures how many entities of each kind the spawner can make a
+second.
+
+`python3 -m tests.spawn_rate [spawns]`
+"""
+import sys
+import timeit
+from typing import Callable
+
+from game.entities import Entity
+from game.rng import RandomNumberGenerator
+from game.spawner import Spawner
+
+
+spawns: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+spawner = Spawner(RandomNumberGenerator("spawns"))
+
+kinds: dict[str, Callable[[], Entity]] = {
+    "creature": spawner._get_random_enemy_instance,
+    "item": spawner._get_random_item_instance,
+    "staircase": spawner.descending_staircase.spawn
+}
+
+print(f"SPAWN RATE (best of 5 x {spawns})")
+print("------------------")
+for name, get_entity in kinds.items():
+    seconds: float = min(timeit.repeat(get_entity, number=spawns, repeat=5))
+    print(f"{name}: {spawns / seconds:,.0f}/s")
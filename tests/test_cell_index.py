@@ -0,0 +1,55 @@
+import unittest
+
+from game.dungeon.floor import Floor
+from game.entities import Creature, Item
+from game.render_order import RenderOrder
+
+class TestCellIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.floor = Floor(width=10, height=10)
+        self.creature = Creature(2, 2, "rat", "r", "red", RenderOrder.CREATURE)
+        self.item = Item(2, 2, "coin", "$", "yellow", RenderOrder.ITEM, False)
+        self.floor.add_entity(self.creature)
+        self.floor.add_entity(self.item)
+
+    def test_render_order_per_cell(self):
+        self.assertEqual(
+            self.floor.entities_at(2, 2), [self.item, self.creature])
+        self.assertIs(self.floor.blocking_entity_at(2, 2), self.creature)
+
+    def test_follows_movement(self):
+        self.creature.move(1, 0)
+        self.assertEqual(self.floor.entities_at(2, 2), [self.item])
+        self.assertEqual(self.floor.entities_at(3, 2), [self.creature])
+
+    def test_remove(self):
+        self.floor.remove_entity(self.item)
+        self.item.x = 5
+        self.assertEqual(self.floor.entities_at(2, 2), [self.creature])
+        self.assertEqual(self.floor.entities_at(5, 2), [])
+
+    def test_changing_floors(self):
+        other_floor = Floor(width=10, height=10)
+        other_floor.add_entity(self.creature)
+        self.assertNotIn(self.creature, self.floor.entities)
+        self.assertEqual(self.floor.entities_at(2, 2), [self.item])
+        self.assertEqual(other_floor.entities_at(2, 2), [self.creature])
+
+    def test_render_order_change(self):
+        self.creature.render_order = RenderOrder.CORPSE
+        self.assertEqual(
+            self.floor.entities_at(2, 2), [self.creature, self.item])
+        self.assertEqual(
+            list(self.floor.entities), [self.creature, self.item])
+        self.assertEqual(list(self.floor.creatures), [self.creature])
+        self.assertEqual(list(self.floor.items), [self.item])
+
+    def test_typed_views(self):
+        self.assertEqual(list(self.floor.living_creatures), [self.creature])
+        self.creature.fighter = None
+        self.creature.render_order = RenderOrder.CORPSE  # Slain.
+        self.assertEqual(list(self.floor.living_creatures), [])
+        self.assertEqual(list(self.floor.creatures), [self.creature])
+        self.floor.remove_entity(self.item)
+        self.assertEqual(list(self.floor.items), [])
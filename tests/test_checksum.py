@@ -0,0 +1,54 @@
+import unittest
+
+from game.dungeon.dungeon import Dungeon
+from game.dungeon.floor import Floor
+from game.entities import Creature
+from game.render_order import RenderOrder
+
+class TestChecksum(unittest.TestCase):
+
+    def make_floor(self):
+        floor = Floor(width=10, height=10)
+        floor.add_entity(
+            Creature(2, 2, "rat", "r", "red", RenderOrder.CREATURE))
+        return floor
+
+    def test_same_floors(self):
+        self.assertEqual(
+            self.make_floor().get_checksum(), self.make_floor().get_checksum())
+
+    def test_entity_moved(self):
+        floor = self.make_floor()
+        checksum = floor.get_checksum()
+        next(iter(floor.creatures)).move(1, 0)
+        self.assertNotEqual(floor.get_checksum(), checksum)
+
+    def test_explored(self):
+        floor = self.make_floor()
+        checksum = floor.get_checksum()
+        floor.explored[0] = 1
+        self.assertNotEqual(floor.get_checksum(), checksum)
+
+
+class TestDungeonChecksum(unittest.TestCase):
+
+    def make_dungeon(self, floors):
+        dungeon = Dungeon(rng=None, spawner=None, config=None)
+        dungeon.floors = floors
+        return dungeon
+
+    def test_floor_changed_between_checksums(self):
+        floors = [Floor(width=10, height=10), Floor(width=10, height=10)]
+        rat = Creature(2, 2, "rat", "r", "red", RenderOrder.CREATURE)
+        floors[1].add_entity(rat)
+        dungeon = self.make_dungeon(floors)
+        checksum = dungeon.get_checksum()
+
+        # Visit the other floor, change it, and leave before the next one.
+        dungeon.current_floor_index = 1
+        rat.name = "Remains of rat"
+        dungeon.current_floor_index = 0
+
+        self.assertNotEqual(dungeon.get_checksum(), checksum)
+        self.assertEqual(
+            dungeon.get_checksum(), self.make_dungeon(floors).get_checksum())
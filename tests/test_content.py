@@ -0,0 +1,44 @@
+import unittest
+
+from game.data.content import (
+    CreatureRecord, StaffRecord, StatBonuses, compile_content,
+    _compile_record)
+from game.item_types import ProjectileType, WeaponType
+
+class TestContent(unittest.TestCase):
+
+    def test_data_files_compile(self):
+        content = compile_content()
+        self.assertTrue(content.enemies)
+        self.assertTrue(all(
+            isinstance(record, CreatureRecord) for record in content.enemies))
+
+    def test_renamed_and_nested_keys(self):
+        problems = []
+        record = _compile_record(StaffRecord, {
+            "name": "Staff", "desc": "", "char": "/", "color": "blue",
+            "spawn_chance": 1, "type": WeaponType.STAFF, "dmg": 2,
+            "staff_type": ProjectileType.LIGHTNING, "uses": 3,
+            "magicka_cost": 4, "magic_dmg": 5,
+            "stat_bonuses": {"sage": 1}
+        }, "staff", problems)
+        self.assertEqual(problems, [])
+        self.assertEqual(record.magic_damage, 5)
+        self.assertEqual(record.heal, 0)
+        self.assertEqual(record.stat_bonuses, StatBonuses(sage=1))
+
+    def test_all_problems_reported(self):
+        problems = []
+        record = _compile_record(CreatureRecord, {
+            "name": "Rat", "char": "rr", "color": "brown", "hp": "5",
+            "spawn_chance": -1, "energy": True, "colour": "brown"
+        }, "enemies['rat']", problems)
+        self.assertIsNone(record)
+        self.assertEqual(problems, [
+            "enemies['rat']: 'hp' should be int, got '5'",
+            "enemies['rat']: missing 'dmg'",
+            "enemies['rat']: 'energy' should be int, got True",
+            "enemies['rat']: unknown key 'colour'",
+            "enemies['rat']: 'char' should be a single character",
+            "enemies['rat']: 'spawn_chance' can't be negative"
+        ])
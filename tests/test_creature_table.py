@@ -0,0 +1,43 @@
+import unittest
+
+from game.components.fighter import Fighter
+from game.dungeon.creature_table import CreatureTable
+from game.dungeon.floor import Floor
+from game.entities import Creature
+from game.render_order import RenderOrder
+from game.rng import RandomNumberGenerator
+
+class TestCreatureTable(unittest.TestCase):
+
+    def setUp(self):
+        self.floor = Floor(width=10, height=10)
+        self.floor.creature_table = CreatureTable()
+        self.rats = [self.make_rat(x, energy=x) for x in range(3)]
+
+    def make_rat(self, x, energy):
+        rat = Creature(x, 0, "rat", "r", "red", RenderOrder.CREATURE,
+                       energy=energy)
+        rat.add_component("fighter", Fighter(
+            RandomNumberGenerator("table"), 10, 1, 1, 1, 1, 1, 1))
+        self.floor.add_entity(rat)
+        return rat
+
+    def test_stats_in_rows(self):
+        table = self.floor.creature_table
+        self.rats[1].fighter.health -= 3
+        self.assertEqual(list(table.health), [10, 7, 10])
+        table.gain_energy()
+        self.assertEqual([rat.energy for rat in self.rats], [0, 2, 4])
+
+    def test_remove(self):
+        table = self.floor.creature_table
+        self.rats[0].fighter.health -= 3
+        self.floor.remove_entity(self.rats[0])
+        self.assertEqual(table.creatures, [self.rats[2], self.rats[1]])
+        self.assertEqual(self.rats[0].fighter.health, 7)
+        self.assertEqual(self.rats[2].energy, 2)
+
+    def test_slain(self):
+        self.rats[1].fighter.health = 0
+        self.assertEqual(len(self.floor.creature_table), 2)
+        self.assertTrue(self.rats[1].fighter.is_dead)
@@ -0,0 +1,111 @@
+import unittest
+from unittest import mock
+
+from game.components.ai import (
+    DormantAI, HostileEnemyAI, WanderingAroundRoomAI)
+from game.dungeon.dungeon import Dungeon
+from game.dungeon.floor import Floor
+from game.dungeon.room import Room
+from game.engine import Engine
+from game.entities import Creature
+from game.render_order import RenderOrder
+from game.rng import RandomNumberGenerator
+from game.save_handling import Save
+from game.spawner import Spawner
+from game.tile import TILE_FLOOR
+from game.data.config import AI_DORMANT_DISTANCE
+
+class TestDormantAI(unittest.TestCase):
+
+    def setUp(self):
+        # The player's room and two others far off to the east.
+        rng = RandomNumberGenerator("dormant")
+        self.floor = Floor(width=70, height=12)
+        self.floor.tiles = [bytearray([TILE_FLOOR] * 70) for _ in range(12)]
+        self.player_room = Room(rng, 2, 2, 30, 6, self.floor)
+        self.far_rooms = [
+            Room(rng, 2, 40, 8, 6, self.floor),
+            Room(rng, 2, 55, 8, 6, self.floor)
+        ]
+        self.floor.rooms = [self.player_room, *self.far_rooms]
+
+        self.engine = Engine(None, Save(-1, None, {}, {}), None, None)
+        self.engine.rng = rng
+        self.engine.dungeon = Dungeon(rng=None, spawner=None, config=None)
+        self.engine.dungeon.floors = [self.floor]
+        self.engine.player = Spawner(rng).get_player_instance()
+        self.engine.player.x, self.engine.player.y = 4, 3
+        self.floor.add_entity(self.engine.player)
+
+        self.rat = Creature(4, 44, "rat", "r", "red", RenderOrder.CREATURE)
+        self.floor.add_entity(self.rat)
+
+    def test_is_distant(self):
+        ai = WanderingAroundRoomAI(self.rat)
+        self.assertTrue(ai.is_distant(self.engine))
+
+        # Close by, out in a tunnel.
+        self.rat.x, self.rat.y = 4, 3 + AI_DORMANT_DISTANCE
+        self.assertFalse(ai.is_distant(self.engine))
+
+        # Far, but in the same room.
+        self.rat.x, self.rat.y = 4, 30
+        self.engine.player.y = 2
+        self.assertFalse(ai.is_distant(self.engine))
+
+    def test_goes_dormant(self):
+        self.rat.add_component("ai", WanderingAroundRoomAI(self.rat))
+        self.rat.ai.perform(self.engine)
+        self.assertIsInstance(self.rat.ai, DormantAI)
+
+    def test_hops_to_distant_room(self):
+        self.rat.add_component("ai", DormantAI(self.rat))
+        creature_index = self.engine.creature_index
+        with mock.patch("game.components.ai.CHANCE_TO_SWITCH_ROOMS", 1.0):
+            for _ in range(5):
+                self.rat.ai.perform(self.engine)
+                self.assertIsInstance(self.rat.ai, DormantAI)
+                self.assertIn(
+                    self.floor.room_at(self.rat.x, self.rat.y),
+                    self.far_rooms
+                )
+                # Still found where it landed this turn.
+                self.assertIs(
+                    creature_index.nearest(
+                        self.rat.x, self.rat.y, 0, lambda _: True),
+                    self.rat
+                )
+
+    def test_hops_out_of_range(self):
+        # Its center is far off, but it runs right back past the player.
+        long_room = Room(self.engine.rng, 9, 2, 60, 2, self.floor)
+        self.floor.rooms = [self.player_room, long_room]
+        self.rat.add_component("ai", DormantAI(self.rat))
+        with mock.patch("game.components.ai.CHANCE_TO_SWITCH_ROOMS", 1.0):
+            for _ in range(20):
+                self.rat.ai.perform(self.engine)
+                self.assertTrue(self.rat.ai.is_distant(self.engine))
+        self.assertIs(self.floor.room_at(self.rat.x, self.rat.y), long_room)
+
+    def test_wakes_on_noise(self):
+        self.rat.add_component("ai", DormantAI(self.rat))
+        self.floor.noise_locations.append((4, 34))
+        self.rat.ai.perform(self.engine)
+        self.assertIsInstance(self.rat.ai, WanderingAroundRoomAI)
+
+    def test_wakes_on_player_near(self):
+        self.rat.add_component("ai", DormantAI(self.rat))
+        self.rat.ai.perform(self.engine)
+        self.assertIsInstance(self.rat.ai, DormantAI)
+
+        self.engine.player.y = 38
+        self.rat.ai.perform(self.engine)
+        self.assertIsInstance(self.rat.ai, WanderingAroundRoomAI)
+
+        # Back to its usual self, chasing the player once seen.
+        self.rat.ai.perform(self.engine)
+        self.assertIsInstance(self.rat.ai, HostileEnemyAI)
+
+
+if __name__ == "__main__":
+    unittest.main()
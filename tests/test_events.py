@@ -0,0 +1,151 @@
+import unittest
+from unittest import mock
+
+from game.actions import DropItemAction, MeleeAction, WalkAction
+from game.components.ai import FrozenAI
+from game.dungeon.dungeon import Dungeon
+from game.dungeon.floor import Floor
+from game.dungeon.room import Room
+from game.engine import Engine
+from game.events import Event, EventBus, EventType
+from game.message_log import MessageLog
+from game.rng import RandomNumberGenerator
+from game.save_handling import Save
+from game.spawner import PotionFactory, Spawner, StaffFactory
+from game.tile import TILE_FLOOR, TILE_WALL
+
+class TestEventBus(unittest.TestCase):
+
+    def setUp(self):
+        self.bus = EventBus()
+        self.received = []
+
+    def test_subscribe_to_types(self):
+        self.bus.subscribe(self.received.append, EventType.DEATH)
+        self.bus.emit(EventType.ATTACK, "rat", "you", 3)
+        self.bus.emit(EventType.DEATH, "you", "rat", 10)
+        self.assertEqual(
+            self.received, [Event(EventType.DEATH, "you", "rat", 10)])
+
+    def test_subscribe_to_all(self):
+        self.bus.subscribe(self.received.append)
+        self.bus.emit(EventType.MISS, "rat", "you")
+        self.bus.emit(EventType.PICKUP, "you", "potion")
+        self.assertEqual(len(self.received), 2)
+
+    def test_unsubscribe(self):
+        self.bus.subscribe(self.received.append)
+        self.bus.unsubscribe(self.received.append)
+        self.bus.emit(EventType.MISS, "rat", "you")
+        self.assertEqual(self.received, [])
+
+class TestEventsWithoutMessageLog(unittest.TestCase):
+    """Everything that used to write to the message log should still run
+    with no log to write to
+    """
+
+    def setUp(self):
+        rng = RandomNumberGenerator("events")
+        self.spawner = Spawner(rng)
+        self.floor = Floor(width=12, height=12)
+        self.floor.tiles = [bytearray([TILE_WALL] * 12)] + [
+            bytearray([TILE_WALL] + [TILE_FLOOR] * 10 + [TILE_WALL])
+            for _ in range(10)
+        ] + [bytearray([TILE_WALL] * 12)]
+        self.room = Room(rng, 1, 1, 10, 10, self.floor)
+        self.floor.rooms = [self.room]
+
+        self.engine = Engine(
+            None, Save(-1, None, {}, {"turns": 0, "slayed": 0}), None, None)
+        self.engine.rng = rng
+        self.engine.dungeon = Dungeon(rng=None, spawner=None, config=None)
+        self.engine.dungeon.floors = [self.floor]
+        self.engine.player = self.spawner.get_player_instance()
+        self.engine.player.x, self.engine.player.y = 1, 1
+        self.floor.add_entity(self.engine.player)
+        self.spawner.spawn_enemy_at((1, 2), self.room)
+        self.enemy = self.floor.blocking_entity_at(1, 2)
+
+        self.received = []
+        self.engine.events.subscribe(self.received.append)
+
+    def cast(self, record_index: int, x: int, y: int) -> bool:
+        """Cast a staff from the player at a cell"""
+        staff = StaffFactory.build_item(self.spawner.content.staves[record_index])
+        staff.parent = self.engine.player
+        # Cursor positions are off by one from the floor's.
+        self.engine.gamestate = mock.Mock(
+            cursor_index_x=x + 1, cursor_index_y=y + 1)
+        return staff.projectable.perform(self.engine)
+
+    def test_walk_into_wall(self):
+        WalkAction(self.engine.player, -1, 0).perform(self.engine)
+        self.assertEqual(self.received[-1].type, EventType.PATH_BLOCKED)
+
+    def test_drop_item(self):
+        potion = PotionFactory.build_item(self.spawner.content.potions[0])
+        self.engine.player.inventory.add_item(potion)
+        DropItemAction(self.engine.player, potion).perform(self.engine)
+        self.assertIn(potion, self.floor.items)
+        self.assertEqual(self.received[-1].type, EventType.DROP)
+
+    def test_projectables(self):
+        x, y = self.enemy.x, self.enemy.y
+        for index in range(len(self.spawner.content.staves)):
+            self.assertFalse(self.cast(index, 5, 5))
+            self.assertEqual(self.received[-1].type, EventType.SPELL_FAILED)
+            self.cast(index, x, y)
+        self.assertEqual(
+            [event.type for event in self.received
+             if event.type != EventType.SPELL_FAILED],
+            [EventType.LIGHTNING, EventType.HEAL, EventType.RIZZ,
+             EventType.CONFUSE, EventType.FREEZE]
+        )
+
+    def test_effect_wears_off(self):
+        self.cast(4, self.enemy.x, self.enemy.y)
+        for _ in range(20):
+            self.enemy.ai.perform(self.engine)
+            if not isinstance(self.enemy.ai, FrozenAI):
+                break
+        self.assertNotIsInstance(self.enemy.ai, FrozenAI)
+        self.assertEqual(self.received[-1].type, EventType.FREEZE_ENDED)
+
+    def test_slayings_counted(self):
+        self.enemy.fighter.health = 1
+        for _ in range(100):
+            MeleeAction(self.engine.player, 0, 1).perform(self.engine)
+            if self.enemy.fighter.is_dead:
+                break
+        self.assertTrue(self.enemy.fighter.is_dead)
+        self.assertEqual(self.engine.save_meta["slayed"], 1)
+
+        # Only the player's count.
+        self.engine.events.emit(
+            EventType.DEATH, self.enemy, self.engine.player)
+        self.assertEqual(self.engine.save_meta["slayed"], 1)
+
+    def test_same_wording(self):
+        message_log = MessageLog()
+        self.engine.message_log = message_log
+        WalkAction(self.engine.player, -1, 0).perform(self.engine)
+        self.assertEqual(message_log.prev_message.message,
+                         "That way is blocked")
+        self.assertEqual(message_log.prev_message.color, "red")
+
+        self.cast(4, 5, 5)
+        self.assertEqual(message_log.prev_message.message,
+                         "Nothing to freeze here")
+        self.cast(4, self.enemy.x, self.enemy.y)
+        self.assertEqual(
+            message_log.prev_message.message,
+            f"{self.enemy.name} stops in its tracks, completely unable to move")
+        self.cast(4, self.enemy.x, self.enemy.y)
+        self.assertEqual(message_log.prev_message.message,
+                         f"{self.enemy.name} is already frozen!")
+
+        # Healing yourself says how much was regained, not lost.
+        self.engine.player.fighter.health -= 3
+        self.cast(1, self.engine.player.x, self.engine.player.y)
+        self.assertEqual(message_log.prev_message.message,
+                         "You regained 3 pts!")
@@ -0,0 +1,25 @@
+import pickle
+import unittest
+
+from game.factions import Faction, is_hostile
+from game.rng import RandomNumberGenerator
+from game.spawner import Spawner
+
+class TestFactions(unittest.TestCase):
+
+    def test_sides_fight_each_other(self):
+        self.assertTrue(is_hostile(Faction.PLAYER, Faction.MONSTER))
+        self.assertTrue(is_hostile(Faction.MONSTER, Faction.PLAYER))
+
+    def test_sides_dont_fight_themselves(self):
+        for faction in Faction:
+            self.assertFalse(is_hostile(faction, faction))
+
+    def test_faction_saved_per_creature(self):
+        spawner = Spawner(RandomNumberGenerator("factions"))
+        enemy = spawner._get_random_enemy_instance()
+        enemy.faction = Faction.PLAYER  # Rizzed.
+        player = spawner.get_player_instance()
+        for creature in (enemy, player):
+            self.assertEqual(
+                pickle.loads(pickle.dumps(creature)).faction, Faction.PLAYER)
@@ -0,0 +1,37 @@
+import unittest
+
+from game.components.fighter import Fighter, StatModifier
+from game.rng import RandomNumberGenerator
+from game.spawner import Spawner, WeaponFactory
+
+class TestFighterStats(unittest.TestCase):
+
+    def setUp(self):
+        spawner = Spawner(RandomNumberGenerator("stats"))
+        self.player = spawner.get_player_instance()
+        self.fighter: Fighter = self.player.fighter
+        self.weapon_record = spawner.content.weapons[0]
+
+    def test_max_points(self):
+        # One point at level 1, then 3, 2, 2, 3, 2, 2... per level.
+        self.assertEqual(
+            [StatModifier.add_max_points(level) for level in range(1, 8)],
+            [0, 3, 5, 7, 10, 12, 14]
+        )
+
+    def test_attributes_update_stats(self):
+        max_health = self.fighter.max_health
+        hit_chance = self.fighter.hit_chance
+        self.fighter.vitality += 1
+        self.fighter.agility += 1
+        self.assertGreater(self.fighter.max_health, max_health)
+        self.assertGreater(self.fighter.hit_chance, hit_chance)
+
+    def test_equipment_updates_damage(self):
+        weapon = WeaponFactory.build_item(self.weapon_record)
+        damage = self.fighter.damage
+        self.player.inventory.add_item(weapon)
+        self.player.inventory.equip(weapon)
+        self.assertEqual(self.fighter.damage, damage + self.weapon_record.damage)
+        self.player.inventory.unequip(weapon)
+        self.assertEqual(self.fighter.damage, damage)
@@ -0,0 +1,81 @@
+import unittest
+
+from game.dungeon.dungeon import Dungeon
+from game.dungeon.floor import Floor
+from game.engine import Engine
+from game.fov import has_line_of_sight
+from game.gamestates import ExploreState
+from game.pathfinding import bresenham_line, bresenham_path_to
+from game.rng import RandomNumberGenerator
+from game.save_handling import Save
+from game.spawner import Spawner
+from game.tile import TILE_FLOOR, TILE_WALL
+
+class TestLineOfSight(unittest.TestCase):
+
+    def setUp(self):
+        # A wall running down the middle of an open grid.
+        self.walls: set[tuple[int, int]] = {(x, 5) for x in range(3, 8)}
+        self.checked: list[tuple[int, int]] = []
+
+    def is_blocking(self, x: int, y: int) -> bool:
+        self.checked.append((x, y))
+        return (x, y) in self.walls
+
+    def test_path_follows_line(self):
+        for x2, y2 in [(4, 9), (0, 0), (9, 1), (1, 9), (5, 5)]:
+            path: list[tuple[int, int]] = bresenham_path_to(5, 5, x2, y2)
+            self.assertEqual(path[0], (5, 5))
+            self.assertEqual(path[-1], (x2, y2))
+            self.assertEqual(set(path), set(bresenham_line(5, 5, x2, y2)))
+
+    def test_clear_line(self):
+        self.assertTrue(has_line_of_sight((1, 1), (1, 8), self.is_blocking))
+
+    def test_blocked_line(self):
+        self.assertFalse(has_line_of_sight((5, 1), (5, 8), self.is_blocking))
+
+        # Tracing stops at the wall.
+        self.assertLess(len(self.checked), 8)
+
+    def test_out_of_range(self):
+        self.assertFalse(
+            has_line_of_sight((1, 1), (1, 8), self.is_blocking, max_distance=3))
+
+        # Nothing traced at all.
+        self.assertEqual(self.checked, [])
+
+
+class TestPlayerSight(unittest.TestCase):
+
+    def setUp(self):
+        # A walled-in room with a pillar up and to the left of the player.
+        floor = Floor(width=10, height=10)
+        floor.tiles = [bytearray([TILE_WALL] * 10)]
+        floor.tiles += [
+            bytearray([TILE_WALL] + [TILE_FLOOR] * 8 + [TILE_WALL])
+            for _ in range(8)
+        ]
+        floor.tiles.append(bytearray([TILE_WALL] * 10))
+        floor.tiles[4][4] = TILE_WALL
+
+        self.engine = Engine(None, Save(-1, None, {}, {}), None, None)
+        self.engine.dungeon = Dungeon(rng=None, spawner=None, config=None)
+        self.engine.dungeon.floors = [floor]
+        self.engine.player = Spawner(
+            RandomNumberGenerator("sight")).get_player_instance()
+        self.engine.player.x, self.engine.player.y = 5, 5
+        self.engine.gamestate = ExploreState(self.engine.player)
+
+    def test_same_with_or_without_fov(self):
+        # Seen past the corner of the wall, but no straight line to it.
+        self.engine.update_fov()
+        self.assertTrue(self.engine.fov.is_visible(3, 4))
+        self.assertFalse(self.engine.in_player_sight(3, 4, 8))
+
+        # Or after the player has stepped away and back.
+        self.engine.player.y = 6
+        self.engine.update_fov()
+        self.engine.player.y = 5
+        self.assertFalse(self.engine.in_player_sight(3, 4, 8))
+        self.assertTrue(self.engine.in_player_sight(3, 5, 8))
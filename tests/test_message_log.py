@@ -0,0 +1,55 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from game.message_log import MessageLog, MessageType
+from game.data.config import MESSAGE_HISTORY_SIZE
+
+class TestMessageLog(unittest.TestCase):
+
+    def test_bounded_history(self):
+        message_log = MessageLog()
+        for i in range(MESSAGE_HISTORY_SIZE * 2):
+            message_log.add(f"message {i}")
+        self.assertEqual(len(message_log.history), MESSAGE_HISTORY_SIZE)
+        self.assertEqual(message_log.size, MESSAGE_HISTORY_SIZE)
+        self.assertEqual(
+            message_log.prev_message.message,
+            f"message {MESSAGE_HISTORY_SIZE * 2 - 1}")
+
+    def test_spill(self):
+        with tempfile.TemporaryDirectory() as directory:
+            location = os.path.join(directory, "messages.log")
+            message_log = MessageLog(spill_location=location)
+            for i in range(MESSAGE_HISTORY_SIZE + 1):
+                message_log.add(f"message {i}")
+            with open(location) as spill_file:
+                self.assertEqual(
+                    spill_file.read().splitlines(),
+                    [str(MessageLog.START_MESSAGE), "message 0"])
+
+            # A new game in the same slot starts its own history.
+            MessageLog(spill_location=location)
+            with open(location) as spill_file:
+                self.assertEqual(spill_file.read(), "")
+
+    def test_wrapped_lines(self):
+        message_log = MessageLog()
+        message_log.add("You hit the rat", type=MessageType.PLAYER_ATTACK)
+        message = message_log.prev_message
+        self.assertEqual(message.get_lines(10), ["You hit", "the rat"])
+        message_log.add("The rat bites you", type=MessageType.ENEMY_ATTACK)
+        self.assertEqual(
+            message.get_lines(40), ["You hit the rat; The rat bites you"])
+        message_log.add("You hit the rat; The rat bites you")
+        self.assertEqual(
+            message.get_lines(40), ["You hit the rat; The rat bites you x2"])
+
+    def test_wrapped_lines_not_pickled(self):
+        message_log = MessageLog()
+        message_log.add("You hit the rat")
+        message_log.prev_message.get_lines(10)
+        message = pickle.loads(pickle.dumps(message_log.prev_message))
+        self.assertIsNone(message._lines)
+        self.assertEqual(message.get_lines(10), ["You hit", "the rat"])
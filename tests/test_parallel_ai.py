@@ -0,0 +1,112 @@
+import random
+import unittest
+from unittest import mock
+
+from game.actions import StartNewGameAction, BumpAction
+from game.components.ai import HostileEnemyAI
+from game.dungeon.floor import Floor, FloorSnapshot
+from game.engine import Engine
+from game.entities import Creature
+from game.gamestates import ExploreState, GameEndState
+from game.modes import GameMode
+from game.pathfinding import a_star_path_to, a_star_planned_path_to
+from game.render_order import RenderOrder
+from game.save_handling import Save
+
+MOVES = [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (-1, -1)] * 5
+
+
+def start_game(seed: int) -> Engine:
+    """Start a seeded game with every creature in the player's room and
+    chasing them, so they keep getting in each other's way
+    """
+    engine = Engine(None, Save(-1, None, {}, {}), None, None)
+    random.seed(seed)
+    StartNewGameAction(
+        GameMode.NORMAL, None, -1, "Tester", str(seed)).start_game(engine)
+    floor = engine.dungeon.current_floor
+    room = floor.room_at(engine.player.x, engine.player.y)
+    for creature in list(floor.living_creatures):
+        creature.x, creature.y = room.get_random_empty_cell()
+        creature.add_component("ai", HostileEnemyAI(creature))
+    return engine
+
+
+def play(seed: int) -> list[str]:
+    """Play a seeded game and get its checksum every turn"""
+    engine = start_game(seed)
+
+    checksums: list[str] = []
+    for dx, dy in MOVES:
+        if isinstance(engine.gamestate, GameEndState):
+            break
+        engine.gamestate = ExploreState(engine.player)
+        engine.update_fov()
+        if engine.gamestate.perform(
+                engine, BumpAction(engine.player, dx, dy)):
+            engine.process()
+        checksums.append(engine.get_checksum())
+    engine.shut_down_ai_workers()
+    return checksums
+
+
+class TestParallelAI(unittest.TestCase):
+
+    def setUp(self):
+        # One rat stuck behind another on the way to the player.
+        self.floor = Floor(width=20, height=10)
+        self.front = Creature(5, 5, "rat", "r", "red", RenderOrder.CREATURE)
+        self.back = Creature(4, 5, "rat", "r", "red", RenderOrder.CREATURE)
+        self.floor.add_entity(self.front)
+        self.floor.add_entity(self.back)
+        self.ai = HostileEnemyAI(self.back)
+        self.snapshot = FloorSnapshot(self.floor)
+        self.path, area = a_star_planned_path_to(self.snapshot, 4, 5, 10, 5)
+        self.ai.receive_path((4, 5), (10, 5), self.path, self.snapshot, area)
+
+    def test_blocking_unchanged(self):
+        self.front.x, self.front.y = 6, 4
+        for area, unchanged in [
+            ((5, 5, 5, 5), False),  # Just where it left.
+            ((0, 0, 1, 1), True),
+            ((0, 0, 19, 9), False),  # The whole floor.
+            ((10, 0, 19, 9), True)
+        ]:
+            self.assertEqual(
+                self.snapshot.blocking_unchanged(self.floor, area), unchanged)
+
+    def test_planned_path_reused(self):
+        self.floor.add_entity(
+            Creature(15, 5, "rat", "r", "red", RenderOrder.CREATURE))
+        self.assertIs(self.ai.path_to(self.floor, 4, 5, 10, 5), self.path)
+
+    def test_planned_path_replaced(self):
+        # Its first step is still free, but now there's a shorter way.
+        self.front.x, self.front.y = 6, 4
+        self.assertEqual(
+            self.ai.path_to(self.floor, 4, 5, 10, 5),
+            a_star_path_to(self.floor, 4, 5, 10, 5)
+        )
+        self.assertNotEqual(
+            a_star_path_to(self.floor, 4, 5, 10, 5), self.path)
+
+    def test_same_game(self):
+        for seed in range(3):
+            with mock.patch("game.engine.PARALLEL_AI_DECISIONS", False):
+                expected = play(seed)
+            with mock.patch("game.engine.PARALLEL_AI_DECISIONS", True):
+                self.assertEqual(play(seed), expected)
+
+    def test_workers_shut_down(self):
+        with mock.patch("game.engine.PARALLEL_AI_DECISIONS", True):
+            engine = start_game(0)
+            planned_ais = engine.plan_creature_turns(
+                engine.dungeon.current_floor)
+            self.assertNotEqual(planned_ais, [])
+            self.assertIsNotNone(engine._ai_executor)
+            engine.shut_down_ai_workers()
+            self.assertIsNone(engine._ai_executor)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import random
+import unittest
+
+from game.actions import StartNewGameAction, BumpAction
+from game.engine import Engine
+from game.gamestates import ExploreState
+from game.modes import GameMode
+from game.replay import Replay, play_back, encode_action, decode_action
+from game.save_handling import Save
+
+MOVES = [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (-1, -1)] * 5
+
+class TestReplay(unittest.TestCase):
+
+    def setUp(self):
+        # Play a short game through, recording it.
+        self.replay = Replay(
+            GameMode.NORMAL, "Tester", "test", random.getstate(),
+            checksum_interval=5)
+        self.engine = Engine(None, Save(-1, None, {}, {}), None, None)
+        StartNewGameAction(
+            GameMode.NORMAL, None, -1, "Tester", "test"
+        ).start_game(self.engine)
+        for dx, dy in MOVES:
+            gamestate = ExploreState(self.engine.player)
+            action = BumpAction(self.engine.player, dx, dy)
+            self.engine.gamestate = gamestate
+            self.replay.record(gamestate, action)
+            self.engine.update_fov()
+            if gamestate.perform(self.engine, action):
+                self.engine.process()
+            self.replay.checkpoint(self.engine)
+
+    def test_recorded(self):
+        self.assertEqual(
+            self.replay.actions, [["bump", *move] for move in MOVES])
+        self.assertEqual(len(self.replay.checksums), len(MOVES) // 5)
+
+    def test_decode(self):
+        gamestate, action = decode_action(self.engine, ["bump", 1, 0])
+        self.assertEqual(encode_action(gamestate, action), ["bump", 1, 0])
+
+    def test_play_back(self):
+        self.assertIsNone(play_back(self.replay))
+
+    def test_play_back_diverges(self):
+        self.replay.actions[7] = ["wait"]
+        self.assertEqual(play_back(self.replay), 10)
@@ -1,6 +1,6 @@
 import unittest
 
-from game.rng import RandomNumberGenerator
+from game.rng import RandomNumberGenerator, WeightedTable
 
 class TestRNG(unittest.TestCase):
     
@@ -99,3 +99,23 @@ class TestRNG(unittest.TestCase):
         print()
 
 
+
+class TestWeightedTable(unittest.TestCase):
+
+    def test_same_as_choices(self):
+        rng = RandomNumberGenerator()
+        population = ["rat", "bat", "vampire"]
+        weights = [50, 30, 5]
+        table = WeightedTable(population, weights)
+        rng.seed = "weights"
+        picks = [table.pick(rng) for _ in range(100)]
+        rng.seed = "weights"
+        self.assertEqual(
+            picks,
+            [rng.choices(population, weights)[0] for _ in range(100)])
+
+    def test_bad_weights(self):
+        with self.assertRaises(ValueError):
+            WeightedTable(["rat"], [0])
+        with self.assertRaises(ValueError):
+            WeightedTable(["rat", "bat"], [1])
@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from game.actions import ContinueGameAction
+from game.engine import Engine
+from game.modes import GameMode
+from game.save_handling import (
+    Save, delete_save_slot, fetch_save, fetch_saves, get_new_game, save_to_dir)
+
+class TestFetchSaves(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.saves_dir = Path(self.temp_dir.name) / "saves"
+        self.saves_dir.mkdir()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_incompatible_saves_listed(self):
+        save_to_dir(self.saves_dir, 2, get_new_game(GameMode.NORMAL, 2))
+        # Refers to a class that's since been removed.
+        (self.saves_dir / "old.sav").write_bytes(
+            b"\x80\x04\x8c\tgame.tile\x94\x8c\x04Tile\x94\x93\x94.")
+        other_version = get_new_game(GameMode.NORMAL, 4)
+        other_version.metadata["version"] = "0.0.0"
+        save_to_dir(self.saves_dir, 4, other_version)
+
+        saves = fetch_saves(self.saves_dir)
+        self.assertEqual(len(saves), 6)
+        self.assertEqual(
+            [save.is_incompatible for save in saves],
+            [True, False, False, False, True, False]
+        )
+        self.assertEqual(saves[0].path.name, "old.sav")
+        self.assertIsNotNone(fetch_save(saves, 2).data)
+        self.assertTrue(fetch_save(saves, 0).is_incompatible)
+
+    def test_delete_slot_files(self):
+        save = get_new_game(GameMode.NORMAL, 1)
+        save_to_dir(self.saves_dir, 1, save)
+        save.path.with_suffix(".replay").touch()
+        spill_location = str(self.saves_dir / "messages_{slot_index}.log")
+        spill_path = Path(spill_location.format(slot_index=1))
+        spill_path.touch()
+
+        with mock.patch(
+            "game.save_handling.MESSAGE_HISTORY_LOCATION", spill_location
+        ):
+            delete_save_slot(fetch_saves(self.saves_dir)[1])
+        self.assertEqual(list(self.saves_dir.iterdir()), [])
+
+    def test_continue_drops_replay(self):
+        save = get_new_game(GameMode.NORMAL, 1)
+        save_to_dir(self.saves_dir, 1, save)
+        replay_path = save.path.with_suffix(".replay")
+        replay_path.touch()
+
+        engine = Engine(None, Save(-1, None, {}, {}), None, None)
+        save = fetch_saves(self.saves_dir)[1]
+        ContinueGameAction(save, self.saves_dir, 1).perform(engine)
+        self.assertIsNone(engine.replay)
+        self.assertFalse(replay_path.exists())
+        self.assertTrue(save.path.exists())
@@ -0,0 +1,35 @@
+import copy
+import pickle
+import unittest
+
+from game.components.base_component import BaseComponent
+from game.components.ai import BaseAI
+from game.dungeon.floor import Floor
+from game.entities import Entity
+from game.rng import RandomNumberGenerator
+from game.spawner import Spawner
+
+def get_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from get_subclasses(subclass)
+
+class TestSlots(unittest.TestCase):
+
+    def test_no_instance_dicts(self):
+        for cls in [Entity, *get_subclasses(Entity)]:
+            self.assertNotIn("__dict__", dir(cls), cls)
+        for cls in get_subclasses(BaseComponent):
+            if not issubclass(cls, BaseAI):
+                self.assertNotIn("__dict__", dir(cls), cls)
+
+    def test_copy_and_pickle(self):
+        floor = Floor(width=10, height=10)
+        spawner = Spawner(RandomNumberGenerator("slots"))
+        enemy = spawner._get_random_enemy_instance()
+        enemy.x, enemy.y = 3, 4
+        floor.add_entity(enemy)
+        for clone in (copy.deepcopy(enemy), pickle.loads(pickle.dumps(enemy))):
+            self.assertEqual(clone.get_state(), enemy.get_state())
+            self.assertIs(clone.fighter.owner, clone)
+            self.assertEqual(clone.floor.entities_at(3, 4), [clone])
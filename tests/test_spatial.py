@@ -0,0 +1,39 @@
+import unittest
+
+from game.spatial import CreatureIndex
+
+class Dummy:
+
+    def __init__(self, name: str, x: int, y: int):
+        self.name = name
+        self.x = x
+        self.y = y
+
+class TestCreatureIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.near = Dummy("near", 5, 6)
+        self.nearer_but_friendly = Dummy("friendly", 5, 5)
+        self.far = Dummy("far", 5, 40)
+        self.index = CreatureIndex([self.far, self.near, self.nearer_but_friendly])
+
+    def is_enemy(self, creature: Dummy) -> bool:
+        return creature.name != "friendly"
+
+    def test_nearest(self):
+        self.assertIs(self.index.nearest(4, 4, 10, self.is_enemy), self.near)
+
+    def test_out_of_radius(self):
+        self.assertIsNone(self.index.nearest(4, 4, 1, self.is_enemy))
+        self.assertIs(self.index.nearest(5, 30, 10, self.is_enemy), self.far)
+
+    def test_stepped_since_indexed(self):
+        # Step across into the next bucket after the index was built.
+        self.far.y = 39
+        self.assertIs(self.index.nearest(5, 31, 8, self.is_enemy), self.far)
+
+    def test_moved_since_indexed(self):
+        self.far.x, self.far.y = 30, 30
+        self.index.move(self.far)
+        self.assertIs(self.index.nearest(30, 31, 2, self.is_enemy), self.far)
+        self.assertIsNone(self.index.nearest(5, 31, 8, self.is_enemy))
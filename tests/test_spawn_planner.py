@@ -0,0 +1,46 @@
+import unittest
+
+from game.dungeon.floor import FloorBuilder
+from game.dungeon.spawn_planner import SpawnPlanner
+from game.rng import RandomNumberGenerator
+from game.spawner import Spawner
+
+class TestSpawnPlanner(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = RandomNumberGenerator("planner")
+        self.floor = (
+            FloorBuilder(self.rng, floor_height=23, floor_width=80)
+            .place_walls()
+            .place_rooms(
+                num_rooms=6,
+                min_room_height=4,
+                max_room_height=6,
+                min_room_width=12,
+                max_room_width=18
+            )
+            .place_tunnels()
+            .place_staircases(
+                Spawner(self.rng), descending=True, ascending=True)
+            .build(dungeon=None)
+        )
+        self.planner = SpawnPlanner(self.rng, self.floor)
+
+    def test_cells_free_and_in_room(self):
+        placements = self.planner.plan(self.floor.rooms, 100)
+        self.assertEqual(len(placements), 100)
+        self.assertEqual(len({coord for _, coord in placements}), 100)
+        for room, coord in placements:
+            self.assertTrue(room.contains_point(coord))
+            self.assertIsNone(self.floor.entity_at(*coord))
+
+    def test_stops_when_full(self):
+        room = self.floor.first_room
+        free_cells = room.width * room.height - 1  # Less the staircase.
+        placements = self.planner.plan([room], free_cells + 10)
+        self.assertEqual(len(placements), free_cells)
+        self.assertEqual(self.planner.plan([room], 1), [])
+
+    def test_budget_grows_with_depth(self):
+        self.assertEqual(SpawnPlanner.get_budget(4, 0, 0.25), 4)
+        self.assertEqual(SpawnPlanner.get_budget(4, 3, 0.25), 7)
@@ -0,0 +1,58 @@
+import unittest
+
+from game.components.ai import AllyFollowingAI, ConfusedAI, FrozenAI
+from game.components.inventory import Inventory
+from game.entities import Furniture
+from game.render_order import RenderOrder
+from game.rng import RandomNumberGenerator
+from game.spawner import Spawner
+from game.templates import EntityTemplate
+
+class TestEntityTemplate(unittest.TestCase):
+
+    def setUp(self):
+        self.spawner = Spawner(RandomNumberGenerator("templates"))
+
+    def test_same_as_built(self):
+        enemy = self.spawner._get_random_enemy_instance()
+        clone = EntityTemplate(enemy).spawn()
+        self.assertEqual(clone.get_state(), enemy.get_state())
+        self.assertIsNot(clone.fighter, enemy.fighter)
+        self.assertIs(clone.fighter.owner, clone)
+        self.assertIs(clone.ai.entity, clone)
+
+    def test_copies_are_separate(self):
+        template = self.spawner._enemy_table.population[0]
+        first, second = template.spawn(), template.spawn()
+        first.fighter.health -= 5
+        self.assertEqual(second.fighter.health, second.fighter.max_health)
+
+    def test_inventory_items_copied(self):
+        pedestal = Furniture(0, 0, "Pedestal", "-", "gold",
+                             RenderOrder.FURNITURE, True)
+        pedestal.add_component("inventory", Inventory(num_slots=1))
+        glyph = self.spawner._get_glyph_instance()
+        pedestal.inventory.add_item(glyph)
+        clone = pedestal.spawn_clone()
+        self.assertEqual(len(clone.inventory.items), 1)
+        self.assertIsNot(clone.inventory.items[0], glyph)
+        self.assertIs(clone.inventory.items[0].parent, clone)
+
+    def test_effect_ais_copied(self):
+        enemy = self.spawner._get_random_enemy_instance()
+        color = enemy.color
+        for ai_class in (ConfusedAI, FrozenAI):
+            enemy.add_component("ai", ai_class(enemy, enemy.ai, 5))
+            clone = enemy.spawn_clone()
+            self.assertIsInstance(clone.ai, ai_class)
+            self.assertIs(clone.ai.entity, clone)
+            self.assertEqual(clone.ai._turns_remaining, 5)
+            self.assertIs(clone.ai._previous_ai.entity, clone)
+            enemy.add_component("ai", enemy.ai._previous_ai)
+
+        enemy.add_component(
+            "ai", AllyFollowingAI(enemy, enemy.ai, 5, enemy.color))
+        clone = enemy.spawn_clone()
+        self.assertEqual(clone.faction, enemy.faction)
+        self.assertEqual(clone.ai.previous_color, color)
+        self.assertEqual(clone.ai.previous_faction, enemy.ai.previous_faction)
@@ -0,0 +1,58 @@
+import unittest
+
+from game.dungeon.floor import Floor
+from game.fov import VisibilityBuffer
+
+class TestVisibilityBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.fov = VisibilityBuffer()
+        self.fov.start(width=10, height=5)
+
+    def test_mark_visible(self):
+        self.fov.mark_visible(2, 3)
+        self.fov.mark_visible(2, 3)
+        self.assertTrue(self.fov.is_visible(2, 3))
+        self.assertFalse(self.fov.is_visible(3, 2))
+        self.assertFalse(self.fov.is_visible(-1, 3))
+        self.assertEqual(self.fov.cells, [(2, 3)])
+        self.assertEqual(self.fov.mask.count(1), 1)
+
+    def test_diff_against_previous(self):
+        self.fov.mark_visible(0, 0)
+        self.fov.mark_visible(0, 1)
+
+        self.fov.start(width=10, height=5)
+        self.fov.mark_visible(0, 1)
+        self.fov.mark_visible(4, 9)
+
+        self.assertTrue(self.fov.was_visible(0, 0))
+        self.assertEqual(list(self.fov.newly_visible()), [(4, 9)])
+        self.assertEqual(list(self.fov.newly_hidden()), [(0, 0)])
+
+    def test_buffers_reused(self):
+        for _ in range(3):
+            self.fov.start(width=10, height=5)
+            self.fov.mark_visible(1, 1)
+
+        # Older frames are cleared out rather than left behind.
+        self.assertEqual(self.fov.mask.count(1), 1)
+        self.assertEqual(self.fov.cells, [(1, 1)])
+
+    def test_reveal_on_floor(self):
+        floor = Floor(width=10, height=5)
+        floor.reveal(self.fov.mask)
+        self.assertEqual(floor.explored.count(1), 0)
+
+        self.fov.mark_visible(0, 0)
+        self.fov.mark_visible(4, 9)
+        floor.reveal(self.fov.mask)
+        self.fov.start(width=10, height=5)
+        self.fov.mark_visible(2, 3)
+        floor.reveal(self.fov.mask)
+
+        self.assertEqual(len(floor.explored), 50)
+        self.assertEqual(floor.explored.count(1), 3)
+        for x, y in ((0, 0), (4, 9), (2, 3)):
+            self.assertTrue(floor.is_explored(x, y))
+        self.assertFalse(floor.is_explored(3, 2))